@@ -8,6 +8,7 @@ __version__ = "2.6.2"
 
 from .contents import Content as Content
 from .contents import FileBuffer as FileBuffer
+from .contents import FileContent as FileContent
 from .contents import FormContent as FormContent
 from .contents import FormPart as FormPart
 from .contents import HTMLContent as HTMLContent
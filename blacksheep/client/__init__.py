@@ -1,5 +1,6 @@
 from .session import CircularRedirectError as CircularRedirectError
 from .session import ClientSession as ClientSession
+from .session import ConnectionPoolTimeout as ConnectionPoolTimeout
 from .session import ConnectionTimeout as ConnectionTimeout
 from .session import MaximumRedirectsExceededError as MaximumRedirectsExceededError
 from .session import MissingLocationForRedirect as MissingLocationForRedirect
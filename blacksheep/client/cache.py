@@ -0,0 +1,712 @@
+"""
+This module provides a private HTTP cache for the `ClientSession`, implemented as a
+client middleware that stores responses and serves them according to RFC 9111:
+freshness is determined by `Cache-Control` and `Expires`, stale responses are
+revalidated with `If-None-Match` and `If-Modified-Since`, `Vary` is honored, and
+`stale-while-revalidate` responses are served while they are revalidated in the
+background.
+
+Example:
+
+    from blacksheep.client import ClientSession
+    from blacksheep.client.cache import HTTPCache
+
+    async with ClientSession(middlewares=[HTTPCache()]) as client:
+        ...
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator
+
+from blacksheep import Request, Response, StreamedContent
+from blacksheep.utils.aio import get_running_loop
+
+from .connection import IncomingContent
+
+client_logger = logging.getLogger("blacksheep.client")
+
+# https://www.rfc-editor.org/rfc/rfc9110#section-15.1
+HEURISTICALLY_CACHEABLE_STATUSES = frozenset(
+    {200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501}
+)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+# request headers that make the caller handle caching on its own
+CONDITIONAL_HEADERS = (
+    b"if-none-match",
+    b"if-modified-since",
+    b"if-match",
+    b"if-unmodified-since",
+    b"if-range",
+    b"range",
+)
+
+# headers of 304 responses that must not update stored responses
+# https://www.rfc-editor.org/rfc/rfc9111#section-3.2
+NOT_UPDATED_HEADERS = frozenset(
+    {b"content-length", b"content-encoding", b"transfer-encoding", b"content-range"}
+)
+
+HEURISTIC_FRACTION = 0.1
+MAX_HEURISTIC_LIFETIME = 86400.0
+
+
+def parse_cache_control(values: list[bytes]) -> dict[bytes, bytes | None]:
+    """
+    Parses the values of Cache-Control headers into a dictionary of lowercase
+    directives and their values, or None for directives without value.
+    """
+    directives: dict[bytes, bytes | None] = {}
+    for value in values:
+        for part in value.split(b","):
+            name, _, argument = part.partition(b"=")
+            name = name.strip().lower()
+            if not name:
+                continue
+            directives[name] = argument.strip().strip(b'"') if argument else None
+    return directives
+
+
+def _get_seconds(directives: dict[bytes, bytes | None], name: bytes) -> int | None:
+    value = directives.get(name)
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
+def _parse_http_date(value: bytes | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value.decode("latin-1")).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _get_first_header(headers: list[tuple[bytes, bytes]], name: bytes) -> bytes | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _get_headers(headers: list[tuple[bytes, bytes]], name: bytes) -> list[bytes]:
+    return [value for key, value in headers if key.lower() == name]
+
+
+def _get_vary_names(headers: list[tuple[bytes, bytes]]) -> list[bytes]:
+    return [
+        name.strip().lower()
+        for value in _get_headers(headers, b"vary")
+        for name in value.split(b",")
+        if name.strip()
+    ]
+
+
+def _get_vary_value(request: Request, name: bytes) -> bytes | None:
+    values = request.get_headers(name)
+    return b", ".join(values) if values else None
+
+
+def _get_incoming_content(content_type: bytes, body: bytes) -> IncomingContent:
+    content = IncomingContent(content_type)
+    content.extend_body(body)
+    content.set_complete()
+    return content
+
+
+def _get_resumed_stream(chunks: list[bytes], stream: AsyncIterator[bytes]):
+    async def resumed_stream():
+        for chunk in chunks:
+            yield chunk
+        async for chunk in stream:
+            yield chunk
+
+    return resumed_stream
+
+
+class HTTPCacheEntry:
+    """
+    Describes a response stored in a HTTP cache, with the times when its request was
+    sent and when it was received, and the values of the request headers selected by
+    its Vary header. It contains only simple types, so that it can be serialized by
+    stores that keep responses out of process.
+    """
+
+    __slots__ = ("status", "headers", "body", "request_time", "response_time", "vary")
+
+    def __init__(
+        self,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        request_time: float,
+        response_time: float,
+        vary: list[tuple[bytes, bytes | None]] | None = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.request_time = request_time
+        self.response_time = response_time
+        self.vary = vary or []
+
+    def __repr__(self) -> str:
+        return f"<HTTPCacheEntry {self.status} response_time={self.response_time}>"
+
+    @property
+    def size(self) -> int:
+        """Returns the approximate size of this entry, in bytes."""
+        return len(self.body) + sum(
+            len(key) + len(value) for key, value in self.headers
+        )
+
+    @property
+    def directives(self) -> dict[bytes, bytes | None]:
+        return parse_cache_control(_get_headers(self.headers, b"cache-control"))
+
+    def matches(self, request: Request) -> bool:
+        """
+        Returns a value indicating whether this entry can be used for the given
+        request, comparing the request headers selected by the Vary header.
+        """
+        for name, value in self.vary:
+            if name == b"*" or _get_vary_value(request, name) != value:
+                return False
+        return True
+
+    def get_freshness_lifetime(self) -> float:
+        """
+        Returns the number of seconds for which this entry is fresh, from explicit
+        expiration times or, in their absence, from the Last-Modified header.
+        https://www.rfc-editor.org/rfc/rfc9111#section-4.2.1
+        """
+        directives = self.directives
+        max_age = _get_seconds(directives, b"max-age")
+
+        if max_age is not None:
+            return max_age
+
+        date = _parse_http_date(_get_first_header(self.headers, b"date"))
+        if date is None:
+            date = self.response_time
+
+        expires = _get_first_header(self.headers, b"expires")
+        if expires is not None:
+            expires_time = _parse_http_date(expires)
+            # invalid dates, like "0", represent a time in the past
+            return 0 if expires_time is None else max(0, expires_time - date)
+
+        if b"public" in directives or self.status in HEURISTICALLY_CACHEABLE_STATUSES:
+            last_modified = _parse_http_date(
+                _get_first_header(self.headers, b"last-modified")
+            )
+            if last_modified is not None and last_modified < date:
+                return min(
+                    (date - last_modified) * HEURISTIC_FRACTION,
+                    MAX_HEURISTIC_LIFETIME,
+                )
+        return 0
+
+    def get_age(self, now: float | None = None) -> float:
+        """
+        Returns the current age of this entry, in seconds.
+        https://www.rfc-editor.org/rfc/rfc9111#section-4.2.3
+        """
+        if now is None:
+            now = time.time()
+
+        try:
+            age_value = max(0, int(_get_first_header(self.headers, b"age") or 0))
+        except ValueError:
+            age_value = 0
+
+        date = _parse_http_date(_get_first_header(self.headers, b"date"))
+        apparent_age = max(0, self.response_time - date) if date is not None else 0
+        corrected_age_value = age_value + self.response_time - self.request_time
+        corrected_initial_age = max(apparent_age, corrected_age_value)
+        return corrected_initial_age + now - self.response_time
+
+    def update(
+        self, response: Response, request_time: float, response_time: float
+    ) -> "HTTPCacheEntry":
+        """
+        Returns a new entry, updated with the headers of a 304 Not Modified response
+        received for a conditional request.
+        https://www.rfc-editor.org/rfc/rfc9111#section-4.3.4
+        """
+        updated = {
+            key.lower()
+            for key, _ in response.headers.items()
+            if key.lower() not in NOT_UPDATED_HEADERS
+        }
+        headers = [
+            header for header in self.headers if header[0].lower() not in updated
+        ]
+        headers.extend(
+            header
+            for header in response.headers.items()
+            if header[0].lower() in updated
+        )
+        return HTTPCacheEntry(
+            self.status, headers, self.body, request_time, response_time, self.vary
+        )
+
+    def to_response(self, now: float | None = None) -> Response:
+        """Returns a new response object from this entry."""
+        headers = [header for header in self.headers if header[0].lower() != b"age"]
+        headers.append((b"age", str(int(self.get_age(now))).encode()))
+
+        content = _get_incoming_content(
+            _get_first_header(headers, b"content-type") or b"application/octet-stream",
+            self.body,
+        )
+        return Response(self.status, headers, content)
+
+
+class HTTPCacheStore(ABC):
+    """
+    Base class for the stores of HTTP caches. Implement this class to store
+    responses elsewhere, for example in Redis, to share them among several processes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> HTTPCacheEntry | None:
+        """Returns the entry stored with the given key, if any."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        """Stores an entry with the given key, replacing the existing one, if any."""
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Removes the entry stored with the given key, if any."""
+
+
+class InMemoryHTTPCacheStore(HTTPCacheStore):
+    """
+    Stores entries in memory, in a LRU cache bounded by the total size of entries in
+    bytes, discarding the least recently used entries when it is full. Entries bigger
+    than `max_size` are not stored.
+    """
+
+    def __init__(self, max_size: int = 64 * 1024 * 1024) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be greater than or equal to zero")
+        self._items: OrderedDict[str, HTTPCacheEntry] = OrderedDict()
+        self._size = 0
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    @property
+    def size(self) -> int:
+        """Returns the total size of stored entries, in bytes."""
+        return self._size
+
+    async def get(self, key: str) -> HTTPCacheEntry | None:
+        entry = self._items.get(key)
+        if entry is not None:
+            self._items.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        self._pop(key)
+
+        size = entry.size
+        if size > self.max_size:
+            return
+
+        while self._items and self._size + size > self.max_size:
+            self._pop(next(iter(self._items)))
+
+        self._items[key] = entry
+        self._size += size
+
+    async def remove(self, key: str) -> None:
+        self._pop(key)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+
+def _write_entry(file_path: str, entry: HTTPCacheEntry) -> None:
+    metadata = json.dumps(
+        {
+            "status": entry.status,
+            "headers": [
+                [key.decode("latin-1"), value.decode("latin-1")]
+                for key, value in entry.headers
+            ],
+            "request_time": entry.request_time,
+            "response_time": entry.response_time,
+            "vary": [
+                [
+                    name.decode("latin-1"),
+                    None if value is None else value.decode("latin-1"),
+                ]
+                for name, value in entry.vary
+            ],
+        }
+    ).encode()
+
+    # write to a unique temporary file and replace the existing one, so that
+    # concurrent readers never see partial entries, and concurrent writers of the
+    # same entry do not write the same file
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(struct.pack(">I", len(metadata)))
+            file.write(metadata)
+            file.write(entry.body)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        _remove_entry(temp_path)
+        raise
+
+
+def _read_entry(file_path: str) -> HTTPCacheEntry | None:
+    try:
+        with open(file_path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+
+    try:
+        (metadata_length,) = struct.unpack(">I", data[:4])
+        metadata = json.loads(data[4 : 4 + metadata_length])
+        return HTTPCacheEntry(
+            metadata["status"],
+            [
+                (key.encode("latin-1"), value.encode("latin-1"))
+                for key, value in metadata["headers"]
+            ],
+            data[4 + metadata_length :],
+            metadata["request_time"],
+            metadata["response_time"],
+            [
+                (
+                    name.encode("latin-1"),
+                    None if value is None else value.encode("latin-1"),
+                )
+                for name, value in metadata["vary"]
+            ],
+        )
+    except (struct.error, ValueError, KeyError, TypeError):
+        # corrupted or incompatible entry
+        return None
+
+
+def _remove_entry(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+class FileHTTPCacheStore(HTTPCacheStore):
+    """
+    Stores entries in files, in the given directory, so that they survive restarts
+    and can be shared by several processes. Files are named by the SHA-256 digest of
+    cache keys, and read and written in a thread pool to not block the event loop.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_file_path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode()).hexdigest() + ".cache"
+        )
+
+    async def get(self, key: str) -> HTTPCacheEntry | None:
+        return await get_running_loop().run_in_executor(
+            None, _read_entry, self.get_file_path(key)
+        )
+
+    async def set(self, key: str, entry: HTTPCacheEntry) -> None:
+        await get_running_loop().run_in_executor(
+            None, _write_entry, self.get_file_path(key), entry
+        )
+
+    async def remove(self, key: str) -> None:
+        await get_running_loop().run_in_executor(
+            None, _remove_entry, self.get_file_path(key)
+        )
+
+
+class HTTPCache:
+    """
+    Client middleware implementing a private HTTP cache for GET requests, according
+    to RFC 9111. Fresh responses are served from the store, stale responses are
+    revalidated with conditional requests and served from the store when the server
+    responds with 304 Not Modified. Stale responses with `stale-while-revalidate`
+    are served immediately while they are revalidated in the background. Successful
+    requests with unsafe methods invalidate the responses stored for their URL.
+
+    Requests with conditional or Range headers are not handled by the cache.
+
+    Parameters
+    ----------
+    store: HTTPCacheStore | None
+        The store of responses, by default an `InMemoryHTTPCacheStore`.
+    max_body_size: int
+        The maximum size of the bodies of stored responses, in bytes. Responses
+        declaring a bigger Content-Length are not stored, and the bodies of responses
+        without Content-Length are buffered only up to this size.
+    """
+
+    def __init__(
+        self,
+        store: HTTPCacheStore | None = None,
+        max_body_size: int = 10 * 1024 * 1024,
+    ) -> None:
+        self.store = store if store is not None else InMemoryHTTPCacheStore()
+        self.max_body_size = max_body_size
+        self._revalidations: dict[str, asyncio.Task] = {}
+
+    def get_key(self, request: Request) -> str:
+        return request.url.value.decode("latin-1")
+
+    def can_store(self, request: Request, response: Response) -> bool:
+        """
+        Returns a value indicating whether the given response can be stored.
+        https://www.rfc-editor.org/rfc/rfc9111#section-3
+        """
+        if response.status not in HEURISTICALLY_CACHEABLE_STATUSES:
+            return False
+
+        directives = parse_cache_control(response.get_headers(b"cache-control"))
+
+        if b"no-store" in directives:
+            return False
+
+        if b"*" in _get_vary_names(response.headers.items()):
+            return False
+
+        content_length = response.get_first_header(b"content-length")
+        if content_length is not None:
+            try:
+                if int(content_length) > self.max_body_size:
+                    return False
+            except ValueError:
+                return False
+
+        content_type = response.get_first_header(b"content-type")
+        if content_type is not None and b"text/event-stream" in content_type:
+            return False
+
+        return (
+            b"max-age" in directives
+            or b"public" in directives
+            or response.has_header(b"expires")
+            or response.has_header(b"etag")
+            or response.has_header(b"last-modified")
+        )
+
+    async def store_response(
+        self,
+        key: str,
+        request: Request,
+        response: Response,
+        request_time: float,
+        response_time: float,
+    ) -> None:
+        body = await self._read_body(response)
+
+        if body is None:
+            await self.store.remove(key)
+            return
+
+        headers = list(response.headers.items())
+        vary = [
+            (name, _get_vary_value(request, name)) for name in _get_vary_names(headers)
+        ]
+        entry = HTTPCacheEntry(
+            response.status, headers, body, request_time, response_time, vary
+        )
+
+        if entry.get_freshness_lifetime() > 0 or self._has_validators(entry):
+            await self.store.set(key, entry)
+
+    async def _read_body(self, response: Response) -> bytes | None:
+        """
+        Reads the body of the given response, returning None if it is bigger than
+        `max_body_size`. Bodies of unknown length are read in chunks, and no more
+        than `max_body_size` bytes are buffered: if the limit is crossed, the content
+        of the response is replaced by one streaming the chunks already read and
+        the remaining ones.
+        """
+        content = response.content
+
+        if content is None:
+            return b""
+
+        if response.has_header(b"content-length") or not hasattr(content, "stream"):
+            body = await content.read() or b""
+            return body if len(body) <= self.max_body_size else None
+
+        stream = content.stream()
+        chunks: list[bytes] = []
+        size = 0
+
+        async for chunk in stream:
+            chunks.append(chunk)
+            size += len(chunk)
+
+            if size > self.max_body_size:
+                response.content = StreamedContent(
+                    content.type, _get_resumed_stream(chunks, stream)
+                )
+                return None
+
+        body = b"".join(chunks)
+        response.content = _get_incoming_content(content.type, body)
+        return body
+
+    def _has_validators(self, entry: HTTPCacheEntry) -> bool:
+        return (
+            _get_first_header(entry.headers, b"etag") is not None
+            or _get_first_header(entry.headers, b"last-modified") is not None
+        )
+
+    def _get_conditional_request(
+        self, request: Request, entry: HTTPCacheEntry
+    ) -> Request:
+        etag = _get_first_header(entry.headers, b"etag")
+        if etag is not None:
+            request.add_header(b"if-none-match", etag)
+
+        last_modified = _get_first_header(entry.headers, b"last-modified")
+        if last_modified is not None:
+            request.add_header(b"if-modified-since", last_modified)
+        return request
+
+    async def __call__(self, request: Request, next_handler):
+        if request.method != "GET":
+            response = await next_handler(request)
+            if request.method not in SAFE_METHODS and response.status < 400:
+                await self.store.remove(self.get_key(request))
+            return response
+
+        if any(request.has_header(name) for name in CONDITIONAL_HEADERS):
+            return await next_handler(request)
+
+        request_directives = parse_cache_control(request.get_headers(b"cache-control"))
+
+        if b"no-store" in request_directives:
+            return await next_handler(request)
+
+        key = self.get_key(request)
+        entry = await self.store.get(key)
+
+        if entry is not None and not entry.matches(request):
+            entry = None
+
+        if entry is not None and b"no-cache" not in request_directives:
+            now = time.time()
+            directives = entry.directives
+            age = entry.get_age(now)
+            lifetime = entry.get_freshness_lifetime()
+
+            max_age = _get_seconds(request_directives, b"max-age")
+            if max_age is not None:
+                lifetime = min(lifetime, max_age)
+
+            if b"no-cache" not in directives:
+                if age < lifetime:
+                    return entry.to_response(now)
+
+                stale_while_revalidate = _get_seconds(
+                    directives, b"stale-while-revalidate"
+                )
+                if (
+                    stale_while_revalidate is not None
+                    and b"must-revalidate" not in directives
+                    and age < lifetime + stale_while_revalidate
+                ):
+                    self._revalidate_in_background(key, request, entry, next_handler)
+                    return entry.to_response(now)
+
+        if entry is not None and self._has_validators(entry):
+            return await self._revalidate(key, request, entry, next_handler)
+
+        request_time = time.time()
+        response = await next_handler(request)
+
+        if self.can_store(request, response):
+            await self.store_response(key, request, response, request_time, time.time())
+        return response
+
+    async def _revalidate(
+        self, key: str, request: Request, entry: HTTPCacheEntry, next_handler
+    ) -> Response:
+        request_time = time.time()
+        response = await next_handler(self._get_conditional_request(request, entry))
+        response_time = time.time()
+
+        if response.status == 304:
+            entry = entry.update(response, request_time, response_time)
+            await self.store.set(key, entry)
+            return entry.to_response(response_time)
+
+        if self.can_store(request, response):
+            await self.store_response(
+                key, request, response, request_time, response_time
+            )
+        else:
+            await self.store.remove(key)
+        return response
+
+    def _revalidate_in_background(
+        self, key: str, request: Request, entry: HTTPCacheEntry, next_handler
+    ) -> None:
+        if key in self._revalidations:
+            return
+
+        revalidation_request = Request(
+            "GET", request.url.value, list(request.headers.items())
+        )
+        context = getattr(request, "context", None)
+        if context is not None:
+            revalidation_request.context = context  # type: ignore
+
+        async def revalidate():
+            try:
+                response = await self._revalidate(
+                    key, revalidation_request, entry, next_handler
+                )
+                await response.read()
+            except Exception:
+                client_logger.exception(
+                    "Background revalidation failed for %s", revalidation_request.url
+                )
+            finally:
+                del self._revalidations[key]
+
+        self._revalidations[key] = get_running_loop().create_task(revalidate())
@@ -21,6 +21,13 @@ from h2.events import (
 
 from blacksheep import Content, Request, Response, StreamedContent
 
+from .dns import DNSCache
+
+try:
+    import httptools
+except ImportError:  # pragma: no cover
+    httptools = None
+
 # Compatibility for asyncio.timeout (added in Python 3.11)
 if sys.version_info >= (3, 11):
     from asyncio import timeout as asyncio_timeout
@@ -66,6 +73,33 @@ DEFAULT_HTTP2_BUFFER_SIZE = 16384  # 16KB
 DEFAULT_HTTP11_BUFFER_SIZE = 65535  # 64KB
 
 
+async def open_connection(
+    host: str,
+    port: int,
+    ssl_context: ssl.SSLContext | None = None,
+    resolver: DNSCache | None = None,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Opens a connection to the given host, using the addresses cached by the given
+    resolver, if any, or resolving the host otherwise.
+    """
+    server_hostname = host if ssl_context else None
+
+    if resolver is None:
+        return await asyncio.open_connection(
+            host, port, ssl=ssl_context, server_hostname=server_hostname
+        )
+
+    sock = await resolver.connect(host, port)
+    try:
+        return await asyncio.open_connection(
+            sock=sock, ssl=ssl_context, server_hostname=server_hostname
+        )
+    except BaseException:
+        sock.close()
+        raise
+
+
 class HTTPConnection(ABC):
     """Abstract base class for HTTP connections (HTTP/1.1 and HTTP/2)."""
 
@@ -273,6 +307,7 @@ class HTTP2Connection(HTTPConnection):
         "_reader_task",
         "_cached_scheme",
         "buffer_size",
+        "resolver",
     )
 
     def __init__(
@@ -282,6 +317,7 @@ class HTTP2Connection(HTTPConnection):
         port: int,
         ssl_context: ssl.SSLContext | None = None,
         buffer_size: int = DEFAULT_HTTP2_BUFFER_SIZE,
+        resolver: DNSCache | None = None,
     ) -> None:
         """
         Initialize HTTP/2 connection.
@@ -292,12 +328,14 @@ class HTTP2Connection(HTTPConnection):
             port: Server port
             ssl_context: SSL context for the connection
             buffer_size: Buffer size for reading data (default: 16KB)
+            resolver: Optional cache of DNS resolutions used to connect
         """
         self.pool = weakref.ref(pool)
         self.host = host
         self.port = port
         self.ssl_context = ssl_context or SECURE_HTTP2_SSLCONTEXT
         self.buffer_size = buffer_size
+        self.resolver = resolver
 
         # Create H2 connection
         config = H2Configuration(client_side=True)
@@ -329,8 +367,15 @@ class HTTP2Connection(HTTPConnection):
         """Return True if the connection is open."""
         return self._connected and not self._closing
 
-    async def connect(self) -> None:
-        """Establish SSL/TLS connection and initialize HTTP/2."""
+    async def connect(
+        self,
+        reader: asyncio.StreamReader | None = None,
+        writer: asyncio.StreamWriter | None = None,
+    ) -> None:
+        """
+        Establish SSL/TLS connection and initialize HTTP/2. If a reader and a writer
+        are given, the connection uses them instead of opening a new connection.
+        """
         if self._connected:
             return
 
@@ -339,12 +384,12 @@ class HTTP2Connection(HTTPConnection):
             if self._connected:
                 return
 
-            self.reader, self.writer = await asyncio.open_connection(
-                self.host,
-                self.port,
-                ssl=self.ssl_context,
-                server_hostname=self.host,
-            )
+            if reader is not None and writer is not None:
+                self.reader, self.writer = reader, writer
+            else:
+                self.reader, self.writer = await open_connection(
+                    self.host, self.port, self.ssl_context, self.resolver
+                )
 
             # Verify HTTP/2 negotiation via ALPN
             ssl_object = self.writer.get_extra_info("ssl_object")
@@ -877,6 +922,7 @@ class HTTP11Connection(HTTPConnection):
         "_closing",
         "_streaming",  # True while streaming response body
         "buffer_size",
+        "resolver",
     )
 
     def __init__(
@@ -887,6 +933,7 @@ class HTTP11Connection(HTTPConnection):
         ssl_context: ssl.SSLContext | None = None,
         use_ssl: bool = True,
         buffer_size: int = DEFAULT_HTTP11_BUFFER_SIZE,
+        resolver: DNSCache | None = None,
     ) -> None:
         """
         Initialize HTTP/1.1 connection.
@@ -897,6 +944,7 @@ class HTTP11Connection(HTTPConnection):
             port: Server port
             ssl_context: SSL context for the connection
             use_ssl: Whether to use SSL/TLS
+            resolver: Optional cache of DNS resolutions used to connect
         """
         self.pool = weakref.ref(pool)
         self.host = host
@@ -904,6 +952,7 @@ class HTTP11Connection(HTTPConnection):
         self.use_ssl = use_ssl
         self.ssl_context = ssl_context
         self.buffer_size = buffer_size
+        self.resolver = resolver
 
         # Async streams
         self.reader: asyncio.StreamReader | None = None
@@ -925,8 +974,15 @@ class HTTP11Connection(HTTPConnection):
         """Return True if the connection is open."""
         return self._connected and not self._closing
 
-    async def connect(self) -> None:
-        """Establish connection."""
+    async def connect(
+        self,
+        reader: asyncio.StreamReader | None = None,
+        writer: asyncio.StreamWriter | None = None,
+    ) -> None:
+        """
+        Establish connection. If a reader and a writer are given, the connection uses
+        them instead of opening a new connection.
+        """
         if self._connected:
             return
 
@@ -934,20 +990,49 @@ class HTTP11Connection(HTTPConnection):
             if self._connected:
                 return
 
-            self.reader, self.writer = await asyncio.open_connection(
-                self.host,
-                self.port,
-                ssl=self.ssl_context if self.use_ssl else None,
-                server_hostname=self.host if self.use_ssl else None,
-            )
+            if reader is not None and writer is not None:
+                self.reader, self.writer = reader, writer
+            else:
+                self.reader, self.writer = await open_connection(
+                    self.host,
+                    self.port,
+                    self.ssl_context if self.use_ssl else None,
+                    self.resolver,
+                )
 
-            self._h11_conn = h11.Connection(our_role=h11.CLIENT)
+            self._init_parser()
             self._connected = True
 
+    def _init_parser(self) -> None:
+        self._h11_conn = h11.Connection(our_role=h11.CLIENT)
+
     def _convert_request_to_h11(
         self, request: Request
     ) -> tuple[h11.Request, bytes | None]:
         """Convert a BlackSheep Request to h11 request."""
+        path, headers, body = self._get_request_head(request)
+
+        # Create h11 Request
+        method = (
+            request.method.encode()
+            if isinstance(request.method, str)
+            else request.method
+        )
+        h11_request = h11.Request(
+            method=method,
+            target=path,
+            headers=headers,
+        )
+
+        return h11_request, body
+
+    def _get_request_head(
+        self, request: Request
+    ) -> tuple[bytes, list[tuple[bytes, bytes]], bytes | None]:
+        """
+        Returns the request target, the headers and the body, if available, of a
+        BlackSheep Request.
+        """
         # Build request target (path + query)
         path = request.url.path or b"/"
         if request.url.query:
@@ -980,12 +1065,10 @@ class HTTP11Connection(HTTPConnection):
 
         # Get body and handle headers
         body: bytes | None = None
-        use_chunked = False
         if request.content:
             # Check if we should use chunked encoding (unknown length)
             if request.content.length < 0:
                 # Streaming content with unknown length - use chunked encoding
-                use_chunked = True
                 # Add transfer-encoding header if not present
                 has_transfer_encoding = any(
                     h[0].lower() == b"transfer-encoding" for h in headers
@@ -1012,19 +1095,7 @@ class HTTP11Connection(HTTPConnection):
                         (b"content-length", str(request.content.length).encode())
                     )
 
-        # Create h11 Request
-        method = (
-            request.method.encode()
-            if isinstance(request.method, str)
-            else request.method
-        )
-        h11_request = h11.Request(
-            method=method,
-            target=path,
-            headers=headers,
-        )
-
-        return h11_request, body
+        return path, headers, body
 
     async def send(self, request: Request) -> Response:
         """
@@ -1036,6 +1107,14 @@ class HTTP11Connection(HTTPConnection):
         Returns:
             Response object
         """
+        try:
+            return await self._send(request)
+        except BaseException:
+            # the state of the connection is unknown: it cannot be reused
+            self._abandon()
+            raise
+
+    async def _send(self, request: Request) -> Response:
         if not self._connected:
             await self.connect()
 
@@ -1338,7 +1417,7 @@ class HTTP11Connection(HTTPConnection):
         )
 
         if should_close or not h11_reusable:
-            self._closing = True
+            self._abandon()
         else:
             # Return connection to pool
             self._try_return_to_pool()
@@ -1350,8 +1429,26 @@ class HTTP11Connection(HTTPConnection):
             self.last_used = time.time()
             pool.try_return_connection(self)
 
+    def _release_from_pool(self) -> None:
+        """Release the slot of this connection in its pool."""
+        pool = self.pool()
+        if pool:
+            pool.release_connection(self)
+
+    def _abandon(self) -> None:
+        """
+        Close a connection that cannot be reused, without waiting for the transport
+        to be closed.
+        """
+        self._closing = True
+        self._connected = False
+        if self.writer:
+            self.writer.close()
+        self._release_from_pool()
+
     async def close(self) -> None:
         """Close the connection."""
+        self._release_from_pool()
         if self._connected and not self._closing:
             self._closing = True
             try:
@@ -1389,3 +1486,300 @@ class HTTP11Connection(HTTPConnection):
         pool = self.pool()
         idle_timeout = pool.idle_timeout if pool else 300.0
         return (time.time() - self.last_used) < idle_timeout
+
+
+class HTTPToolsResponseParser:
+    """
+    Receives the callbacks of `httptools.HttpResponseParser` for a single response:
+    the response is created when its headers are complete, and the chunks of its
+    body are fed to its `IncomingContent` as they are parsed.
+    """
+
+    __slots__ = (
+        "parser",
+        "skip_body",
+        "headers",
+        "response",
+        "informational_status",
+        "headers_complete",
+        "message_complete",
+        "until_eof",
+        "keep_alive",
+    )
+
+    def __init__(self, skip_body: bool = False) -> None:
+        self.parser = httptools.HttpResponseParser(self)
+        self.skip_body = skip_body
+        self.headers: list[tuple[bytes, bytes]] = []
+        self.response: Response | None = None
+        self.informational_status = 0
+        self.headers_complete = False
+        self.message_complete = False
+        self.until_eof = False
+        self.keep_alive = False
+
+    @property
+    def content(self) -> IncomingContent:
+        return self.response.content  # type: ignore
+
+    def feed_data(self, data: bytes) -> None:
+        try:
+            self.parser.feed_data(data)
+        except httptools.HttpParserError as parser_error:
+            raise InvalidResponseFromServer(parser_error)
+
+    def get_status_code(self) -> int:
+        return self.parser.get_status_code()
+
+    def on_message_begin(self) -> None:
+        self.headers = []
+
+    def on_header(self, name: bytes, value: bytes) -> None:
+        self.headers.append((name, value))
+
+    def on_headers_complete(self) -> None:
+        status = self.parser.get_status_code()
+
+        if status < 200:
+            # 1xx informational responses precede the final response
+            self.informational_status = status
+            return
+
+        response = Response(status, self.headers, None)
+        response.content = IncomingContent(
+            response.get_first_header(b"content-type") or b"application/octet-stream"
+        )
+        self.response = response
+        self.headers_complete = True
+
+        if self.skip_body:
+            # responses to HEAD requests declare the length of a body not sent
+            self._complete()
+            return
+
+        self.until_eof = (
+            status not in (204, 304)
+            and not response.has_header(b"content-length")
+            and not response.has_header(b"transfer-encoding")
+        )
+
+    def on_body(self, body: bytes) -> None:
+        if self.response is not None and not self.message_complete:
+            self.content.extend_body(body)
+
+    def on_message_complete(self) -> None:
+        if self.response is not None and not self.message_complete:
+            self._complete()
+
+    def _complete(self) -> None:
+        self.message_complete = True
+        self.keep_alive = self.parser.should_keep_alive() and not self.until_eof
+        self.content.set_complete()
+
+    def eof(self) -> None:
+        """Handles the end of the stream before the end of the message."""
+        if self.message_complete:
+            return
+        self.message_complete = True
+        self.keep_alive = False
+        if not self.until_eof:
+            self.content.exc = ConnectionClosedError(False)
+        self.content.set_complete()
+
+
+class HTTPToolsConnection(HTTP11Connection):
+    """
+    HTTP/1.1 connection implementation parsing responses with `httptools`, a
+    binding of llhttp, rather than with the h11 state machine. It is used by
+    default when `httptools` is installed.
+    """
+
+    __slots__ = ("_reusable",)
+
+    def _init_parser(self) -> None:
+        self._reusable = True
+
+    def _serialize_request_head(
+        self, request: Request, path: bytes, headers: list[tuple[bytes, bytes]]
+    ) -> bytes:
+        method = (
+            request.method.encode()
+            if isinstance(request.method, str)
+            else request.method
+        )
+        parts = [method, b" ", path, b" HTTP/1.1\r\n"]
+        for name, value in headers:
+            if b"\n" in value or b"\r" in value or b"\n" in name or b"\r" in name:
+                raise ValueError(f"Invalid characters in header {name!r}")
+            parts.append(name)
+            parts.append(b": ")
+            parts.append(value)
+            parts.append(b"\r\n")
+        parts.append(b"\r\n")
+        return b"".join(parts)
+
+    async def _send(self, request: Request) -> Response:
+        if not self._connected:
+            await self.connect()
+
+        async with self._lock:
+            # Only StreamedContent can be streamed
+            use_streaming = (
+                request.content
+                and isinstance(request.content, StreamedContent)
+                and (request.content.length < 0 or request.content.body is None)
+            )
+
+            # For non-streaming content with no body, read it first
+            if request.content and request.content.body is None and not use_streaming:
+                body_data = await request.content.read()
+                request.content = Content(request.content.type, body_data)
+
+            path, headers, body = self._get_request_head(request)
+            chunked = use_streaming and request.content.length < 0
+            parser = HTTPToolsResponseParser(skip_body=request.method == "HEAD")
+
+            self.writer.write(self._serialize_request_head(request, path, headers))
+
+            expect_continue = any(
+                h[0].lower() == b"expect" and h[1].lower() == b"100-continue"
+                for h in headers
+            )
+
+            if expect_continue and (body or use_streaming):
+                await self.writer.drain()
+                interim_response = await self._wait_for_100_continue(parser)
+                if interim_response is not None:
+                    # Got a final response (e.g., 417 Expectation Failed)
+                    return interim_response
+
+            if use_streaming:
+                async for chunk in request.content.get_parts():
+                    if chunk:
+                        if chunked:
+                            self.writer.write(b"%x\r\n" % len(chunk))
+                            self.writer.write(chunk)
+                            self.writer.write(b"\r\n")
+                        else:
+                            self.writer.write(chunk)
+                        await self.writer.drain()
+                if chunked:
+                    self.writer.write(b"0\r\n\r\n")
+            elif body:
+                self.writer.write(body)
+
+            await self.writer.drain()
+
+            self.request_count += 1
+            self.last_used = time.time()
+
+            return await self._receive_response(parser)
+
+    async def _wait_for_100_continue(  # type: ignore[override]
+        self, parser: HTTPToolsResponseParser, timeout: float = 5.0
+    ) -> Response | None:
+        """
+        Wait for 100 Continue response or a final response.
+
+        Returns:
+            None if 100 Continue received (proceed with body)
+            Response if got final response like 417 (don't send body)
+        """
+        try:
+            async with asyncio_timeout(timeout):
+                while parser.informational_status != 100:
+                    data = await self.reader.read(self.buffer_size)
+                    if not data:
+                        # Connection closed, return None to proceed anyway
+                        return None
+                    parser.feed_data(data)
+
+                    if parser.headers_complete:
+                        return self._handle_response(parser)
+        except asyncio.TimeoutError:
+            # Timeout waiting for 100, proceed with body anyway
+            return None
+        return None
+
+    async def _receive_response(  # type: ignore[override]
+        self, parser: HTTPToolsResponseParser, timeout: float = 60.0
+    ) -> Response:
+        """
+        Receive and parse HTTP/1.1 response with true streaming support.
+
+        Returns response immediately after headers are received.
+        Body data is streamed progressively via IncomingContent.
+        """
+        if parser.headers_complete:
+            # the response was received while waiting for 100 Continue
+            return parser.response  # type: ignore
+
+        try:
+            async with asyncio_timeout(timeout):
+                while not parser.headers_complete:
+                    data = await self.reader.read(self.buffer_size)
+                    if not data:
+                        raise ConnectionClosedError(True)
+                    parser.feed_data(data)
+        except asyncio.TimeoutError:
+            raise ConnectionException(f"Headers timeout after {timeout}s")
+
+        return self._handle_response(parser)
+
+    def _handle_response(self, parser: HTTPToolsResponseParser) -> Response:
+        response = parser.response
+        assert response is not None
+
+        if parser.message_complete:
+            self._reusable = parser.keep_alive
+            self._handle_connection_reuse(response)
+        else:
+            self._streaming = True
+            asyncio.create_task(self._read_body(parser))
+        return response
+
+    async def _read_body(self, parser: HTTPToolsResponseParser) -> None:
+        """Read body data and stream it to the IncomingContent of the response."""
+        try:
+            while not parser.message_complete:
+                data = await self.reader.read(self.buffer_size)
+                if not data:
+                    parser.eof()
+                    break
+                parser.feed_data(data)
+        except Exception as e:
+            parser.keep_alive = False
+            parser.content.exc = e
+            parser.content.set_complete()
+        finally:
+            self._streaming = False
+            self.last_used = time.time()
+            self._reusable = parser.keep_alive
+            self._handle_connection_reuse(parser.response)  # type: ignore
+
+    def _handle_connection_reuse(self, response: Response) -> None:
+        """Handle connection reuse according to the parsed response."""
+        # Don't return to pool while still streaming
+        if self._streaming:
+            return
+
+        if self._reusable:
+            self._try_return_to_pool()
+        else:
+            self._abandon()
+
+    def is_alive(self) -> bool:
+        """Check if connection is still alive."""
+        if not self._connected or self._closing or self._streaming:
+            return False
+        if not self._reusable:
+            return False
+        # Check idle timeout from pool
+        pool = self.pool()
+        idle_timeout = pool.idle_timeout if pool else 300.0
+        return (time.time() - self.last_used) < idle_timeout
+
+
+DEFAULT_HTTP11_CONNECTION_TYPE: type[HTTP11Connection] = (
+    HTTPToolsConnection if httptools is not None else HTTP11Connection
+)
@@ -0,0 +1,245 @@
+"""
+This module provides a cache of DNS resolutions for the HTTP client, and opens
+sockets racing the resolved addresses, alternating IPv6 and IPv4 addresses as
+described by Happy Eyeballs (RFC 8305).
+"""
+
+import asyncio
+import logging
+import socket
+import time
+
+from blacksheep.utils.aio import get_running_loop
+from blacksheep.utils.lru import LRUCache
+
+logger = logging.getLogger("blacksheep.client")
+
+Address = tuple[int, int, tuple]  # family, protocol, socket address
+
+
+class _Resolution:
+    __slots__ = ("addresses", "expires_at", "counter")
+
+    def __init__(self, addresses: list[Address], expires_at: float) -> None:
+        self.addresses = addresses
+        self.expires_at = expires_at
+        self.counter = 0
+
+
+def interleave_addresses(addresses: list[Address]) -> list[Address]:
+    """
+    Returns the given addresses alternating their families, starting with the
+    family of the first address.
+    https://www.rfc-editor.org/rfc/rfc8305#section-4
+    """
+    by_family: dict[int, list[Address]] = {}
+    for address in addresses:
+        by_family.setdefault(address[0], []).append(address)
+
+    if len(by_family) < 2:
+        return list(addresses)
+
+    groups = list(by_family.values())
+    result: list[Address] = []
+    for index in range(max(len(group) for group in groups)):
+        for group in groups:
+            if index < len(group):
+                result.append(group[index])
+    return result
+
+
+def _rotate(addresses: list[Address], offset: int) -> list[Address]:
+    """Rotates the addresses of each family by the given offset."""
+    by_family: dict[int, list[Address]] = {}
+    for address in addresses:
+        by_family.setdefault(address[0], []).append(address)
+
+    rotated = {
+        family: group[offset % len(group) :] + group[: offset % len(group)]
+        for family, group in by_family.items()
+    }
+    return [rotated[address[0]].pop(0) for address in addresses]
+
+
+async def _connect_socket(address: Address) -> socket.socket:
+    family, protocol, sockaddr = address
+    sock = socket.socket(family, socket.SOCK_STREAM, protocol)
+    try:
+        sock.setblocking(False)
+        await get_running_loop().sock_connect(sock, sockaddr)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _close_socket_of_task(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is None:
+        task.result().close()
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # avoids warnings about exceptions never retrieved, when no caller is waiting
+    if not task.cancelled():
+        task.exception()
+
+
+async def connect_happy_eyeballs(
+    addresses: list[Address], delay: float = 0.25
+) -> socket.socket:
+    """
+    Connects to the first address that accepts a connection. Each attempt starts
+    when the previous one fails, or after `delay` seconds, so that unreachable
+    addresses do not delay connections.
+    """
+    if not addresses:
+        raise OSError("No addresses to connect to.")
+
+    loop = get_running_loop()
+    pending: set[asyncio.Task] = set()
+    errors: list[BaseException] = []
+
+    def collect(done: set[asyncio.Task]) -> socket.socket | None:
+        result = None
+        for task in done:
+            pending.discard(task)
+            if task.exception() is not None:
+                errors.append(task.exception())  # type: ignore
+            elif result is None:
+                result = task.result()
+            else:
+                task.result().close()
+        return result
+
+    try:
+        for address in addresses:
+            pending.add(loop.create_task(_connect_socket(address)))
+
+            # the next attempt starts after the delay, or as soon as an attempt fails
+            done, _ = await asyncio.wait(
+                pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+            )
+            winner = collect(done)
+            if winner is not None:
+                return winner
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = collect(done)
+            if winner is not None:
+                return winner
+    finally:
+        for task in pending:
+            task.cancel()
+            task.add_done_callback(_close_socket_of_task)
+
+    if len(errors) == 1:
+        raise errors[0]
+    raise OSError("Multiple exceptions: " + ", ".join(str(error) for error in errors))
+
+
+class DNSCache:
+    """
+    Caches the addresses resolved for hosts for `ttl` seconds, so that new
+    connections do not wait for DNS lookups. Concurrent lookups for the same host
+    share a single resolution, and each resolution returns the addresses rotated by
+    one position, so that connections are distributed among all the addresses of a
+    host. A single instance can be shared by several `ConnectionPools`.
+
+    Parameters
+    ----------
+    ttl: float
+        The number of seconds for which resolved addresses are reused.
+    max_entries: int
+        The maximum number of hosts kept in the cache.
+    happy_eyeballs_delay: float
+        The number of seconds to wait for a connection attempt before trying the next
+        address, in parallel.
+    family: int
+        The address family to resolve, by default both IPv4 and IPv6.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 1000,
+        happy_eyeballs_delay: float = 0.25,
+        family: int = socket.AF_UNSPEC,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError("ttl must be greater than or equal to zero")
+        self.ttl = ttl
+        self.happy_eyeballs_delay = happy_eyeballs_delay
+        self.family = family
+        self._cache: LRUCache[tuple[str, int], _Resolution] = LRUCache(max_entries)
+        self._pending: dict[tuple[str, int], asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Removes the addresses cached for the given host and port."""
+        self._cache.pop((host, port))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    async def lookup(self, host: str, port: int) -> list[Address]:
+        """Resolves the addresses of the given host, without using the cache."""
+        infos = await get_running_loop().getaddrinfo(
+            host, port, family=self.family, type=socket.SOCK_STREAM
+        )
+        addresses: list[Address] = []
+        for family, _, protocol, _, sockaddr in infos:
+            address = (family, protocol, sockaddr)
+            if address not in addresses:
+                addresses.append(address)
+        return addresses
+
+    async def resolve(self, host: str, port: int) -> list[Address]:
+        """
+        Returns the addresses of the given host, in the order in which they should be
+        tried.
+        """
+        key = (host, port)
+        resolution = self._cache.get(key)
+
+        if resolution is None or resolution.expires_at <= time.monotonic():
+            task = self._pending.get(key)
+
+            if task is None:
+                # NB: the lookup runs in its own task, so that callers cancelled
+                # while waiting for it do not cancel it for the other callers
+                task = get_running_loop().create_task(self._resolve(key))
+                task.add_done_callback(_retrieve_exception)
+                self._pending[key] = task
+
+            resolution = await asyncio.shield(task)
+
+        offset = resolution.counter
+        resolution.counter += 1
+        return interleave_addresses(_rotate(resolution.addresses, offset))
+
+    async def _resolve(self, key: tuple[str, int]) -> _Resolution:
+        try:
+            addresses = await self.lookup(*key)
+        finally:
+            del self._pending[key]
+
+        resolution = _Resolution(addresses, time.monotonic() + self.ttl)
+        if self.ttl > 0:
+            self._cache.set(key, resolution)
+        return resolution
+
+    async def connect(self, host: str, port: int) -> socket.socket:
+        """
+        Returns a socket connected to the given host, racing its addresses. When no
+        address accepts connections, the cached addresses are discarded.
+        """
+        addresses = await self.resolve(host, port)
+        try:
+            return await connect_happy_eyeballs(addresses, self.happy_eyeballs_delay)
+        except OSError:
+            logger.debug(f"Cannot connect to any address of {host}:{port}")
+            self.invalidate(host, port)
+            raise
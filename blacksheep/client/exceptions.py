@@ -28,6 +28,14 @@ class ConnectionTimeout(TimeoutError):
         )
 
 
+class ConnectionPoolTimeout(TimeoutError):
+    def __init__(self, host: str, port: int, timeout: float):
+        super().__init__(
+            f"Timed out waiting for a connection from the pool, to {host}:{port}. "
+            f"Current timeout setting: {timeout}."
+        )
+
+
 class RequestTimeout(TimeoutError):
     def __init__(self, url: URL, timeout: float):
         super().__init__(
@@ -1,14 +1,16 @@
 import asyncio
 import logging
 import ssl
-from asyncio import Queue, QueueEmpty, QueueFull
+import time
 from collections import deque
+from dataclasses import dataclass
 from ssl import SSLContext
 from typing import Literal
 
 from blacksheep.exceptions import InvalidArgument
 
 from .connection import (
+    DEFAULT_HTTP11_CONNECTION_TYPE,
     INSECURE_HTTP2_SSLCONTEXT,
     INSECURE_SSLCONTEXT,
     SECURE_HTTP2_SSLCONTEXT,
@@ -16,7 +18,10 @@ from .connection import (
     HTTP2Connection,
     HTTP11Connection,
     HTTPConnection,
+    open_connection,
 )
+from .dns import DNSCache
+from .exceptions import ConnectionPoolTimeout
 
 logger = logging.getLogger("blacksheep.client")
 
@@ -67,7 +72,112 @@ def get_http2_ssl_context(
     )
 
 
+class ConnectionsLimit:
+    """
+    Limits the number of connections in use, making callers wait in a FIFO queue
+    when the limit is reached. It can be shared by several connection pools, to
+    apply a global limit.
+
+    Parameters
+    ----------
+    max_connections: int
+        The maximum number of connections in use, or 0 for no limit.
+    """
+
+    __slots__ = ("max_connections", "in_use", "_waiters")
+
+    def __init__(self, max_connections: int = 0) -> None:
+        if max_connections < 0:
+            raise ValueError("max_connections must be greater than or equal to zero")
+        self.max_connections = max_connections
+        self.in_use = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def waiters(self) -> int:
+        """Returns the number of callers waiting for a connection."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def try_acquire(self) -> bool:
+        if self.max_connections and self.in_use >= self.max_connections:
+            return False
+        self.in_use += 1
+        return True
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.try_acquire():
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed to this caller, which is not using it
+                self.release()
+            raise
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # the slot is handed to the first waiter
+                waiter.set_result(None)
+                return
+        self.in_use -= 1
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """Describes the state of a connection pool."""
+
+    in_use: int
+    idle: int
+    waiters: int
+    created: int
+    creations_per_second: float
+
+
 class ConnectionPool:
+    """
+    Keeps the connections to an origin, reusing idle HTTP/1.1 connections and
+    multiplexing requests on HTTP/2 connections.
+
+    The number of HTTP/1.1 connections in use is bounded by `max_connections` and by
+    an optional `ConnectionsLimit` shared by several pools: when a limit is reached,
+    callers wait until a connection is released, for at most `acquire_timeout`
+    seconds. Idle connections are closed by a background task after `idle_timeout`
+    seconds.
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum number of idle connections kept, or 0 for no limit.
+    max_connections: int
+        The maximum number of HTTP/1.1 connections in use, or 0 for no limit.
+    acquire_timeout: float | None
+        The maximum number of seconds to wait for a connection when a limit is
+        reached, or None to wait indefinitely.
+    limit: ConnectionsLimit | None
+        An optional limit shared by several pools.
+    resolver: DNSCache | None
+        An optional cache of DNS resolutions, used to open connections racing the
+        addresses of the host. If not specified, the host is resolved for each new
+        connection.
+    http11_connection_type: type[HTTP11Connection] | None
+        The class of HTTP/1.1 connections. By default, `HTTPToolsConnection` when
+        `httptools` is installed, otherwise `HTTP11Connection`, which uses `h11`.
+    """
+
+    CREATIONS_WINDOW = 10.0
+
     def __init__(
         self,
         scheme: bytes,
@@ -77,6 +187,11 @@ class ConnectionPool:
         max_size: int = 0,
         http2: bool = True,
         idle_timeout: float = 300.0,
+        max_connections: int = 0,
+        acquire_timeout: float | None = None,
+        limit: ConnectionsLimit | None = None,
+        resolver: DNSCache | None = None,
+        http11_connection_type: type[HTTP11Connection] | None = None,
     ) -> None:
         self.scheme = scheme
         self.host = host if isinstance(host, str) else host.decode()
@@ -86,15 +201,45 @@ class ConnectionPool:
         self.max_size = max_size
         self.http2_enabled = http2 and scheme == b"https"
         self.idle_timeout = idle_timeout
-        self._idle_connections: Queue[HTTPConnection] = Queue(maxsize=max_size)
+        self.acquire_timeout = acquire_timeout
+        self.resolver = resolver
+        self.http11_connection_type = (
+            http11_connection_type or DEFAULT_HTTP11_CONNECTION_TYPE
+        )
+        self._limit = ConnectionsLimit(max_connections)
+        self._global_limit = limit
+        self._idle_connections: deque[HTTPConnection] = deque()
+        self._in_use: set[HTTPConnection] = set()
+        self._creations: deque[float] = deque()
+        self._created = 0
+        self._reaper: asyncio.Task | None = None
         self._http2_connections: deque[HTTP2Connection] = deque()
         self._detected_protocol: Literal["h2", "http/1.1"] | None = None
         self._protocol_detection_lock = asyncio.Lock()
         self.disposed = False
 
+    @property
+    def max_connections(self) -> int:
+        return self._limit.max_connections
+
+    @property
+    def metrics(self) -> ConnectionPoolMetrics:
+        """Returns the current metrics of this pool."""
+        self._prune_creations(time.monotonic())
+        return ConnectionPoolMetrics(
+            in_use=len(self._in_use),
+            idle=len(self._idle_connections),
+            waiters=self._limit.waiters
+            + (self._global_limit.waiters if self._global_limit else 0),
+            created=self._created,
+            creations_per_second=len(self._creations) / self.CREATIONS_WINDOW,
+        )
+
     async def _detect_protocol(self) -> Literal["h2", "http/1.1"]:
         """
-        Detect which protocol the server supports via ALPN negotiation.
+        Detect which protocol the server supports via ALPN negotiation. The
+        connection opened to detect the protocol is kept as the first connection of
+        the pool.
 
         Returns:
             'h2' for HTTP/2, 'http/1.1' for HTTP/1.1
@@ -112,44 +257,76 @@ class ConnectionPool:
                 return self._detected_protocol
 
             try:
-                reader, writer = await asyncio.open_connection(
-                    self.host,
-                    self.port,
-                    ssl=self.http2_ssl,
-                    server_hostname=self.host,
+                reader, writer = await open_connection(
+                    self.host, self.port, self.http2_ssl, self.resolver
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Protocol detection failed for {self.host}:{self.port}: {e}"
                 )
+                self._detected_protocol = "http/1.1"
+                return "http/1.1"
+
+            ssl_object = writer.get_extra_info("ssl_object")
+            protocol = (
+                ssl_object.selected_alpn_protocol() if ssl_object else None
+            ) or "http/1.1"
 
-                ssl_object = writer.get_extra_info("ssl_object")
-                protocol = ssl_object.selected_alpn_protocol() or "http/1.1"
+            self._detected_protocol = protocol
+            logger.debug(f"Detected protocol {protocol} for {self.host}:{self.port}")
 
-                # Store the detected protocol BEFORE closing (close can raise SSL errors)
-                self._detected_protocol = protocol
+            try:
+                await self._keep_detection_connection(protocol, reader, writer)
+            except Exception as e:
                 logger.debug(
-                    f"Detected protocol {protocol} for {self.host}:{self.port}"
+                    f"Cannot reuse the connection used to detect the protocol "
+                    f"for {self.host}:{self.port}: {e}"
                 )
-
-                # Close the detection connection - ignore SSL errors during close
                 try:
                     writer.close()
-                    await writer.wait_closed()
                 except Exception:
                     pass  # Ignore errors during close (e.g., SSL close notify issues)
 
-                return protocol
+            return protocol
 
-            except Exception as e:
-                logger.debug(
-                    f"Protocol detection failed for {self.host}:{self.port}: {e}"
-                )
-                self._detected_protocol = "http/1.1"
-                return "http/1.1"
+    async def _keep_detection_connection(
+        self,
+        protocol: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        if protocol == "h2":
+            http2_connection = HTTP2Connection(
+                pool=self,
+                host=self.host,
+                port=self.port,
+                ssl_context=self.http2_ssl,
+                resolver=self.resolver,
+            )
+            await http2_connection.connect(reader, writer)
+            self._http2_connections.append(http2_connection)
+            return
+
+        # the ALPN context negotiated HTTP/1.1: the connection is kept idle, to be
+        # used by the first request
+        connection = self.http11_connection_type(
+            pool=self,
+            host=self.host,
+            port=self.port,
+            ssl_context=self.http2_ssl,
+            use_ssl=True,
+            resolver=self.resolver,
+        )
+        await connection.connect(reader, writer)
+        self._track_creation()
+        self._idle_connections.append(connection)
+        self._ensure_reaper()
 
-    def _get_connection(self) -> HTTPConnection:
-        # if there are no connections, let QueueEmpty exception happen
-        # if all connections are closed, remove all of them and let
-        # QueueEmpty exception happen
-        while True:
-            connection: HTTPConnection = self._idle_connections.get_nowait()
+    def _get_connection(self) -> HTTPConnection | None:
+        # the most recently used connections are reused first, so that the others
+        # become idle and are closed by the reaper when they are not needed
+        while self._idle_connections:
+            connection = self._idle_connections.pop()
 
             if connection.is_open:
                 logger.debug(
@@ -157,6 +334,7 @@ class ConnectionPool:
                     f"{id(connection)} to: {self.host}:{self.port}"
                 )
                 return connection
+        return None
 
     def _get_http2_connection(self) -> HTTP2Connection | None:
         """Get an available HTTP/2 connection for multiplexing."""
@@ -177,6 +355,7 @@ class ConnectionPool:
 
     def try_return_connection(self, connection: HTTPConnection) -> None:
         if self.disposed:
+            self.release_connection(connection)
             return
 
         # HTTP/2 connections are kept in a separate list for multiplexing
@@ -185,41 +364,130 @@ class ConnectionPool:
                 self._http2_connections.append(connection)
             return
 
+        if connection.is_open and (
+            not self.max_size or len(self._idle_connections) < self.max_size
+        ):
+            self._idle_connections.append(connection)
+            self._ensure_reaper()
+        else:
+            asyncio.ensure_future(connection.close())
+
+        self.release_connection(connection)
+
+    def release_connection(self, connection: HTTPConnection) -> None:
+        """
+        Releases the slot of a connection in use, when it is returned to the pool
+        or when it is closed.
+        """
+        if connection in self._in_use:
+            self._in_use.discard(connection)
+            self._limit.release()
+            if self._global_limit is not None:
+                self._global_limit.release()
+
+    async def _acquire(self) -> None:
+        await self._limit.acquire()
+
+        if self._global_limit is not None:
+            try:
+                await self._global_limit.acquire()
+            except BaseException:
+                self._limit.release()
+                raise
+
+    async def _acquire_connection(
+        self, connection_timeout: float | None = None
+    ) -> HTTPConnection:
         try:
-            self._idle_connections.put_nowait(connection)
-        except QueueFull:
-            pass
-
-    async def get_connection(self) -> HTTPConnection:
-        # First, check protocol if HTTP/2 is enabled
-        if self.http2_enabled:
-            # Fast path: check cached protocol without async call
-            if self._detected_protocol == "h2":
-                # Try to get existing HTTP/2 connection (multiplexing)
-                h2_conn = self._get_http2_connection()
-                if h2_conn is not None:
-                    return h2_conn
-                # Create new HTTP/2 connection
-                return await self._create_http2_connection()
-            elif self._detected_protocol == "http/1.1":
-                # Already detected as HTTP/1.1, skip to fallback
-                pass
+            if self.acquire_timeout is None:
+                await self._acquire()
             else:
-                # First request - need to detect protocol
-                protocol = await self._detect_protocol()
-                if protocol == "h2":
-                    # Try to get existing HTTP/2 connection (multiplexing)
-                    h2_conn = self._get_http2_connection()
-                    if h2_conn is not None:
-                        return h2_conn
-                    # Create new HTTP/2 connection
-                    return await self._create_http2_connection()
+                await asyncio.wait_for(self._acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionPoolTimeout(self.host, self.port, self.acquire_timeout)
 
-        # Fall back to HTTP/1.1
         try:
-            return self._get_connection()
-        except QueueEmpty:
-            return await self.create_connection()
+            connection = self._get_connection() or await asyncio.wait_for(
+                self.create_connection(), connection_timeout
+            )
+        except BaseException:
+            self._limit.release()
+            if self._global_limit is not None:
+                self._global_limit.release()
+            raise
+
+        self._in_use.add(connection)
+        return connection
+
+    def _track_creation(self) -> None:
+        self._created += 1
+        now = time.monotonic()
+        self._creations.append(now)
+        self._prune_creations(now)
+
+    def _prune_creations(self, now: float) -> None:
+        while self._creations and now - self._creations[0] > self.CREATIONS_WINDOW:
+            self._creations.popleft()
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.get_running_loop().create_task(
+                self._close_idle_connections()
+            )
+
+    async def _close_idle_connections(self) -> None:
+        try:
+            while self._idle_connections and not self.disposed:
+                await asyncio.sleep(self.idle_timeout / 2)
+
+                now = time.time()
+                for connection in list(self._idle_connections):
+                    if (
+                        not connection.is_open
+                        or now - connection.last_used >= self.idle_timeout
+                    ):
+                        self._idle_connections.remove(connection)
+                        logger.debug(
+                            f"Closing idle connection "
+                            f"{id(connection)} to: {self.host}:{self.port}"
+                        )
+                        await connection.close()
+        finally:
+            if self._reaper is asyncio.current_task():
+                self._reaper = None
+
+    async def get_connection(
+        self, connection_timeout: float | None = None
+    ) -> HTTPConnection:
+        """
+        Returns a connection to the origin of this pool. Waiting for a connection
+        when a limit is reached is bounded by `acquire_timeout`, raising
+        `ConnectionPoolTimeout`, while opening a new connection is bounded by the
+        given `connection_timeout`, raising `TimeoutError`.
+        """
+        if self.http2_enabled and self._detected_protocol != "http/1.1":
+            h2_conn = await asyncio.wait_for(
+                self._get_or_create_http2_connection(), connection_timeout
+            )
+            if h2_conn is not None:
+                return h2_conn
+
+        # Fall back to HTTP/1.1
+        return await self._acquire_connection(connection_timeout)
+
+    async def _get_or_create_http2_connection(self) -> HTTP2Connection | None:
+        # Fast path: check cached protocol without async call
+        if self._detected_protocol is None:
+            # First request - need to detect protocol
+            if await self._detect_protocol() != "h2":
+                return None
+
+        # Try to get existing HTTP/2 connection (multiplexing)
+        h2_conn = self._get_http2_connection()
+        if h2_conn is not None:
+            return h2_conn
+        # Create new HTTP/2 connection
+        return await self._create_http2_connection()
 
     async def _create_http2_connection(self) -> HTTP2Connection:
         """Create a new HTTP/2 connection."""
@@ -229,23 +497,26 @@ class ConnectionPool:
             host=self.host,
             port=self.port,
             ssl_context=self.http2_ssl,
+            resolver=self.resolver,
         )
         await connection.connect()
         self._http2_connections.append(connection)
         return connection
 
     async def create_connection(self) -> HTTP11Connection:
-        """Create a new HTTP/1.1 connection using h11."""
+        """Create a new HTTP/1.1 connection."""
         logger.debug(f"Creating HTTP/1.1 connection to: {self.host}:{self.port}")
         use_ssl = self.scheme == b"https"
-        connection = HTTP11Connection(
+        connection = self.http11_connection_type(
             pool=self,
             host=self.host,
             port=self.port,
             ssl_context=self.ssl,
             use_ssl=use_ssl,
+            resolver=self.resolver,
         )
         await connection.connect()
+        self._track_creation()
         # NB: a newly created connection is going to be used by a
         # request-response cycle;
         # so we don't put it inside the pool (since it's not immediately
@@ -256,18 +527,17 @@ class ConnectionPool:
         """Dispose of the pool and properly await connection cleanup."""
         self.disposed = True
 
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
         # Close HTTP/1.1 connections
-        while True:
-            try:
-                connection = self._idle_connections.get_nowait()
-            except QueueEmpty:
-                break
-            else:
-                logger.debug(
-                    f"Closing connection "
-                    f"{id(connection)} to: {self.host}:{self.port}"
-                )
-                await connection.close()
+        while self._idle_connections:
+            connection = self._idle_connections.popleft()
+            logger.debug(
+                f"Closing connection " f"{id(connection)} to: {self.host}:{self.port}"
+            )
+            await connection.close()
 
         # Close HTTP/2 connections with proper async cleanup
         for conn in self._http2_connections:
@@ -280,10 +550,51 @@ class ConnectionPool:
 
 
 class ConnectionPools:
-    def __init__(self, http2: bool = True, idle_timeout: float = 300.0) -> None:
+    """
+    Keeps the connection pools of a client, by origin.
+
+    Parameters
+    ----------
+    http2: bool
+        Whether HTTP/2 is enabled.
+    idle_timeout: float
+        The number of seconds after which idle connections are closed.
+    max_connections: int
+        The maximum number of HTTP/1.1 connections in use, for all origins, or 0
+        for no limit.
+    max_connections_per_host: int
+        The maximum number of HTTP/1.1 connections in use for each origin, or 0 for
+        no limit.
+    acquire_timeout: float | None
+        The maximum number of seconds to wait for a connection when a limit is
+        reached, or None to wait indefinitely.
+    dns_cache: DNSCache | None
+        The cache of DNS resolutions used by all pools. If not specified, a new
+        `DNSCache` is created; pass the same instance to several `ConnectionPools`
+        to share resolutions among them.
+    http11_connection_type: type[HTTP11Connection] | None
+        The class of HTTP/1.1 connections, by default `HTTPToolsConnection` when
+        `httptools` is installed, otherwise `HTTP11Connection`.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        idle_timeout: float = 300.0,
+        max_connections: int = 0,
+        max_connections_per_host: int = 0,
+        acquire_timeout: float | None = None,
+        dns_cache: DNSCache | None = None,
+        http11_connection_type: type[HTTP11Connection] | None = None,
+    ) -> None:
         self._pools: dict[tuple[bytes, bytes, int], ConnectionPool] = {}
         self.http2_enabled = http2
         self.idle_timeout = idle_timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.acquire_timeout = acquire_timeout
+        self.limit = ConnectionsLimit(max_connections)
+        self.dns_cache = dns_cache if dns_cache is not None else DNSCache()
+        self.http11_connection_type = http11_connection_type
 
     def get_pool(
         self, scheme: bytes, host: bytes, port: int, ssl: None | bool | ssl.SSLContext
@@ -303,6 +614,11 @@ class ConnectionPools:
                 ssl,
                 http2=self.http2_enabled,
                 idle_timeout=self.idle_timeout,
+                max_connections=self.max_connections_per_host,
+                acquire_timeout=self.acquire_timeout,
+                limit=self.limit,
+                resolver=self.dns_cache,
+                http11_connection_type=self.http11_connection_type,
             )
             self._pools[key] = new_pool
             return new_pool
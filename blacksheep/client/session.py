@@ -12,6 +12,7 @@ from .connection import ConnectionClosedError
 from .cookies import CookieJar, cookies_middleware
 from .exceptions import (
     CircularRedirectError,
+    ConnectionPoolTimeout,
     ConnectionTimeout,
     MaximumRedirectsExceededError,
     MissingLocationForRedirect,
@@ -69,6 +70,9 @@ class ClientSession:
         http2: bool = True,
         max_connection_retries: int = 3,
         idle_timeout: float = 300.0,
+        max_connections: int = 0,
+        max_connections_per_host: int = 0,
+        acquire_timeout: float | None = None,
     ):
         """
         Initialize a ClientSession for making HTTP requests.
@@ -95,11 +99,25 @@ class ClientSession:
                    closed by the remote server. Default is 3.
             idle_timeout: Maximum time in seconds a connection can remain idle in the
                    pool before being considered dead. Default is 300.0 (5 minutes).
+            max_connections: Maximum number of HTTP/1.1 connections in use, for all
+                   origins. Requests wait for a connection when the limit is reached.
+                   Default is 0, no limit.
+            max_connections_per_host: Maximum number of HTTP/1.1 connections in use
+                   for each origin. Default is 0, no limit.
+            acquire_timeout: Maximum time in seconds to wait for a connection when a
+                   limit is reached, raising ConnectionPoolTimeout; this time is not
+                   counted in the connection_timeout. Default is None, no limit.
         """
         if pools:
             self.owns_pools = False
         else:
-            pools = ConnectionPools(http2=http2, idle_timeout=idle_timeout)
+            pools = ConnectionPools(
+                http2=http2,
+                idle_timeout=idle_timeout,
+                max_connections=max_connections,
+                max_connections_per_host=max_connections_per_host,
+                acquire_timeout=acquire_timeout,
+            )
             self.owns_pools = True
 
         if redirects_cache_type is None and follow_redirects:
@@ -334,9 +352,9 @@ class ClientSession:
         pool = self.pools.get_pool(url.schema, url.host, url.port, self.ssl)
 
         try:
-            return await asyncio.wait_for(
-                pool.get_connection(), self.connection_timeout
-            )
+            return await pool.get_connection(self.connection_timeout)
+        except ConnectionPoolTimeout:
+            raise
         except TimeoutError:
             raise ConnectionTimeout(url.base_url(), self.connection_timeout)
 
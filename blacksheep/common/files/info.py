@@ -1,7 +1,14 @@
+import hashlib
 import os
+import time
 from email.utils import formatdate
+from stat import S_ISREG
+from typing import Set
 
-from .pathsutils import get_mime_type_from_name
+from blacksheep.utils.aio import get_running_loop
+from blacksheep.utils.lru import LRUCache
+
+from .pathsutils import get_file_extension_from_name, get_mime_type_from_name
 
 
 class FileInfo:
@@ -32,3 +39,161 @@ class FileInfo:
             get_mime_type_from_name(resource_path),
             formatdate(stat.st_mtime, usegmt=True),
         )
+
+
+def _lstat_regular_file(file_path: str) -> os.stat_result | None:
+    try:
+        stat = os.lstat(file_path)
+    except (OSError, ValueError):
+        return None
+    # NB: symbolic links and directories are not served as files
+    return stat if S_ISREG(stat.st_mode) else None
+
+
+def _get_content_etag(file_path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        while chunk := file.read(1024 * 256):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _get_folder_files_info(
+    folder: str, extensions: Set[str] | None
+) -> list[tuple[str, FileInfo, float]]:
+    items = []
+    for root, _, names in os.walk(folder):
+        for name in sorted(names):
+            extension = get_file_extension_from_name(name)
+            if extensions is not None and extension not in extensions:
+                continue
+            file_path = os.path.join(root, name)
+            stat = _lstat_regular_file(file_path)
+            if stat is None:
+                continue
+            info = FileInfo(
+                stat.st_size,
+                _get_content_etag(file_path),
+                get_mime_type_from_name(file_path),
+                formatdate(stat.st_mtime, usegmt=True),
+            )
+            items.append((file_path, info, stat.st_mtime))
+    return items
+
+
+class _FileInfoCacheEntry:
+    __slots__ = ("info", "mtime", "checked_at", "immutable")
+
+    def __init__(self, info: FileInfo, mtime: float, immutable: bool = False):
+        self.info = info
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+        self.immutable = immutable
+
+
+class FileInfoCache:
+    """
+    Caches the metadata of files by path, so that they are not read from the file
+    system for every request. File metadata is read in a thread pool, and it is
+    verified again at most once every `ttl` seconds, comparing the modification time
+    and the size of files: the ETag of a file is kept as long as the file does not
+    change.
+
+    The files in folders loaded with `load_folder` can have strong ETags, computed by
+    hashing their contents, and are considered immutable: their metadata is never
+    verified again.
+
+    Parameters
+    ----------
+    ttl: float
+        The number of seconds after which the metadata of a file is verified again.
+    maxsize: int
+        The maximum number of files described by the cache.
+    """
+
+    __slots__ = ("_items", "ttl")
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 20000) -> None:
+        if ttl < 0:
+            raise ValueError("ttl must be greater than or equal to zero")
+        self._items: LRUCache[str, _FileInfoCacheEntry] = LRUCache(maxsize)
+        self.ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._items
+
+    def get(self, file_path: str) -> FileInfo | None:
+        """
+        Returns the cached information of the file at the given path, if it is
+        available and did not expire, without accessing the file system.
+        """
+        entry = self._items.get(file_path)
+
+        if entry is None:
+            return None
+
+        if entry.immutable or time.monotonic() - entry.checked_at < self.ttl:
+            return entry.info
+
+        return None
+
+    async def get_file_info(self, file_path: str) -> FileInfo | None:
+        """
+        Returns the information of the regular file at the given path, reading it in a
+        thread pool if it is not cached or if it expired. Returns None if the path
+        does not exist, or refers to a directory or a symbolic link.
+        """
+        entry = self._items.get(file_path)
+        now = time.monotonic()
+
+        if entry is not None and (entry.immutable or now - entry.checked_at < self.ttl):
+            return entry.info
+
+        stat = await get_running_loop().run_in_executor(
+            None, _lstat_regular_file, file_path
+        )
+
+        if stat is None:
+            self._items.pop(file_path)
+            return None
+
+        if (
+            entry is not None
+            and entry.mtime == stat.st_mtime
+            and entry.info.size == stat.st_size
+        ):
+            entry.checked_at = now
+            return entry.info
+
+        info = FileInfo(
+            stat.st_size,
+            str(stat.st_mtime),
+            get_mime_type_from_name(file_path),
+            formatdate(stat.st_mtime, usegmt=True),
+        )
+        self._items.set(file_path, _FileInfoCacheEntry(info, stat.st_mtime))
+        return info
+
+    async def load_folder(
+        self,
+        folder: str,
+        extensions: Set[str] | None = None,
+    ) -> None:
+        """
+        Reads the information of all files in the given folder and its subfolders, in
+        a thread pool, computing strong ETags from their contents. Use this method for
+        folders of assets that do not change while the application is running: their
+        files are considered immutable.
+        """
+        items = await get_running_loop().run_in_executor(
+            None, _get_folder_files_info, str(folder), extensions
+        )
+
+        for file_path, info, mtime in items:
+            self._items.set(file_path, _FileInfoCacheEntry(info, mtime, True))
+
+    def clear(self) -> None:
+        self._items.clear()
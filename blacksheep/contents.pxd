@@ -16,8 +16,14 @@ cdef class StreamedContent(Content):
     cdef readonly object generator
 
 
+cdef class FileContent(StreamedContent):
+    cdef readonly str path
+    cdef readonly object offset
+
+
 cdef class ASGIContent(Content):
     cdef readonly object receive
+    cdef public object max_size
 
 
 cdef class TextContent(Content):
@@ -8,7 +8,7 @@ from typing import IO, Any, AsyncIterable, AsyncIterator, Iterable, cast
 from urllib.parse import parse_qsl, quote_plus
 
 from blacksheep.common.files.pathsutils import get_mime_type_from_name
-from blacksheep.exceptions import MessageAborted
+from blacksheep.exceptions import MessageAborted, PayloadTooLarge
 from blacksheep.settings.json import json_settings
 
 logger = logging.getLogger("blacksheep.server")
@@ -116,6 +116,36 @@ class StreamedContent(Content):
             yield chunk
 
 
+class FileContent(StreamedContent):
+    """
+    Represents content read from a file, or from a portion of a file.
+
+    ASGI servers that support the "http.response.pathsend" or the
+    "http.response.zerocopysend" extensions receive the path of the file or an open
+    file, so that they can send it using the operating system's sendfile, without
+    reading it in Python. Otherwise, the content is streamed using the data provider.
+
+    Attributes:
+        path: The absolute path of the file.
+        offset: The position of the first byte to send, for portions of the file, or
+            None if the whole file is sent.
+    """
+
+    def __init__(
+        self,
+        content_type: bytes,
+        file_path: str,
+        data_provider,
+        data_length: int = -1,
+        offset: int | None = None,
+    ):
+        super().__init__(content_type, data_provider, data_length)
+        if offset is not None and data_length < 0:
+            raise ValueError("The length of a portion of a file must be specified")
+        self.path = os.path.abspath(file_path)
+        self.offset = offset
+
+
 class ASGIContent(Content):
     """
     Represents content received from an ASGI application.
@@ -129,19 +159,23 @@ class ASGIContent(Content):
         body: The full body content (bytes or None if not yet read).
         length: The content length in bytes, initially -1 (unknown).
         receive: The ASGI receive callable for getting messages.
+        max_size: The maximum number of bytes that can be received, or None.
     """
 
-    def __init__(self, receive):
+    def __init__(self, receive, max_size: int | None = None):
         """
         Initialize ASGIContent with an ASGI receive callable.
 
         Args:
             receive: An ASGI receive callable that returns awaitable messages.
+            max_size: Optional maximum size of the content, in bytes. When the
+                client sends more data, PayloadTooLarge is raised.
         """
         self.type = None
         self.body = None
         self.length = -1
         self.receive = receive
+        self.max_size = max_size
 
     async def stream(self):
         """
@@ -155,7 +189,10 @@ class ASGIContent(Content):
 
         Raises:
             MessageAborted: If the HTTP connection is disconnected.
+            PayloadTooLarge: If the content exceeds max_size.
         """
+        received = 0
+
         while True:
             if self.receive is None:
                 break  # disposed
@@ -163,7 +200,11 @@ class ASGIContent(Content):
             message = await self.receive()
             if message.get("type") == "http.disconnect":
                 raise MessageAborted()
-            yield message.get("body", b"")
+            chunk = message.get("body", b"")
+            received += len(chunk)
+            if self.max_size is not None and received > self.max_size:
+                raise PayloadTooLarge()
+            yield chunk
             if not message.get("more_body"):
                 break
         yield b""
@@ -177,8 +218,11 @@ class ASGIContent(Content):
 
         Raises:
             MessageAborted: If the HTTP connection is disconnected.
+            PayloadTooLarge: If the content exceeds max_size.
         """
         if self.body is not None:
+            if self.max_size is not None and self.length > self.max_size:
+                raise PayloadTooLarge()
             return self.body
         value = bytearray()
         while True:
@@ -188,7 +232,11 @@ class ASGIContent(Content):
             message = await self.receive()
             if message.get("type") == "http.disconnect":
                 raise MessageAborted()
-            value.extend(message.get("body", b""))
+            chunk = message.get("body", b"")
+            # the limit is checked before buffering each chunk
+            if self.max_size is not None and len(value) + len(chunk) > self.max_size:
+                raise PayloadTooLarge()
+            value.extend(chunk)
             if not message.get("more_body"):
                 break
         self.body = bytes(value)
@@ -217,8 +265,12 @@ class HTMLContent(Content):
 
 
 class JSONContent(Content):
-    def __init__(self, data, dumps=json_settings.dumps):
-        super().__init__(b"application/json", dumps(data).encode("utf8"))
+    def __init__(self, data, dumps=None):
+        if dumps is None:
+            body = json_settings.dumps_bytes(data)
+        else:
+            body = dumps(data).encode("utf8")
+        super().__init__(b"application/json", body)
 
 
 def parse_www_form_urlencoded(content: str) -> dict:
@@ -84,6 +84,32 @@ class StreamedContent(Content):
         """
         ...
 
+class FileContent(StreamedContent):
+    """
+    Represents content read from a file, or from a portion of a file.
+
+    ASGI servers that support the "http.response.pathsend" or the
+    "http.response.zerocopysend" extensions receive the path of the file or an open
+    file, so that they can send it using the operating system's sendfile, without
+    reading it in Python. Otherwise, the content is streamed using the data provider.
+
+    Attributes:
+        path: The absolute path of the file.
+        offset: The position of the first byte to send, for portions of the file, or
+            None if the whole file is sent.
+    """
+
+    def __init__(
+        self,
+        content_type: bytes,
+        file_path: str,
+        data_provider: Callable[[], AsyncIterable[bytes]],
+        data_length: int = -1,
+        offset: int | None = None,
+    ) -> None:
+        self.path = file_path
+        self.offset = offset
+
 class ASGIContent(Content):
     """
     Represents content received from an ASGI application.
@@ -97,19 +123,27 @@ class ASGIContent(Content):
         body: The full body content (bytes or None if not yet read).
         length: The content length in bytes, initially -1 (unknown).
         receive: The ASGI receive callable for getting messages.
+        max_size: The maximum number of bytes that can be received, or None.
     """
 
-    def __init__(self, receive: Callable[[], Awaitable[dict]]):
+    max_size: int | None
+
+    def __init__(
+        self, receive: Callable[[], Awaitable[dict]], max_size: int | None = None
+    ):
         """
         Initialize ASGIContent with an ASGI receive callable.
 
         Args:
             receive: An ASGI receive callable that returns awaitable messages.
+            max_size: Optional maximum size of the content, in bytes. When the
+                client sends more data, PayloadTooLarge is raised.
         """
         self.type = None
         self.body = None
         self.length = -1
         self.receive = receive
+        self.max_size = max_size
 
     def dispose(self) -> None:
         """
@@ -132,6 +166,7 @@ class ASGIContent(Content):
 
         Raises:
             MessageAborted: If the HTTP connection is disconnected.
+            PayloadTooLarge: If the content exceeds max_size.
         """
         ...
 
@@ -149,6 +184,7 @@ class ASGIContent(Content):
 
         Raises:
             MessageAborted: If the HTTP connection is disconnected.
+            PayloadTooLarge: If the content exceeds max_size.
         """
         ...
 
@@ -163,12 +199,12 @@ class HTMLContent(Content):
 def default_json_dumps(value: Any) -> str: ...
 
 class JSONContent(Content):
-    def __init__(self, data: object, dumps: Callable[[Any], str] = default_json_dumps):
+    def __init__(self, data: object, dumps: Callable[[Any], str] | None = None):
         """
         Creates an instance of JSONContent class, automatically serializing the given
-        input in JSON format, encoded using UTF-8.
+        input in JSON format, encoded using UTF-8. By default, the input is serialized
+        directly to bytes using `json_settings.dumps_bytes`.
         """
-        super().__init__(b"application/json", dumps(data).encode("utf8"))
 
 class FormContent(Content):
     def __init__(self, data: Union[dict[str, str], list[tuple[str, str]]]):
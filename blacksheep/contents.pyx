@@ -11,7 +11,7 @@ from urllib.parse import parse_qsl, quote_plus
 
 from blacksheep.settings.json import json_settings
 
-from .exceptions cimport MessageAborted
+from .exceptions cimport MessageAborted, PayloadTooLarge
 
 logger = logging.getLogger("blacksheep.server")
 
@@ -91,19 +91,39 @@ cdef class StreamedContent(Content):
             yield chunk
 
 
+
+cdef class FileContent(StreamedContent):
+
+    def __init__(
+        self,
+        bytes content_type,
+        str file_path,
+        object data_provider,
+        long long data_length = -1,
+        object offset = None
+    ):
+        super().__init__(content_type, data_provider, data_length)
+        if offset is not None and data_length < 0:
+            raise ValueError("The length of a portion of a file must be specified")
+        self.path = os.path.abspath(file_path)
+        self.offset = offset
+
 cdef class ASGIContent(Content):
 
-    def __init__(self, object receive):
+    def __init__(self, object receive, object max_size = None):
         self.type = None
         self.body = None
         self.length = -1
         self.receive = receive
+        self.max_size = max_size
 
     cpdef void dispose(self):
         Content.dispose(self)
         self.receive = None
 
     async def stream(self):
+        cdef long long received = 0
+
         while True:
             if self.receive is None:
                 break  # disposed
@@ -113,7 +133,12 @@ cdef class ASGIContent(Content):
             if message.get('type') == 'http.disconnect':
                 raise MessageAborted()
 
-            yield message.get('body', b'')
+            chunk = message.get('body', b'')
+            received += len(chunk)
+            if self.max_size is not None and received > self.max_size:
+                raise PayloadTooLarge()
+
+            yield chunk
 
             if not message.get('more_body'):
                 break
@@ -122,6 +147,8 @@ cdef class ASGIContent(Content):
 
     async def read(self):
         if self.body is not None:
+            if self.max_size is not None and self.length > self.max_size:
+                raise PayloadTooLarge()
             return self.body
         value = bytearray()
 
@@ -134,7 +161,11 @@ cdef class ASGIContent(Content):
             if message.get('type') == 'http.disconnect':
                 raise MessageAborted()
 
-            value.extend(message.get('body', b''))
+            chunk = message.get('body', b'')
+            # the limit is checked before buffering each chunk
+            if self.max_size is not None and len(value) + len(chunk) > self.max_size:
+                raise PayloadTooLarge()
+            value.extend(chunk)
 
             if not message.get('more_body'):
                 break
@@ -158,8 +189,13 @@ cdef class HTMLContent(Content):
 
 cdef class JSONContent(Content):
 
-    def __init__(self, object data, dumps=json_settings.dumps):
-        super().__init__(b'application/json', dumps(data).encode('utf8'))
+    def __init__(self, object data, dumps=None):
+        cdef bytes body
+        if dumps is None:
+            body = json_settings.dumps_bytes(data)
+        else:
+            body = dumps(data).encode('utf8')
+        super().__init__(b'application/json', body)
 
 
 cdef dict parse_www_form_urlencoded(str content):
@@ -37,6 +37,14 @@ cdef class UnsupportedMediaType(HTTPException):
     pass
 
 
+cdef class PayloadTooLarge(HTTPException):
+    pass
+
+
+cdef class ServiceUnavailable(HTTPException):
+    pass
+
+
 cdef class FailedRequestError(HTTPException):
     cdef public str data
 
@@ -56,6 +56,11 @@ class UnsupportedMediaType(HTTPException):
         super().__init__(415, message or "Unsupported media type")
 
 
+class PayloadTooLarge(HTTPException):
+    def __init__(self, message=None):
+        super().__init__(413, message or "Payload too large")
+
+
 class RangeNotSatisfiable(HTTPException):
     def __init__(self):
         super().__init__(416, "Range not satisfiable")
@@ -72,6 +77,11 @@ class NotImplementedByServer(HTTPException):
         super().__init__(501, "Not implemented by server")
 
 
+class ServiceUnavailable(HTTPException):
+    def __init__(self, message=None):
+        super().__init__(503, message or "Service unavailable")
+
+
 class InvalidArgument(Exception):
     def __init__(self, message: str):
         super().__init__(message)
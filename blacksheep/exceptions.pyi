@@ -29,10 +29,18 @@ class BadRequestFormat(BadRequest):
         super().__init__(message)
         self.inner_exception = inner_exception
 
+class PayloadTooLarge(HTTPException):
+    def __init__(self, message: str = "Payload too large"):
+        super().__init__(413, message)
+
 class RangeNotSatisfiable(HTTPException):
     def __init__(self, message: str = "Range Not Satisfiable"):
         super().__init__(416, message)
 
+class ServiceUnavailable(HTTPException):
+    def __init__(self, message: str = "Service unavailable"):
+        super().__init__(503, message)
+
 class NotFound(HTTPException):
     def __init__(self):
         super().__init__(404)
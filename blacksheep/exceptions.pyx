@@ -64,6 +64,12 @@ cdef class UnsupportedMediaType(HTTPException):
         super().__init__(415, message or "Unsupported media type")
 
 
+cdef class PayloadTooLarge(HTTPException):
+
+    def __init__(self, message=None):
+        super().__init__(413, message or "Payload too large")
+
+
 cdef class RangeNotSatisfiable(HTTPException):
 
     def __init__(self):
@@ -83,6 +89,12 @@ cdef class NotImplementedByServer(HTTPException):
         super().__init__(501, "Not implemented by server")
 
 
+cdef class ServiceUnavailable(HTTPException):
+
+    def __init__(self, message=None):
+        super().__init__(503, message or "Service unavailable")
+
+
 cdef class InvalidArgument(Exception):
 
     def __init__(self, str message):
@@ -17,9 +17,15 @@ from .url cimport URL
 
 cdef class Message:
     cdef list _raw_headers
+    cdef dict _headers_index
+    cdef Py_ssize_t _headers_index_size
+    cdef bint _headers_index_disabled
     cdef public Content content
     cdef object __weakref__
 
+    cdef dict _get_headers_index(self)
+    cdef void _index_added_header(self, bytes key)
+
     cpdef list get_headers(self, bytes key)
     cpdef bytes get_first_header(self, bytes key)
     cpdef bytes get_single_header(self, bytes key)
@@ -50,9 +56,14 @@ cdef class Request(Message):
     cdef public bytes _raw_query
     cdef public object route_values
     cdef public object scope
+    cdef tuple _query_cache
+    cdef tuple _cookies_cache
 
     cdef dict __dict__
 
+    cdef dict _get_query(self)
+    cdef dict _get_cookies(self)
+    cpdef list get_query_values(self, str name)
     cpdef bint expect_100_continue(self)
 
 
@@ -37,6 +37,7 @@ if TYPE_CHECKING:
     from blacksheep.sessions import Session
 
 _charset_rx = re.compile(rb"charset=([\w\-]+)", re.I)
+_UTF8_CHARSETS = {"utf8", "utf-8"}
 
 
 RawHeader: TypeAlias = tuple[bytes, bytes]
@@ -115,7 +116,18 @@ async def _multipart_to_dict_streaming(
     return dict(data)
 
 
+# Minimum number of headers for which messages index headers by name
+HEADERS_INDEX_MIN_SIZE = 8
+
+
 class Message:
+    # Index of the positions of headers by lowercase name, built lazily for messages
+    # with many headers, kept in sync when headers are added, and discarded when they
+    # are removed. It is valid while its size matches the number of raw headers.
+    _headers_index: dict[bytes, list[int]] | None = None
+    _headers_index_size: int = 0
+    _headers_index_disabled: bool = False
+
     def __init__(self, headers: list[RawHeader]):
         self._raw_headers: list[RawHeader] = headers or []
 
@@ -124,23 +136,70 @@ class Message:
         key = "_headers"
         if key in self.__dict__:
             return self.__dict__[key]
+        # Headers modifies the same list of raw headers: the index cannot be kept in
+        # sync anymore
+        self._headers_index = None
+        self._headers_index_disabled = True
         self.__dict__[key] = Headers(self._raw_headers)
         return self.__dict__[key]
 
+    def _get_headers_index(self) -> dict[bytes, list[int]] | None:
+        raw_headers = self._raw_headers
+        size = len(raw_headers)
+        index = self._headers_index
+
+        if index is not None and self._headers_index_size == size:
+            return index
+
+        if size < HEADERS_INDEX_MIN_SIZE or self._headers_index_disabled:
+            return None
+
+        index = {}
+        for position, header in enumerate(raw_headers):
+            key = header[0].lower()
+            positions = index.get(key)
+            if positions is None:
+                index[key] = [position]
+            else:
+                positions.append(position)
+
+        self._headers_index = index
+        self._headers_index_size = size
+        return index
+
+    def _index_added_header(self, key: bytes):
+        index = self._headers_index
+        size = len(self._raw_headers)
+        if index is not None and self._headers_index_size == size - 1:
+            positions = index.get(key.lower())
+            if positions is None:
+                index[key.lower()] = [size - 1]
+            else:
+                positions.append(size - 1)
+            self._headers_index_size = size
+
     def with_content(self, content: Content | StreamedContent) -> "Message":
         self.content: Content | StreamedContent | None = content
         return self
 
     def get_first_header(self, key: bytes) -> bytes | None:
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            positions = index.get(key)
+            return self._raw_headers[positions[0]][1] if positions else None
         for header in self._raw_headers:
             if header[0].lower() == key:
                 return header[1]
         return None
 
     def get_headers(self, key: bytes) -> list[bytes]:
-        results: list[bytes] = []
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            raw_headers = self._raw_headers
+            return [raw_headers[position][1] for position in index.get(key, ())]
+        results: list[bytes] = []
         for header in self._raw_headers:
             if header[0].lower() == key:
                 results.append(header[1])
@@ -153,8 +212,12 @@ class Message:
             setattr(self, name, value)
 
     def get_headers_tuples(self, key: bytes) -> list[RawHeader]:
-        results: list[RawHeader] = []
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            raw_headers = self._raw_headers
+            return [raw_headers[position] for position in index.get(key, ())]
+        results: list[RawHeader] = []
         for header in self._raw_headers:
             if header[0].lower() == key:
                 results.append(header)
@@ -169,8 +232,17 @@ class Message:
         return results[0]
 
     def remove_header(self, key: bytes):
-        to_remove = []
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            positions = index.get(key)
+            if positions:
+                for position in reversed(positions):
+                    del self._raw_headers[position]
+                # positions of the following headers changed
+                self._headers_index = None
+            return
+        to_remove = []
         for header in self._raw_headers:
             if header[0].lower() == key:
                 to_remove.append(header)
@@ -180,9 +252,13 @@ class Message:
     def remove_headers(self, headers: list[RawHeader]):
         for header in headers:
             self._raw_headers.remove(header)
+        self._headers_index = None
 
     def _has_header(self, key: bytes) -> bool:
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            return key in index
         for existing_key, existing_value in self._raw_headers:
             if existing_key.lower() == key:
                 return True
@@ -193,17 +269,18 @@ class Message:
 
     def _add_header(self, key: bytes, value: bytes):
         self._raw_headers.append((key, value))
+        self._index_added_header(key)
 
     def _add_header_if_missing(self, key: bytes, value: bytes):
         if not self._has_header(key):
-            self._raw_headers.append((key, value))
+            self._add_header(key, value)
 
     def add_header(self, key: bytes, value: bytes):
-        self._raw_headers.append((key, value))
+        self._add_header(key, value)
 
     def set_header(self, key: bytes, value: bytes):
         self.remove_header(key)
-        self._raw_headers.append((key, value))
+        self._add_header(key, value)
 
     def content_type(self) -> bytes | None:
         if hasattr(self, "content") and self.content and self.content.type:
@@ -392,11 +469,21 @@ class Message:
             ]
         return [part for part in data if isinstance(part, FormPart) and part.file_name]
 
-    async def json(
-        self, loads=json_settings.loads
-    ) -> dict[str, Any] | list[Any] | None:
+    async def json(self, loads=None) -> dict[str, Any] | list[Any] | None:
         if not self.declares_json():
             return None
+        if loads is None:
+            if self.charset.lower() in _UTF8_CHARSETS:
+                body = await self.read()
+                if not body:
+                    return None
+                try:
+                    return json_settings.loads_bytes(body)
+                except (JSONDecodeError, UnicodeDecodeError):
+                    # decode the body like text() does, to handle other encodings
+                    # and to raise the same errors
+                    pass
+            loads = json_settings.loads
         text = await self.text()
         if text is None or text == "":
             return None
@@ -449,6 +536,9 @@ class Request(Message):
             self._raw_query = None
         self.scope: dict[str, Any] = {}
         self.content: Content | None = None
+        # parsed query and cookies, with the raw values they were parsed from
+        self._query_cache: tuple[bytes, dict[str, list[str]]] | None = None
+        self._cookies_cache: tuple[list[bytes], dict[str, str]] | None = None
 
     # TODO: deprecate the 'identity' property in the future. This requires a breaking
     # change in guardpost, too.
@@ -557,18 +647,38 @@ class Request(Message):
         request._raw_query = query
         return request
 
+    def _get_query(self) -> dict[str, list[str]]:
+        raw_query = self._raw_query
+        if not raw_query:
+            return {}
+        # the query is parsed once, unless _raw_query is replaced
+        cached = self._query_cache
+        if cached is not None and cached[0] is raw_query:
+            return cached[1]
+        query = parse_qs(raw_query.decode("utf8"))
+        self._query_cache = (raw_query, query)
+        return query
+
     @property
     def query(self) -> dict[str, list[str]]:
-        if self._raw_query:
-            return parse_qs(self._raw_query.decode("utf8"))
-        return {}
+        # NB: the parsed query is shared, so callers receive a copy they can modify
+        return {key: list(values) for key, values in self._get_query().items()}
 
     @query.setter
     def query(self, value):
         raw_query = urlencode(value, True).encode("utf8")
+        self._query_cache = None
         self._raw_query = raw_query
         self.url = self.url.with_query(raw_query)
 
+    def get_query_values(self, name: str) -> list[str] | None:
+        """
+        Returns the values of the query parameter with the given name, or None if it
+        is not present, without copying the parsed query: the returned list must not
+        be modified.
+        """
+        return self._get_query().get(name)
+
     @property
     def url(self) -> URL:
         if self._url:
@@ -606,10 +716,13 @@ class Request(Message):
     def __repr__(self) -> str:
         return f"<Request {self.method} {self.url.value.decode()}>"
 
-    @property
-    def cookies(self) -> dict[str, str]:
-        cookies = {}
+    def _get_cookies(self) -> dict[str, str]:
         cookies_headers = self.get_headers(b"cookie")
+        # cookies are parsed once, unless cookie headers change
+        cached = self._cookies_cache
+        if cached is not None and cached[0] == cookies_headers:
+            return cached[1]
+        cookies = {}
         if cookies_headers:
             for header in cookies_headers:
                 pairs = header.split(b"; ")
@@ -622,18 +735,25 @@ class Request(Message):
                         cookies[unquote(name.decode())] = unquote(
                             value.rstrip(b"; ").decode()
                         )
+        self._cookies_cache = (cookies_headers, cookies)
         return cookies
 
+    @property
+    def cookies(self) -> dict[str, str]:
+        # NB: the parsed cookies are shared, so callers receive a copy
+        return dict(self._get_cookies())
+
     def get_cookie(self, name: str) -> str | None:
-        return self.cookies.get(name)
+        return self._get_cookies().get(name)
 
     def set_cookie(self, name: str, value: str):
         new_value = (quote(name) + "=" + quote(value)).encode()
+        self._cookies_cache = None
         existing_cookie = self.get_first_header(b"cookie")
         if existing_cookie:
             self.set_header(b"cookie", existing_cookie + b";" + new_value)
         else:
-            self._raw_headers.append((b"cookie", new_value))
+            self._add_header(b"cookie", new_value)
 
     @property
     def etag(self) -> bytes | None:
@@ -709,7 +829,7 @@ class Response(Message):
         return None
 
     def set_cookie(self, cookie: Cookie):
-        self._raw_headers.append((b"set-cookie", write_cookie_for_response(cookie)))
+        self._add_header(b"set-cookie", write_cookie_for_response(cookie))
 
     def set_cookies(self, cookies: list[Cookie]):
         for cookie in cookies:
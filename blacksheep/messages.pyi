@@ -8,7 +8,6 @@ from .contents import Content, FormPart, StreamedFormPart
 from .cookies import Cookie
 from .headers import Headers, HeaderType
 from .sessions import Session
-from .settings.json import json_settings
 from .url import URL
 
 class Message:
@@ -34,7 +33,7 @@ class Message:
     def declares_json(self) -> bool: ...
     def declares_xml(self) -> bool: ...
     async def files(self, name: str | None = None) -> list[FormPart]: ...
-    async def json(self, loads: Callable[[str], Any] = json_settings.loads) -> Any: ...
+    async def json(self, loads: Callable[[str], Any] | None = None) -> Any: ...
     def has_body(self) -> bool: ...
     @property
     def charset(self) -> str: ...
@@ -64,6 +63,7 @@ class Request(Message):
     def query(self) -> dict[str, list[str]]: ...
     @query.setter
     def query(self, value: dict[str, str | Sequence[str]]) -> None: ...
+    def get_query_values(self, name: str) -> list[str] | None: ...
     @property
     def url(self) -> URL: ...
     @url.setter
@@ -28,6 +28,7 @@ from .headers cimport Headers
 from .url cimport URL, build_absolute_url
 
 _charset_rx = re.compile(rb"charset=([\w\-]+)", re.I)
+_UTF8_CHARSETS = {"utf8", "utf-8"}
 
 
 cpdef str parse_charset(bytes value):
@@ -111,6 +112,12 @@ async def _multipart_to_dict_streaming(
     return dict(data)
 
 
+# Minimum number of headers for which messages index headers by name
+HEADERS_INDEX_MIN_SIZE = 8
+
+cdef Py_ssize_t _HEADERS_INDEX_MIN_SIZE = HEADERS_INDEX_MIN_SIZE
+
+
 cdef class Message:
 
     def __init__(self, list headers):
@@ -121,16 +128,75 @@ cdef class Message:
         cdef str key = '_headers'
         if key in self.__dict__:
             return self.__dict__[key]
+        # Headers modifies the same list of raw headers: the index cannot be kept in
+        # sync anymore
+        self._headers_index = None
+        self._headers_index_disabled = True
         self.__dict__[key] = Headers(self._raw_headers)
         return self.__dict__[key]
 
+    cdef dict _get_headers_index(self):
+        """
+        Returns the index of the positions of headers by lowercase name, built lazily
+        for messages with many headers, kept in sync when headers are added, and
+        discarded when they are removed. It is valid while its size matches the
+        number of raw headers.
+        """
+        cdef list raw_headers = self._raw_headers
+        cdef Py_ssize_t size = len(raw_headers)
+        cdef Py_ssize_t position
+        cdef dict index = self._headers_index
+        cdef list positions
+        cdef bytes key
+
+        if index is not None and self._headers_index_size == size:
+            return index
+
+        if size < _HEADERS_INDEX_MIN_SIZE or self._headers_index_disabled:
+            return None
+
+        index = {}
+        for position in range(size):
+            key = raw_headers[position][0].lower()
+            positions = index.get(key)
+            if positions is None:
+                index[key] = [position]
+            else:
+                positions.append(position)
+
+        self._headers_index = index
+        self._headers_index_size = size
+        return index
+
+    cdef void _index_added_header(self, bytes key):
+        cdef dict index = self._headers_index
+        cdef Py_ssize_t size = len(self._raw_headers)
+        cdef list positions
+
+        if index is not None and self._headers_index_size == size - 1:
+            key = key.lower()
+            positions = index.get(key)
+            if positions is None:
+                index[key] = [size - 1]
+            else:
+                positions.append(size - 1)
+            self._headers_index_size = size
+
     cpdef Message with_content(self, Content content):
         self.content = content
         return self
 
     cpdef bytes get_first_header(self, bytes key):
         cdef tuple header
+        cdef list positions
+        cdef dict index
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            positions = index.get(key)
+            if positions:
+                return self._raw_headers[positions[0]][1]
+            return None
         for header in self._raw_headers:
             if header[0].lower() == key:
                 return header[1]
@@ -138,7 +204,14 @@ cdef class Message:
     cpdef list get_headers(self, bytes key):
         cdef list results = []
         cdef tuple header
+        cdef dict index
+        cdef Py_ssize_t position
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            for position in index.get(key, ()):
+                results.append(self._raw_headers[position][1])
+            return results
         for header in self._raw_headers:
             if header[0].lower() == key:
                 results.append(header[1])
@@ -161,7 +234,14 @@ cdef class Message:
     cdef list get_headers_tuples(self, bytes key):
         cdef list results = []
         cdef tuple header
+        cdef dict index
+        cdef Py_ssize_t position
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            for position in index.get(key, ()):
+                results.append(self._raw_headers[position])
+            return results
         for header in self._raw_headers:
             if header[0].lower() == key:
                 results.append(header)
@@ -178,7 +258,20 @@ cdef class Message:
     cpdef void remove_header(self, bytes key):
         cdef tuple header
         cdef list to_remove = []
+        cdef list positions
+        cdef dict index
+        cdef Py_ssize_t position
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            positions = index.get(key)
+            if positions:
+                for position in reversed(positions):
+                    del self._raw_headers[position]
+                # positions of the following headers changed
+                self._headers_index = None
+            return
+
         for header in self._raw_headers:
             if header[0].lower() == key:
                 to_remove.append(header)
@@ -190,10 +283,15 @@ cdef class Message:
         cdef tuple header
         for header in headers:
             self._raw_headers.remove(header)
+        self._headers_index = None
 
     cdef bint _has_header(self, bytes key):
         cdef bytes existing_key, existing_value
+        cdef dict index
         key = key.lower()
+        index = self._get_headers_index()
+        if index is not None:
+            return key in index
         for existing_key, existing_value in self._raw_headers:
             if existing_key.lower() == key:
                 return True
@@ -204,17 +302,18 @@ cdef class Message:
 
     cdef void _add_header(self, bytes key, bytes value):
         self._raw_headers.append((key, value))
+        self._index_added_header(key)
 
     cdef void _add_header_if_missing(self, bytes key, bytes value):
         if not self._has_header(key):
-            self._raw_headers.append((key, value))
+            self._add_header(key, value)
 
     cpdef void add_header(self, bytes key, bytes value):
-        self._raw_headers.append((key, value))
+        self._add_header(key, value)
 
     cpdef void set_header(self, bytes key, bytes value):
         self.remove_header(key)
-        self._raw_headers.append((key, value))
+        self._add_header(key, value)
 
     cpdef bytes content_type(self):
         if self.content and self.content.type:
@@ -401,10 +500,23 @@ cdef class Message:
             return [part for part in data if part.file_name and part.name == name]
         return [part for part in data if part.file_name]
 
-    async def json(self, loads=json_settings.loads):
+    async def json(self, loads=None):
         if not self.declares_json():
             return None
 
+        if loads is None:
+            if self.charset.lower() in _UTF8_CHARSETS:
+                body = await self.read()
+                if not body:
+                    return None
+                try:
+                    return json_settings.loads_bytes(body)
+                except (JSONDecodeError, UnicodeDecodeError):
+                    # decode the body like text() does, to handle other encodings
+                    # and to raise the same errors
+                    pass
+            loads = json_settings.loads
+
         text = await self.text()
 
         if text is None or text == "":
@@ -573,19 +685,42 @@ cdef class Request(Message):
         request._raw_query = query
         return request
 
+    cdef dict _get_query(self):
+        cdef bytes raw_query = self._raw_query
+        cdef dict query
+
+        if not raw_query:
+            return {}
+
+        # the query is parsed once, unless _raw_query is replaced
+        if self._query_cache is not None and self._query_cache[0] is raw_query:
+            return self._query_cache[1]
+
+        query = parse_qs(raw_query.decode("utf8"))
+        self._query_cache = (raw_query, query)
+        return query
+
     @property
     def query(self):
-        if self._raw_query:
-            return parse_qs(self._raw_query.decode("utf8"))
-        return {}
+        # NB: the parsed query is shared, so callers receive a copy they can modify
+        return {key: list(values) for key, values in self._get_query().items()}
 
     @query.setter
     def query(self, value):
         cdef bytes raw_query
         raw_query = urlencode(value, True).encode("utf8")
+        self._query_cache = None
         self._raw_query = raw_query
         self.url = self.url.with_query(raw_query)
 
+    cpdef list get_query_values(self, str name):
+        """
+        Returns the values of the query parameter with the given name, or None if it
+        is not present, without copying the parsed query: the returned list must not
+        be modified.
+        """
+        return self._get_query().get(name)
+
     @property
     def url(self):
         if self._url:
@@ -627,13 +762,20 @@ cdef class Request(Message):
     def __repr__(self):
         return f'<Request {self.method} {self.url.value.decode()}>'
 
-    @property
-    def cookies(self):
+    cdef dict _get_cookies(self):
         cdef bytes header
         cdef list cookies_headers
         cdef dict cookies = {}
 
         cookies_headers = self.get_headers(b'cookie')
+
+        # cookies are parsed once, unless cookie headers change
+        if (
+            self._cookies_cache is not None
+            and self._cookies_cache[0] == cookies_headers
+        ):
+            return self._cookies_cache[1]
+
         if cookies_headers:
             for header in cookies_headers:
                 # a single cookie header is expected from the client, but anyway here
@@ -649,10 +791,16 @@ cdef class Request(Message):
                         pass
                     else:
                         cookies[unquote(name.decode())] = unquote(value.rstrip(b'; ').decode())
+        self._cookies_cache = (cookies_headers, cookies)
         return cookies
 
+    @property
+    def cookies(self):
+        # NB: the parsed cookies are shared, so callers receive a copy
+        return dict(self._get_cookies())
+
     def get_cookie(self, str name):
-        return self.cookies.get(name)
+        return self._get_cookies().get(name)
 
     def set_cookie(self, str name, str value):
         """
@@ -663,12 +811,13 @@ cdef class Request(Message):
         cdef bytes existing_cookie
 
         new_value = (quote(name) + "=" + quote(value)).encode()
+        self._cookies_cache = None
         existing_cookie = self.get_first_header(b"cookie")
 
         if existing_cookie:
             self.set_header(b"cookie", existing_cookie + b";" + new_value)
         else:
-            self._raw_headers.append((b"cookie", new_value))
+            self._add_header(b"cookie", new_value)
 
     @property
     def etag(self):
@@ -764,7 +913,7 @@ cdef class Response(Message):
         return None
 
     def set_cookie(self, Cookie cookie):
-        self._raw_headers.append((b'set-cookie', write_cookie_for_response(cookie)))
+        self._add_header(b'set-cookie', write_cookie_for_response(cookie))
 
     def set_cookies(self, list cookies):
         cdef Cookie cookie
@@ -1,7 +1,9 @@
 import warnings
+from collections import deque
 from typing import AsyncIterable, Generator, Iterable
 
 from blacksheep.contents import FormPart, StreamedFormPart
+from blacksheep.multipartparser import PART_BEGIN, PART_END, MultipartParser
 
 
 def get_boundary_from_header(value: bytes) -> bytes:
@@ -281,58 +283,35 @@ async def parse_multipart_async(
                 value = await part.read()
         ```
     """
-    boundary_delimiter = b"--" + boundary
+    parser = MultipartParser(boundary)
+    events: deque[tuple[int, bytes | None]] = deque()
 
     # Use manual iterator control to avoid buffering the entire stream
     stream_iter = stream.__aiter__()
-    buffer = bytearray()
+    stream_ended = False
     default_charset = None
 
     # Track current part's data generator for draining if not consumed
     current_data_gen = None
     part_consumed = True
 
-    async def read_more() -> bool:
-        """Read more data from stream into buffer. Returns False if stream ended."""
-        try:
-            chunk = await stream_iter.__anext__()
-            buffer.extend(chunk)
-            return True
-        except StopAsyncIteration:
-            return False
-
-    async def skip_to_boundary() -> bool:
+    async def next_event() -> tuple[int, bytes | None] | None:
         """
-        Skip data until we find and move past a boundary delimiter.
-        Returns False if stream ended.
+        Returns the next parser event, reading from the stream when needed.
+        Returns None when the payload ended.
         """
-        while True:
-            pos = buffer.find(boundary_delimiter)
-            if pos != -1:
-                # Move past the boundary
-                after = pos + len(boundary_delimiter)
-
-                # Ensure we have enough bytes to check for CRLF
-                while len(buffer) < after + 2:
-                    if not await read_more():
-                        buffer[:] = buffer[after:] if len(buffer) > after else b""
-                        return len(buffer) > 0
-
-                # Skip CRLF after boundary
-                if buffer[after : after + 2] == b"\r\n":
-                    buffer[:] = buffer[after + 2 :]
-                elif buffer[after : after + 1] == b"\n":
-                    buffer[:] = buffer[after + 1 :]
-                else:
-                    buffer[:] = buffer[after:]
-                return True
-
-            # Keep minimal buffer for boundary detection, read more
-            if len(buffer) > len(boundary_delimiter):
-                buffer[:] = buffer[-len(boundary_delimiter) :]
-
-            if not await read_more():
-                return False
+        nonlocal stream_ended
+        while not events:
+            if stream_ended:
+                return None
+            try:
+                chunk = await stream_iter.__anext__()
+            except StopAsyncIteration:
+                stream_ended = True
+                events.extend(parser.close())
+            else:
+                events.extend(parser.feed(chunk))
+        return events.popleft()
 
     async def data_generator():
         """Generator that yields data chunks for current part."""
@@ -341,36 +320,10 @@ async def parse_multipart_async(
 
         try:
             while True:
-                # Look for boundary in current buffer
-                pos = buffer.find(boundary_delimiter)
-
-                if pos != -1:
-                    # Found boundary - yield data before it (minus trailing CRLF)
-                    data = _remove_last_crlf(bytes(buffer[:pos]))
-                    buffer[:] = buffer[pos:]  # Keep boundary for next part detection
-                    if data:
-                        yield data
-                    return
-
-                # No boundary found - yield safe portion of buffer
-                # Keep enough bytes to detect boundary that might span chunks
-                safe_threshold = len(boundary_delimiter) + 4
-                if len(buffer) > safe_threshold:
-                    safe_amount = len(buffer) - safe_threshold
-                    chunk = bytes(buffer[:safe_amount])
-                    buffer[:] = buffer[safe_amount:]
-                    if chunk:
-                        yield chunk
-
-                # Read more data from stream
-                if not await read_more():
-                    # Stream ended - yield remaining buffer
-                    if buffer:
-                        data = _remove_last_crlf(bytes(buffer))
-                        buffer.clear()
-                        if data:
-                            yield data
+                event = await next_event()
+                if event is None or event[0] == PART_END:
                     return
+                yield event[1]
         finally:
             part_consumed = True
 
@@ -382,38 +335,25 @@ async def parse_multipart_async(
                 pass
         current_data_gen = None
 
-    # Skip to first boundary
-    if not await skip_to_boundary():
-        return
-
     while True:
         # Drain previous part if caller didn't consume it
         await drain_current_part()
 
-        # Check for end boundary marker ("--" after boundary)
-        while len(buffer) < 2:
-            if not await read_more():
-                return
-        if buffer[:2] == b"--":
+        event = await next_event()
+        if event is None:
             return
 
-        # Read headers (until \r\n\r\n)
-        while b"\r\n\r\n" not in buffer:
-            if not await read_more():
-                return
-
-        header_end = buffer.find(b"\r\n\r\n")
-        headers_data = bytes(buffer[:header_end])
-        buffer[:] = buffer[header_end + 4 :]
+        if event[0] != PART_BEGIN:
+            continue
 
         # Parse headers
-        headers = dict(split_headers(headers_data))
+        headers = dict(split_headers(event[1]))
         content_disposition = headers.get(b"content-disposition")
 
+        current_data_gen = data_generator()
+
         if not content_disposition:
             # Invalid part - skip to next boundary
-            if not await skip_to_boundary():
-                return
             continue
 
         cd_values = parse_content_disposition_values(content_disposition)
@@ -430,19 +370,10 @@ async def parse_multipart_async(
 
         # Handle special _charset_ field
         if name == b"_charset_":
-            charset_gen = data_generator()
-            current_data_gen = charset_gen
-            async for chunk in charset_gen:
-                default_charset = chunk
-                break
-            await drain_current_part()
-            if not await skip_to_boundary():
-                return
+            # the value can be split across chunks of the stream
+            default_charset = b"".join([chunk async for chunk in current_data_gen])
             continue
 
-        # Create data generator for this part
-        current_data_gen = data_generator()
-
         # Yield the streaming part
         yield StreamedFormPart(
             _decode(name),
@@ -452,12 +383,6 @@ async def parse_multipart_async(
             _decode(charset),
         )
 
-        # After yield returns (caller asked for next part), drain any unconsumed
-        # data and skip to the next boundary
-        await drain_current_part()
-        if not await skip_to_boundary():
-            return
-
 
 def _simplify_part(part: FormPart) -> FormPart | str:
     if part.file_name:
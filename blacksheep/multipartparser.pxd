@@ -0,0 +1,20 @@
+# cython: language_level=3
+# Copyright (C) 2018-present Roberto Prevato
+#
+# This module is part of BlackSheep and is released under
+# the MIT License https://opensource.org/licenses/MIT
+
+
+cdef class MultipartParser:
+    cdef bytearray _buffer
+    cdef Py_ssize_t _pos
+    cdef int _state
+    cdef bytes _delimiter
+
+    cpdef list feed(self, bytes data)
+    cpdef list close(self)
+    cdef void _compact(self)
+    cdef void _emit_data(
+        self, list events, const char *data, Py_ssize_t start, Py_ssize_t end, bint trim
+    )
+    cdef void _parse(self, list events, bint final)
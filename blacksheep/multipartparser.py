@@ -0,0 +1,155 @@
+"""
+This module implements an incremental parser for multipart/form-data payloads. The
+parser keeps received data in a single buffer and tracks the position of the data
+not parsed yet, so that boundaries are found without copying the rest of the
+buffer, and the data of parts is copied only once, when it is emitted.
+
+It is compiled with Cython when possible (multipartparser.pyx), this module is the
+pure-Python implementation used otherwise, for example with PyPy.
+"""
+
+PART_BEGIN = 1  # the value of the event is the raw headers of the part
+PART_DATA = 2  # the value of the event is a chunk of the data of the part
+PART_END = 3  # the value of the event is None
+
+_PREAMBLE = 0
+_AFTER_BOUNDARY = 1
+_HEADERS = 2
+_DATA = 3
+_END = 4
+
+
+class MultipartParser:
+    """
+    Parses multipart/form-data incrementally: `feed` accepts chunks of any size and
+    returns the events for the parts found so far, as (event type, value) tuples.
+    The trailing CRLF before each boundary is removed from the data of parts.
+    """
+
+    __slots__ = ("_buffer", "_pos", "_state", "_delimiter")
+
+    def __init__(self, boundary: bytes) -> None:
+        if not boundary:
+            raise ValueError("Missing multipart boundary.")
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _PREAMBLE
+        self._delimiter = b"--" + boundary
+
+    @property
+    def complete(self) -> bool:
+        """Returns a value indicating whether the closing boundary was parsed."""
+        return self._state == _END
+
+    def feed(self, data: bytes) -> list[tuple[int, bytes | None]]:
+        """Parses the given chunk of data, returning the events it completes."""
+        events: list[tuple[int, bytes | None]] = []
+
+        if self._state == _END or not data:
+            return events
+
+        self._buffer += data
+        self._parse(events, False)
+        self._compact()
+        return events
+
+    def close(self) -> list[tuple[int, bytes | None]]:
+        """
+        Handles the end of the payload, returning the events for the data of the
+        last part when the closing boundary is missing.
+        """
+        events: list[tuple[int, bytes | None]] = []
+        if self._state != _END:
+            self._parse(events, True)
+            self._state = _END
+        self._buffer.clear()
+        self._pos = 0
+        return events
+
+    def _compact(self) -> None:
+        # parsed data is discarded only when it is at least half of the buffer, so
+        # that the total cost of moving unparsed data is linear
+        pos = self._pos
+        if pos and pos * 2 >= len(self._buffer):
+            del self._buffer[:pos]
+            self._pos = 0
+
+    def _emit_data(
+        self, events: list, view: memoryview, start: int, end: int, trim: bool
+    ) -> None:
+        if trim:
+            if end - start >= 2 and view[end - 2] == 13 and view[end - 1] == 10:
+                end -= 2
+            elif end > start and view[end - 1] == 10:
+                end -= 1
+        if end > start:
+            events.append((PART_DATA, bytes(view[start:end])))
+
+    def _parse(self, events: list, final: bool) -> None:
+        buffer = self._buffer
+        delimiter = self._delimiter
+        delimiter_length = len(delimiter)
+        length = len(buffer)
+        pos = self._pos
+
+        with memoryview(buffer) as view:
+            while True:
+                state = self._state
+
+                if state == _PREAMBLE:
+                    index = buffer.find(delimiter, pos)
+                    if index == -1:
+                        pos = max(pos, length - delimiter_length + 1)
+                        break
+                    pos = index + delimiter_length
+                    self._state = _AFTER_BOUNDARY
+
+                elif state == _AFTER_BOUNDARY:
+                    if length - pos < 2:
+                        break
+                    if view[pos] == 45 and view[pos + 1] == 45:  # --
+                        self._state = _END
+                        pos = length
+                        break
+                    if view[pos] == 13 and view[pos + 1] == 10:
+                        pos += 2
+                    elif view[pos] == 10:
+                        pos += 1
+                    self._state = _HEADERS
+
+                elif state == _HEADERS:
+                    index = buffer.find(b"\r\n\r\n", pos)
+                    if index == -1:
+                        break
+                    events.append((PART_BEGIN, bytes(view[pos:index])))
+                    pos = index + 4
+                    self._state = _DATA
+
+                elif state == _DATA:
+                    index = buffer.find(delimiter, pos)
+
+                    if index == -1:
+                        if final:
+                            self._emit_data(events, view, pos, length, True)
+                            events.append((PART_END, None))
+                            pos = length
+                            break
+
+                        # keep the bytes that can be the beginning of a boundary,
+                        # preceded by CRLF
+                        end = length - delimiter_length - 2
+                        if end > pos:
+                            self._emit_data(events, view, pos, end, False)
+                            pos = end
+                        break
+
+                    self._emit_data(events, view, pos, index, True)
+                    events.append((PART_END, None))
+                    pos = index + delimiter_length
+                    self._state = _AFTER_BOUNDARY
+
+                else:
+                    pos = length
+                    break
+
+        self._pos = pos
@@ -0,0 +1,10 @@
+PART_BEGIN: int
+PART_DATA: int
+PART_END: int
+
+class MultipartParser:
+    def __init__(self, boundary: bytes) -> None: ...
+    @property
+    def complete(self) -> bool: ...
+    def feed(self, data: bytes) -> list[tuple[int, bytes | None]]: ...
+    def close(self) -> list[tuple[int, bytes | None]]: ...
@@ -0,0 +1,152 @@
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+PART_BEGIN = 1  # the value of the event is the raw headers of the part
+PART_DATA = 2  # the value of the event is a chunk of the data of the part
+PART_END = 3  # the value of the event is None
+
+cdef enum:
+    _PREAMBLE = 0
+    _AFTER_BOUNDARY = 1
+    _HEADERS = 2
+    _DATA = 3
+    _END = 4
+
+
+cdef class MultipartParser:
+    """
+    Parses multipart/form-data incrementally: `feed` accepts chunks of any size and
+    returns the events for the parts found so far, as (event type, value) tuples.
+    The trailing CRLF before each boundary is removed from the data of parts.
+    """
+
+    def __init__(self, bytes boundary):
+        if not boundary:
+            raise ValueError("Missing multipart boundary.")
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _PREAMBLE
+        self._delimiter = b"--" + boundary
+
+    @property
+    def complete(self):
+        """Returns a value indicating whether the closing boundary was parsed."""
+        return self._state == _END
+
+    cpdef list feed(self, bytes data):
+        """Parses the given chunk of data, returning the events it completes."""
+        cdef list events = []
+
+        if self._state == _END or not data:
+            return events
+
+        self._buffer += data
+        self._parse(events, False)
+        self._compact()
+        return events
+
+    cpdef list close(self):
+        """
+        Handles the end of the payload, returning the events for the data of the
+        last part when the closing boundary is missing.
+        """
+        cdef list events = []
+        if self._state != _END:
+            self._parse(events, True)
+            self._state = _END
+        self._buffer.clear()
+        self._pos = 0
+        return events
+
+    cdef void _compact(self):
+        # parsed data is discarded only when it is at least half of the buffer, so
+        # that the total cost of moving unparsed data is linear
+        cdef Py_ssize_t pos = self._pos
+        if pos and pos * 2 >= PyByteArray_GET_SIZE(self._buffer):
+            del self._buffer[:pos]
+            self._pos = 0
+
+    cdef void _emit_data(
+        self, list events, const char *data, Py_ssize_t start, Py_ssize_t end, bint trim
+    ):
+        if trim:
+            if end - start >= 2 and data[end - 2] == b"\r" and data[end - 1] == b"\n":
+                end -= 2
+            elif end > start and data[end - 1] == b"\n":
+                end -= 1
+        if end > start:
+            events.append(
+                (PART_DATA, PyBytes_FromStringAndSize(data + start, end - start))
+            )
+
+    cdef void _parse(self, list events, bint final):
+        cdef bytearray buffer = self._buffer
+        cdef bytes delimiter = self._delimiter
+        cdef Py_ssize_t delimiter_length = len(delimiter)
+        cdef Py_ssize_t length = PyByteArray_GET_SIZE(buffer)
+        cdef Py_ssize_t pos = self._pos
+        cdef Py_ssize_t index
+        cdef Py_ssize_t end
+        # the buffer is not resized while parsing, so its pointer stays valid
+        cdef const char *data = PyByteArray_AS_STRING(buffer)
+
+        while True:
+            if self._state == _PREAMBLE:
+                index = buffer.find(delimiter, pos)
+                if index == -1:
+                    pos = max(pos, length - delimiter_length + 1)
+                    break
+                pos = index + delimiter_length
+                self._state = _AFTER_BOUNDARY
+
+            elif self._state == _AFTER_BOUNDARY:
+                if length - pos < 2:
+                    break
+                if data[pos] == b"-" and data[pos + 1] == b"-":
+                    self._state = _END
+                    pos = length
+                    break
+                if data[pos] == b"\r" and data[pos + 1] == b"\n":
+                    pos += 2
+                elif data[pos] == b"\n":
+                    pos += 1
+                self._state = _HEADERS
+
+            elif self._state == _HEADERS:
+                index = buffer.find(b"\r\n\r\n", pos)
+                if index == -1:
+                    break
+                events.append(
+                    (PART_BEGIN, PyBytes_FromStringAndSize(data + pos, index - pos))
+                )
+                pos = index + 4
+                self._state = _DATA
+
+            elif self._state == _DATA:
+                index = buffer.find(delimiter, pos)
+
+                if index == -1:
+                    if final:
+                        self._emit_data(events, data, pos, length, True)
+                        events.append((PART_END, None))
+                        pos = length
+                        break
+
+                    # keep the bytes that can be the beginning of a boundary,
+                    # preceded by CRLF
+                    end = length - delimiter_length - 2
+                    if end > pos:
+                        self._emit_data(events, data, pos, end, False)
+                        pos = end
+                    break
+
+                self._emit_data(events, data, pos, index, True)
+                events.append((PART_END, None))
+                pos = index + delimiter_length
+                self._state = _AFTER_BOUNDARY
+
+            else:
+                pos = length
+                break
+
+        self._pos = pos
@@ -5,6 +5,8 @@ def copy_special_attributes(source_method, wrapper) -> None:
         "auth_roles",
         "auth_schemes",
         "allow_anonymous",
+        "output_cache",
+        "max_body_size",
         "controller_type",
         "route_handler",
         "__name__",
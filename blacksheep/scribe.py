@@ -1,7 +1,9 @@
 import http
+import os
 import re
+from asyncio import get_running_loop
 
-from .contents import Content, StreamedContent
+from .contents import Content, FileContent, StreamedContent
 from .cookies import Cookie, write_cookie_for_response
 from .messages import Request, Response
 
@@ -40,8 +42,65 @@ def get_chunks(data: bytes):
     yield b""
 
 
-async def send_asgi_response(response: Response, send):
+async def _send_asgi_file_response(
+    response: Response, content: FileContent, send, extensions: dict
+) -> bool:
+    if content.offset is None and "http.response.pathsend" in extensions:
+        use_pathsend = True
+    elif "http.response.zerocopysend" in extensions:
+        use_pathsend = False
+    else:
+        return False
+
+    loop = get_running_loop()
+
+    if content.length < 0:
+        content.length = await loop.run_in_executor(None, os.path.getsize, content.path)
+
+    set_headers_for_response_content(response)
+
+    if use_pathsend:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": response._raw_headers,
+            }
+        )
+        await send({"type": "http.response.pathsend", "path": content.path})
+        return True
+
+    file = await loop.run_in_executor(None, open, content.path, "rb")
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response.status,
+                "headers": response._raw_headers,
+            }
+        )
+        await send(
+            {
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "offset": content.offset or 0,
+                "count": content.length,
+                "more_body": False,
+            }
+        )
+    finally:
+        file.close()
+    return True
+
+
+async def send_asgi_response(response: Response, send, extensions=None):
     content = response.content
+
+    if extensions and isinstance(content, FileContent):
+        # the ASGI server can send the file using sendfile
+        if await _send_asgi_file_response(response, content, send, extensions):
+            return
+
     set_headers_for_response_content(response)
     await send(
         {
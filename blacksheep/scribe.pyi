@@ -5,5 +5,7 @@ from blacksheep.cookies import Cookie
 from blacksheep.messages import Request, Response
 
 def write_chunks(content: Content) -> AsyncIterable[bytes]: ...
-async def send_asgi_response(response: Response, send: Callable): ...
+async def send_asgi_response(
+    response: Response, send: Callable, extensions: dict | None = None
+): ...
 def write_sse(event: ServerSentEvent) -> bytes: ...
@@ -1,7 +1,9 @@
 import http
+import os
 import re
+from asyncio import get_running_loop
 
-from .contents cimport Content, StreamedContent
+from .contents cimport Content, FileContent, StreamedContent
 from .cookies cimport Cookie, write_cookie_for_response
 from .messages cimport Request, Response
 from .url cimport URL
@@ -50,10 +52,72 @@ def get_chunks(bytes data):
     yield b''
 
 
-async def send_asgi_response(Response response, object send):
+async def _send_asgi_file_response(
+    Response response,
+    FileContent content,
+    object send,
+    dict extensions
+):
+    cdef bint use_pathsend
+
+    if content.offset is None and "http.response.pathsend" in extensions:
+        use_pathsend = True
+    elif "http.response.zerocopysend" in extensions:
+        use_pathsend = False
+    else:
+        return False
+
+    loop = get_running_loop()
+
+    if content.length < 0:
+        content.length = await loop.run_in_executor(None, os.path.getsize, content.path)
+
+    set_headers_for_response_content(response)
+
+    if use_pathsend:
+        await send({
+            'type': 'http.response.start',
+            'status': response.status,
+            'headers': response._raw_headers
+        })
+        await send({
+            'type': 'http.response.pathsend',
+            'path': content.path
+        })
+        return True
+
+    file = await loop.run_in_executor(None, open, content.path, "rb")
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': response.status,
+            'headers': response._raw_headers
+        })
+        await send({
+            'type': 'http.response.zerocopysend',
+            'file': file,
+            'offset': content.offset or 0,
+            'count': content.length,
+            'more_body': False
+        })
+    finally:
+        file.close()
+    return True
+
+
+async def send_asgi_response(
+    Response response,
+    object send,
+    dict extensions = None
+):
     cdef bytes chunk
     cdef Content content = response.content
 
+    if extensions and isinstance(content, FileContent):
+        # the ASGI server can send the file using sendfile
+        if await _send_asgi_file_response(response, content, send, extensions):
+            return
+
     set_headers_for_response_content(response)
 
     await send({
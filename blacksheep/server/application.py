@@ -22,6 +22,7 @@ from rodi import ContainerProtocol
 from blacksheep.baseapp import BaseApplication, handle_not_found
 from blacksheep.common import extend
 from blacksheep.common.files.asyncfs import FilesHandler
+from blacksheep.common.files.info import FileInfoCache
 from blacksheep.contents import ASGIContent
 from blacksheep.exceptions import NotFound
 from blacksheep.messages import Request, Response
@@ -48,8 +49,10 @@ from blacksheep.server.controllers import ControllersManager
 from blacksheep.server.cors import CORSPolicy, CORSStrategy, get_cors_middleware
 from blacksheep.server.env import EnvironmentSettings
 from blacksheep.server.errors import ServerErrorDetailsHandler
-from blacksheep.server.files import DefaultFileOptions
+from blacksheep.server.files import DefaultFileOptions, get_default_extensions
+from blacksheep.server.files.cache import HotFilesCache
 from blacksheep.server.files.dynamic import serve_files_dynamic
+from blacksheep.server.limits import get_body_size_limit_handler
 from blacksheep.server.normalization import normalize_handler, normalize_middleware
 from blacksheep.server.process import use_shutdown_handler
 from blacksheep.server.remotes.scheme import configure_scheme_middleware
@@ -57,6 +60,7 @@ from blacksheep.server.responses import _ensure_bytes
 from blacksheep.server.routing import MountRegistry, RouteMethod, Router, RoutesRegistry
 from blacksheep.server.routing import router as default_router
 from blacksheep.server.routing import validate_default_router, validate_router
+from blacksheep.server.threadpool import SyncHandlersExecutor
 from blacksheep.server.websocket import WebSocket, format_reason
 from blacksheep.sessions import SessionMiddleware, SessionSerializer
 from blacksheep.sessions.abc import SessionStore
@@ -177,6 +181,8 @@ class Application(BaseApplication):
         services: ContainerProtocol | None = None,
         show_error_details: bool = False,
         mount: MountRegistry | None = None,
+        max_body_size: int | None = None,
+        sync_handlers_executor: SyncHandlersExecutor | None = None,
     ):
         env_settings = EnvironmentSettings.from_env()
         if router is None:
@@ -205,6 +211,9 @@ class Application(BaseApplication):
         self.files_handler = FilesHandler()
         self.server_error_details_handler = ServerErrorDetailsHandler()
         self.base_path: str = ""  # TODO: deprecate
+        self.max_body_size = max_body_size
+        self.sync_handlers_executor = sync_handlers_executor
+        self._default_sync_handlers_executor: SyncHandlersExecutor | None = None
         self._env_settings = env_settings
         self._mount_registry = mount
         validate_router(self)
@@ -598,6 +607,10 @@ class Application(BaseApplication):
         fallback_document: str | None = None,
         allow_anonymous: bool = True,
         default_file_options: DefaultFileOptions | None = None,
+        precompressed: bool = False,
+        hot_files: HotFilesCache | None = None,
+        file_info_cache: FileInfoCache | None = None,
+        immutable: bool = False,
     ):
         """
         Configures dynamic file serving from a given folder, relative to the server cwd.
@@ -620,7 +633,30 @@ class Application(BaseApplication):
             use HTML5 History API for client side routing.
             default_file_options: Optional options to serve the default file
             (index.html)
+            precompressed: Whether to serve the precompressed versions of files that
+            exist next to them (e.g. app.js.br, app.js.zst, app.js.gz), to clients that
+            accept their content coding.
+            hot_files: Optional HotFilesCache, to keep small files in memory and serve
+            them without reading them from disk.
+            file_info_cache: Optional FileInfoCache, to cache the metadata of files
+            and read it without blocking the event loop.
+            immutable: Whether the files in the source folder never change while the
+            application is running. If True, the metadata of all files is read when
+            the application starts, with strong ETags computed from their contents,
+            and it is never read again. A FileInfoCache is created if not provided.
         """
+        if immutable:
+            if file_info_cache is None:
+                file_info_cache = FileInfoCache()
+
+            cache = file_info_cache
+
+            @self.on_start
+            async def load_files_info(_):
+                await cache.load_folder(
+                    str(source_folder), extensions or get_default_extensions()
+                )
+
         serve_files_dynamic(
             self.router,
             self.files_handler,
@@ -633,6 +669,9 @@ class Application(BaseApplication):
             fallback_document=fallback_document,
             anonymous_access=allow_anonymous,
             default_file_options=default_file_options,
+            precompressed=precompressed,
+            hot_files=hot_files,
+            file_info_cache=file_info_cache,
         )
 
     def _apply_middlewares_in_routes(self):
@@ -674,12 +713,46 @@ class Application(BaseApplication):
             if route.handler in configured_handlers:
                 continue
 
-            route.handler = normalize_handler(route, self.services, method)
+            route.handler = self._apply_body_size_limit(
+                normalize_handler(
+                    route,
+                    self.services,
+                    method,
+                    self._get_sync_handlers_executor(route.handler),
+                )
+            )
             configured_handlers.add(route.handler)
 
         self._normalize_fallback_route()
         configured_handlers.clear()
 
+    def _get_sync_handlers_executor(self, handler) -> SyncHandlersExecutor | None:
+        # request handlers decorated with run_in_thread_pool override the application
+        # setting; if the application has no executor, a default one is created
+        if not getattr(
+            handler, "run_in_thread_pool", self.sync_handlers_executor is not None
+        ):
+            return None
+        if self.sync_handlers_executor is not None:
+            return self.sync_handlers_executor
+        if self._default_sync_handlers_executor is None:
+            executor = self._default_sync_handlers_executor = SyncHandlersExecutor()
+
+            @self.on_stop
+            async def shutdown_sync_handlers_executor(_):
+                # NB: executors configured by the user are not owned by the
+                # application, and are not shut down
+                executor.shutdown(wait=False)
+
+        return self._default_sync_handlers_executor
+
+    def _apply_body_size_limit(self, handler):
+        # request handlers decorated with max_body_size override the application limit
+        max_size = getattr(handler, "max_body_size", self.max_body_size)
+        if max_size is None and self.max_body_size is None:
+            return handler
+        return get_body_size_limit_handler(handler, max_size)
+
     def _normalize_fallback_route(self):
         """
         Automatically configures the NotFound exception handler to use the user-defined
@@ -864,7 +937,7 @@ class Application(BaseApplication):
         )
 
         request.scope = scope
-        request.content = ASGIContent(receive)
+        request.content = ASGIContent(receive, self.max_body_size)
         return request
 
     def _check_prefix(self):
@@ -885,7 +958,7 @@ class Application(BaseApplication):
 
         request = self.instantiate_request(scope, receive)
         response = await self.handle(request)
-        await send_asgi_response(response, send)
+        await send_asgi_response(response, send, scope.get("extensions"))
 
         request.scope = None  # type: ignore
         request.dispose()
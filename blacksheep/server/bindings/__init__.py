@@ -11,6 +11,7 @@ See:
 from abc import abstractmethod
 from collections.abc import Iterable as IterableAbc
 from functools import partial
+from json import JSONDecodeError
 from typing import (
     Any,
     Callable,
@@ -27,9 +28,11 @@ from guardpost import Identity
 from rodi import CannotResolveTypeException, ContainerProtocol
 
 from blacksheep.contents import FormPart
-from blacksheep.exceptions import BadRequest, UnsupportedMediaType
+from blacksheep.exceptions import BadRequest, BadRequestFormat, UnsupportedMediaType
 from blacksheep.messages import Request
 from blacksheep.server.bindings.converters import class_converters, converters
+from blacksheep.server.bindings.decoders import JSONDecoder
+from blacksheep.server.limits import apply_body_size_limit
 from blacksheep.server.routing import Router, URLResolver
 from blacksheep.server.websocket import WebSocket
 from blacksheep.url import URL
@@ -110,6 +113,8 @@ class BoundValue(Generic[T]):
     """Base class for parameters that are bound for a web request."""
 
     name: str | None = None
+    # maximum size of the request body, in bytes, used by body binders
+    max_body_size: int | None = None
 
     def __init__(self, value: T) -> None:
         self._value = value
@@ -149,9 +154,14 @@ class FromJSON(BoundValue[T]):
     A parameter obtained from JSON request body.
     If value type is `dict`, `typing.Dict`, or not specified, the deserialized JSON
     is returned without any cast.
+
+    Subclasses can set `typed_decoding = True` to decode the request body directly
+    into the value type, using msgspec or Pydantic, rather than parsing it into
+    dictionaries and lists and converting them.
     """
 
     default_value_type = dict
+    typed_decoding: bool = False
 
 
 FromJson = FromJSON  # for backward compatibility
@@ -364,15 +374,27 @@ class Binder(metaclass=BinderMeta):  # type: ignore
         try:
             value = await self.get_value(request)
         except UnicodeDecodeError as decode_error:
-            raise BadRequest(
-                f"Unicode decode error. "
-                f"Cannot decode the request content using: {decode_error.encoding}. "
-                "Ensure the request content is encoded using the encoding declared in "
-                "the Content-Type request header."
-            )
+            raise _get_decode_bad_request(decode_error)
+        except ValueError as value_error:
+            raise BadRequest("Invalid parameter.") from value_error
+
+        return self._get_parameter_for_value(value)
+
+    def get_parameter_sync(self, request: Request) -> Any:
+        """
+        Gets a parameter to be passed to a request handler, like `get_parameter`,
+        without awaiting. This method can be used only if `is_sync` is True.
+        """
+        try:
+            value = self.get_value_sync(request)
+        except UnicodeDecodeError as decode_error:
+            raise _get_decode_bad_request(decode_error)
         except ValueError as value_error:
             raise BadRequest("Invalid parameter.") from value_error
 
+        return self._get_parameter_for_value(value)
+
+    def _get_parameter_for_value(self, value: Any) -> Any:
         if value is None and self.default is not empty:
             return self.default
 
@@ -390,6 +412,42 @@ class Binder(metaclass=BinderMeta):  # type: ignore
     async def get_value(self, request: Request) -> Any:
         """Gets a value from the given request object."""
 
+    def get_value_sync(self, request: Request) -> Any:
+        """
+        Gets a value from the given request object without awaiting, for binders that
+        do not need to read the request body or other asynchronous sources. Binders
+        implementing this method must implement `get_value` calling it.
+        """
+        raise NotImplementedError()
+
+    @property
+    def is_sync(self) -> bool:
+        """
+        Returns a value indicating whether values can be read with `get_value_sync`.
+        This is not the case for subclasses that override `get_value`, without
+        overriding `get_value_sync` too.
+        """
+        mro = type(self).__mro__
+        value_index = _get_defining_class_index(mro, "get_value")
+        sync_index = _get_defining_class_index(mro, "get_value_sync")
+        return sync_index < mro.index(Binder) and sync_index <= value_index
+
+
+def _get_defining_class_index(mro: tuple[type, ...], name: str) -> int:
+    for index, cls in enumerate(mro):
+        if name in cls.__dict__:
+            return index
+    return len(mro)
+
+
+def _get_decode_bad_request(decode_error: UnicodeDecodeError) -> BadRequest:
+    return BadRequest(
+        f"Unicode decode error. "
+        f"Cannot decode the request content using: {decode_error.encoding}. "
+        "Ensure the request content is encoded using the encoding declared in "
+        "the Content-Type request header."
+    )
+
 
 def get_binder_by_type(bound_value_type: Type[BoundValue]) -> Type[Binder]:
     origin = bound_value_type.__dict__.get("__origin__")
@@ -464,6 +522,7 @@ class BodyBinder(Binder):
         if not converter:
             converter = self.get_default_binder_for_body(expected_type)  # type: ignore
         self.converter = converter
+        self.max_body_size: int | None = None
 
     def _get_default_converter_single(self, expected_type):
         for converter in converters:
@@ -521,6 +580,9 @@ class BodyBinder(Binder):
         if request.method not in self._excluded_methods and self.matches_content_type(
             request
         ):
+            if self.max_body_size is not None:
+                apply_body_size_limit(request, self.max_body_size)
+
             data = await self.read_data(request)
 
             if not data:
@@ -556,6 +618,9 @@ class JSONBinder(BodyBinder):
 
     handle = FromJSON
 
+    # decodes JSON bytes directly into the expected type, see FromJSON.typed_decoding
+    json_decoder: JSONDecoder | None = None
+
     @property
     def content_type(self) -> str:
         return "application/json"
@@ -564,8 +629,25 @@ class JSONBinder(BodyBinder):
         return request.declares_json()
 
     async def read_data(self, request: Request) -> Any:
+        if self.json_decoder is not None and request.charset.lower() in {
+            "utf8",
+            "utf-8",
+        }:
+            return await request.read()
         return await request.json()
 
+    def parse_value(self, data: Any):
+        if self.json_decoder is None or not isinstance(data, bytes):
+            return super().parse_value(data)
+
+        # the body was read as bytes, to be decoded directly into the expected type
+        try:
+            return self.json_decoder(data)
+        except JSONDecodeError as decode_error:
+            raise BadRequestFormat("Cannot parse content as JSON", decode_error)
+        except ValueError as value_error:
+            raise InvalidRequestBody(str(value_error)) from value_error
+
 
 JsonBinder = JSONBinder
 
@@ -738,6 +820,8 @@ class MultiFormatBodyBinder(BodyBinder):
     async def get_value(self, request: Request) -> Any:
         if request.method in self._excluded_methods:
             return None
+        if self.max_body_size is not None:
+            apply_body_size_limit(request, self.max_body_size)
         for binder in self.inner_binders:
             if binder.matches_content_type(request):
                 return await binder.get_value(request)
@@ -851,6 +935,9 @@ class SyncBinder(Binder):
         return value in self._empty_iterables
 
     async def get_value(self, request: Request) -> Any | None:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Any | None:
         raw_value = self.get_raw_value(request)
         try:
             value = self.converter(raw_value)
@@ -894,7 +981,9 @@ class QueryBinder(SyncBinder):
         return "query"
 
     def get_raw_value(self, request: Request) -> Sequence[str]:
-        return [value for value in request.query.get(self.parameter_name, [])]
+        # NB: converters do not modify values, so the cached query values are read
+        # without copying the whole query
+        return request.get_query_values(self.parameter_name) or ()
 
 
 class CookieBinder(SyncBinder):
@@ -905,7 +994,7 @@ class CookieBinder(SyncBinder):
         return "cookie"
 
     def get_raw_value(self, request: Request) -> Sequence[str]:
-        cookie = request.cookies.get(self.parameter_name)
+        cookie = request.get_cookie(self.parameter_name)
         if cookie:
             return [cookie]
         return []
@@ -946,6 +1035,9 @@ class ServiceBinder(Binder):
         self.services = services
 
     async def get_value(self, request: Request) -> Any:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Any:
         try:
             scope = request._di_scope  # type: ignore
         except AttributeError:
@@ -990,6 +1082,9 @@ class RequestBinder(Binder):
         super().__init__(Request, implicit=implicit)
 
     async def get_value(self, request: Request) -> Any:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Any:
         return request
 
 
@@ -1001,6 +1096,9 @@ class WebSocketBinder(Binder):
         super().__init__(WebSocket, implicit=implicit)
 
     async def get_value(self, websocket: WebSocket) -> WebSocket | None:
+        return self.get_value_sync(websocket)
+
+    def get_value_sync(self, websocket: WebSocket) -> WebSocket | None:
         return websocket
 
 
@@ -1008,6 +1106,9 @@ class IdentityBinder(Binder):
     handle = RequestUser
 
     async def get_value(self, request: Request) -> Identity | None:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Identity | None:
         return getattr(request, "identity", None)
 
 
@@ -1017,6 +1118,9 @@ class ExactBinder(Binder):
         self.exact_object = exact_object
 
     async def get_value(self, request: Request) -> Any:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> Any:
         return self.exact_object
 
 
@@ -1032,6 +1136,9 @@ class ClientInfoBinder(Binder):
     handle = ClientInfo
 
     async def get_value(self, request: Request) -> tuple[str, int]:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> tuple[str, int]:
         return tuple(request.scope["client"])
 
 
@@ -1039,6 +1146,9 @@ class ServerInfoBinder(Binder):
     handle = ServerInfo
 
     async def get_value(self, request: Request) -> tuple[str, int]:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> tuple[str, int]:
         return tuple(request.scope["server"])
 
 
@@ -1049,6 +1159,9 @@ class RequestURLBinder(Binder):
         super().__init__(URL, name="request url", implicit=False)
 
     async def get_value(self, request: Request) -> URL:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> URL:
         return request.url
 
 
@@ -1059,6 +1172,9 @@ class RequestMethodBinder(Binder):
         super().__init__(str, name="request method", implicit=False)
 
     async def get_value(self, request: Request) -> str:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> str:
         return request.method
 
 
@@ -1091,4 +1207,7 @@ class URLResolverBinder(Binder):
         return cls(app.router)
 
     async def get_value(self, request: Request) -> URLResolver:
+        return self.get_value_sync(request)
+
+    def get_value_sync(self, request: Request) -> URLResolver:
         return URLResolver(self._router, request)
@@ -385,75 +385,113 @@ class ClassConverter(TypeConverter):
     class parameters or dataclass fields.
     """
 
+    def __init__(self) -> None:
+        self._plans: dict[Any, Callable[[Any], Any]] = {}
+
     def _from_dict(self, cls, data: dict | list):
         """Convert dict to plain class or dataclass, ignoring extra fields"""
+        try:
+            plan = self._plans[cls]
+        except KeyError:
+            # the conversion plan is compiled on first use of each type, so that
+            # fields and their converters are not inspected for each value
+            plan = self._plans[cls] = self._compile_plan(cls)
+        return plan(data)
+
+    def _compile_plan(self, cls) -> Callable[[Any], Any]:
+        """
+        Returns a function that converts input values to instances of the given type.
+        """
         if _is_pydantic_model(cls):
-            return cls.model_validate(data)
+            return cls.model_validate
+
+        convert_list = self._compile_list_plan(cls)
+
+        if _dict_converter.can_convert(cls):
+
+            def convert_dict(data):
+                if isinstance(data, list):
+                    return convert_list(data)
+                return _dict_converter.convert(data, cls)
 
+            return convert_dict
+
+        if _is_dataclass(cls):
+            return self._compile_dataclass_plan(cls, convert_list)
+
+        return self._compile_plain_class_plan(cls, convert_list)
+
+    def _compile_list_plan(self, cls) -> Callable[[list], Any]:
         # here it is sufficient to handle list because input from client can only
         # be parsed as list in most cases (like after parsing JSON or XML), not other
         # types of sequences like tuple
-        if isinstance(data, list):
-            # require a type hint to work
-            obj_type_hint = _get_args(cls)
-            if obj_type_hint:
-                # good…
-                obj_type_converter = get_converter(obj_type_hint[0])
-                return [
-                    obj_type_converter.convert(datum, obj_type_hint[0])
-                    for datum in data
-                ]
-            else:
-                # return data as-is (let if fail downstream if it must)
+        obj_type_hint = _get_args(cls)
+        if not obj_type_hint:
+            # return data as-is (let if fail downstream if it must)
+            return lambda data: data
+
+        item_type = obj_type_hint[0]
+        item_converter = get_converter(item_type)
+        return lambda data: [item_converter.convert(datum, item_type) for datum in data]
+
+    def _compile_dataclass_plan(self, cls, convert_list) -> Callable[[Any], Any]:
+        fields_plan = [
+            (field.name, get_converter(field.type), field.type)
+            for field in _get_dataclass_fields(cls)
+        ]
+
+        def convert_dataclass(data):
+            if isinstance(data, list):
+                return convert_list(data)
+            if not isinstance(data, dict):
                 return data
 
-        if _dict_converter.can_convert(cls):
-            return _dict_converter.convert(data, cls)
+            field_values = {}
+            for name, converter, field_type in fields_plan:
+                if name in data:
+                    value = data[name]
+                    if value is None:
+                        field_values[name] = None
+                    else:
+                        field_values[name] = converter.convert(value, field_type)
+            return cls(**field_values)
 
-        if not isinstance(data, dict):
-            return data
+        return convert_dataclass
 
-        # Handle dataclasses
-        if _is_dataclass(cls):
-            return self._handle_dataclass(cls, data)
-
-        # Handle plain classes
-        return self._handle_plain_class(cls, data)
-
-    def _handle_dataclass(self, cls, data):
-        field_values = {}
-        for field in _get_dataclass_fields(cls):
-            if field.name in data:
-                field_type = field.type
-                value = data[field.name]
-                if value is None:
-                    field_values[field.name] = None
-                else:
-                    converter = get_converter(field_type)
-                    field_values[field.name] = converter.convert(value, field_type)
-        return cls(**field_values)
-
-    def _handle_plain_class(self, cls, data):
+    def _compile_plain_class_plan(self, cls, convert_list) -> Callable[[Any], Any]:
         # Get type hints from __init__
         sig = _get_signature(cls)
         type_hints = _get_type_hints(cls)
 
-        init_params = {}
-        for param_name, _ in sig.parameters.items():
+        params_plan = []
+        for param_name in sig.parameters:
             if param_name == "self":
                 continue
 
-            if param_name in data:
-                value = data[param_name]
+            # Check if parameter has a type hint that's a class
+            if param_name in type_hints:
+                param_type = type_hints[param_name]
+                params_plan.append((param_name, get_converter(param_type), param_type))
+            else:
+                params_plan.append((param_name, None, None))
+
+        def convert_plain_class(data):
+            if isinstance(data, list):
+                return convert_list(data)
+            if not isinstance(data, dict):
+                return data
+
+            init_params = {}
+            for name, converter, param_type in params_plan:
+                if name in data:
+                    value = data[name]
+                    if converter is None:
+                        init_params[name] = value
+                    else:
+                        init_params[name] = converter.convert(value, param_type)
+            return cls(**init_params)
 
-                # Check if parameter has a type hint that's a class
-                if param_name in type_hints:
-                    param_type = type_hints[param_name]
-                    converter = get_converter(param_type)
-                    init_params[param_name] = converter.convert(value, param_type)
-                else:
-                    init_params[param_name] = value
-        return cls(**init_params)
+        return convert_plain_class
 
     @lru_cache(maxsize=None)
     def can_convert(self, expected_type) -> bool:
@@ -512,10 +550,7 @@ class ListConverter(TypeConverter):
         if value is None:
             return None
 
-        origin = _get_origin(expected_type)
-        item_type = _get_args(expected_type)[0]
-
-        item_converter = get_converter(item_type)
+        origin, item_type, item_converter = _get_list_plan(expected_type)
 
         converted_items = [item_converter.convert(item, item_type) for item in value]
 
@@ -527,6 +562,12 @@ class ListConverter(TypeConverter):
             return converted_items
 
 
+@lru_cache(maxsize=None)
+def _get_list_plan(expected_type) -> tuple[Any, Any, TypeConverter]:
+    item_type = _get_args(expected_type)[0]
+    return _get_origin(expected_type), item_type, get_converter(item_type)
+
+
 converters: list[TypeConverter] = [
     BoolConverter(),
     BytesConverter(),
@@ -0,0 +1,79 @@
+"""
+This module provides decoders that parse JSON request bodies directly into the
+expected types, using msgspec or Pydantic when installed. Since the payload is not
+parsed into dictionaries and lists first and then converted, it is traversed only
+once.
+
+Decoders raise json.JSONDecodeError when the payload is not valid JSON, and
+ValueError when it does not match the expected type.
+"""
+
+from json import JSONDecodeError
+from typing import Any, Callable
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    from pydantic import PydanticSchemaGenerationError, TypeAdapter, ValidationError
+except ImportError:  # pragma: no cover
+    TypeAdapter = None
+
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def _get_msgspec_decoder(expected_type) -> JSONDecoder | None:
+    try:
+        decoder = msgspec.json.Decoder(expected_type)
+    except TypeError:
+        # the type is not supported by msgspec, like Pydantic models
+        return None
+
+    def decode(data: bytes) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.ValidationError as validation_error:
+            raise ValueError(str(validation_error)) from validation_error
+        except msgspec.DecodeError as decode_error:
+            raise JSONDecodeError(str(decode_error), "", 0) from decode_error
+
+    return decode
+
+
+def _get_pydantic_decoder(expected_type) -> JSONDecoder | None:
+    try:
+        adapter = TypeAdapter(expected_type)
+    except PydanticSchemaGenerationError:
+        return None
+
+    def decode(data: bytes) -> Any:
+        try:
+            return adapter.validate_json(data)
+        except ValidationError as validation_error:
+            if any(
+                error["type"] == "json_invalid" for error in validation_error.errors()
+            ):
+                raise JSONDecodeError(
+                    str(validation_error), "", 0
+                ) from validation_error
+            raise
+
+    return decode
+
+
+def get_typed_json_decoder(expected_type) -> JSONDecoder | None:
+    """
+    Returns a function that decodes JSON bytes directly into the given type, using
+    msgspec for the types it supports, like msgspec Structs and dataclasses, and
+    Pydantic TypeAdapters otherwise. Returns None if neither library is installed
+    or supports the given type.
+    """
+    decoder = None
+    if msgspec is not None:
+        decoder = _get_msgspec_decoder(expected_type)
+    if decoder is None and TypeAdapter is not None:
+        decoder = _get_pydantic_decoder(expected_type)
+    return decoder
@@ -1,11 +1,47 @@
 import asyncio
 import gzip
+import zlib
+from abc import ABC, abstractmethod
 from concurrent.futures import Executor
-from typing import Awaitable, Callable, Iterable
+from typing import Awaitable, Callable, Iterable, Sequence
 
-from blacksheep import Content, Request, Response
+from blacksheep import Content, Request, Response, StreamedContent
 from blacksheep.server.application import Application
+from blacksheep.server.headers.encoding import select_encoding
+from blacksheep.server.headers.etag import weaken_etag
 from blacksheep.server.normalization import ensure_response
+from blacksheep.utils.lru import LRUCache
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+_MISSING = object()
+
+
+def _normalize_types(types: Iterable[bytes]) -> list[bytes]:
+    normalized_types = []
+    for _type in types:
+        if isinstance(_type, str):
+            normalized_types.append(_type.encode("ascii"))
+        else:
+            normalized_types.append(_type)
+    return normalized_types
+
+
+def _weaken_etag(response: Response) -> None:
+    # an encoded response is not byte-for-byte identical to the original
+    # representation: a strong validator of the original is not valid for it
+    etag = response.get_first_header(b"etag")
+    if etag is not None:
+        response.set_header(b"etag", weaken_etag(etag))
 
 
 class GzipMiddleware:
@@ -57,13 +93,7 @@ class GzipMiddleware:
         """
         Normalizes the types to bytes.
         """
-        normalized_types = []
-        for _type in types:
-            if isinstance(_type, str):
-                normalized_types.append(_type.encode("ascii"))
-            else:
-                normalized_types.append(_type)
-        return normalized_types
+        return _normalize_types(types)
 
     def should_handle(self, request: Request, response: Response) -> bool:
         """
@@ -121,6 +151,7 @@ class GzipMiddleware:
             )
         )
         response.add_header(b"content-encoding", b"gzip")
+        _weaken_etag(response)
         return response
 
 
@@ -138,3 +169,379 @@ def use_gzip_compression(
     app.middlewares.append(handler)  # type: ignore
 
     return handler
+
+
+class StreamCompressor(ABC):
+    """
+    Compresses a stream of bytes incrementally, chunk by chunk.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses a chunk of data, returning the compressed bytes that are ready,
+        which can be empty if the compressor is buffering data.
+        """
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """
+        Returns the compressed bytes for all data received so far, so that the
+        client can decompress them without waiting for the end of the stream.
+        """
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Completes the compressed stream, returning its last bytes."""
+
+
+class ContentEncoder(ABC):
+    """
+    Base class for content codings that can be used to compress response bodies.
+    """
+
+    name: bytes
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compresses the whole given data."""
+
+    @abstractmethod
+    def get_compressor(self) -> StreamCompressor:
+        """Returns a new object to compress a stream of bytes."""
+
+
+class ZlibStreamCompressor(StreamCompressor):
+    def __init__(self, level: int, wbits: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class GzipEncoder(ContentEncoder):
+    name = b"gzip"
+
+    def __init__(self, level: int = 5) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, self.level)
+
+    def get_compressor(self) -> StreamCompressor:
+        return ZlibStreamCompressor(self.level, 16 + zlib.MAX_WBITS)
+
+
+class DeflateEncoder(ContentEncoder):
+    """
+    The "deflate" content coding, which is the zlib format defined in RFC 1950.
+    """
+
+    name = b"deflate"
+
+    def __init__(self, level: int = 5) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def get_compressor(self) -> StreamCompressor:
+        return ZlibStreamCompressor(self.level, zlib.MAX_WBITS)
+
+
+class BrotliStreamCompressor(StreamCompressor):
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class BrotliEncoder(ContentEncoder):
+    """
+    The "br" content coding. Requires the `brotli` package.
+    """
+
+    name = b"br"
+
+    def __init__(self, quality: int = 4) -> None:
+        if brotli is None:  # pragma: no cover
+            raise ImportError(
+                "brotli is required for Brotli compression. "
+                "Install it with: pip install blacksheep[compression]"
+            )
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality)
+
+    def get_compressor(self) -> StreamCompressor:
+        return BrotliStreamCompressor(self.quality)
+
+
+class ZstdStreamCompressor(StreamCompressor):
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class ZstdEncoder(ContentEncoder):
+    """
+    The "zstd" content coding. Requires the `zstandard` package.
+    """
+
+    name = b"zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        if zstandard is None:  # pragma: no cover
+            raise ImportError(
+                "zstandard is required for Zstandard compression. "
+                "Install it with: pip install blacksheep[compression]"
+            )
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        # compressors are not thread safe, and this method runs in executors
+        return zstandard.ZstdCompressor(level=self.level).compress(data)
+
+    def get_compressor(self) -> StreamCompressor:
+        return ZstdStreamCompressor(self.level)
+
+
+def get_default_encoders() -> list[ContentEncoder]:
+    """
+    Returns the content encoders that are available in the current environment, in
+    order of preference: br and zstd are used only if the optional packages `brotli`
+    and `zstandard` are installed.
+    """
+    encoders: list[ContentEncoder] = []
+    if brotli is not None:
+        encoders.append(BrotliEncoder())
+    if zstandard is not None:
+        encoders.append(ZstdEncoder())
+    encoders.append(GzipEncoder())
+    encoders.append(DeflateEncoder())
+    return encoders
+
+
+def _vary_accept_encoding(response: Response) -> None:
+    """
+    Adds Accept-Encoding to the Vary header of the given response, merging it into
+    the existing value, if any.
+    """
+    values = response.get_headers(b"vary")
+    if not values:
+        response.add_header(b"vary", b"Accept-Encoding")
+        return
+
+    value = b", ".join(values)
+    fields = {field.strip().lower() for field in value.split(b",")}
+    if b"*" not in fields and b"accept-encoding" not in fields:
+        value += b", Accept-Encoding"
+    response.set_header(b"vary", value)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses using the content coding that is preferred by the client,
+    according to the quality values of the "Accept-Encoding" request header, among
+    the configured encoders (by default br, zstd, gzip, deflate, in order of
+    preference for equal quality values).
+
+    Buffered responses are compressed in an executor if their body is larger than
+    the minimum size; streamed responses are compressed chunk by chunk, while they
+    are sent. Responses of event streams are flushed after each chunk.
+    Responses with content types that are not handled, or that are already
+    compressed, and partial responses are not compressed. A `Vary: Accept-Encoding`
+    header is added to all responses that can be compressed.
+
+    Parameters
+    ----------
+    min_size: int
+        The minimum size of buffered response bodies to compress.
+    handled_types: Iterable[bytes | None]
+        The list of content types to compress.
+    encoders: Sequence[ContentEncoder]
+        The content encoders to use, in order of preference.
+    executor: Executor
+        The executor instance to use for compression of buffered responses. If not
+        specified, a default executor is used. If you specify an executor, you are
+        responsible for shutting it down.
+    """
+
+    handled_types: list[bytes] = GzipMiddleware.handled_types + [b"event-stream"]
+
+    # image/svg+xml is not excluded, as it compresses well
+    excluded_types: list[bytes] = [
+        b"image/png",
+        b"image/jpeg",
+        b"image/gif",
+        b"image/webp",
+        b"image/avif",
+        b"image/heic",
+        b"image/heif",
+        b"image/jxl",
+        b"audio/",
+        b"video/",
+        b"font/woff",
+        b"zip",
+        b"gzip",
+        b"compressed",
+        b"octet-stream",
+        b"pdf",
+    ]
+
+    def __init__(
+        self,
+        min_size: int = 500,
+        handled_types: Iterable[bytes] | None = None,
+        encoders: Sequence[ContentEncoder] | None = None,
+        executor: Executor | None = None,
+    ):
+        self.min_size = min_size
+        self.encoders = (
+            list(encoders) if encoders is not None else get_default_encoders()
+        )
+        self._encoders_by_name = {encoder.name: encoder for encoder in self.encoders}
+        self._executor = executor
+        self._encoders_by_header: LRUCache[bytes, ContentEncoder | None] = LRUCache(200)
+
+        if handled_types is not None:
+            self.handled_types = _normalize_types(handled_types)
+
+    def get_encoder(self, accept_encoding: bytes | None) -> ContentEncoder | None:
+        """
+        Returns the encoder to use for the given value of Accept-Encoding, or None if
+        the response must not be compressed.
+        """
+        if not accept_encoding:
+            return None
+
+        cached = self._encoders_by_header.get(accept_encoding, _MISSING)
+        if cached is not _MISSING:
+            return cached  # type: ignore
+
+        name = select_encoding(accept_encoding, self._encoders_by_name)
+        selected = None if name is None else self._encoders_by_name[name]
+
+        self._encoders_by_header.set(accept_encoding, selected)
+        return selected
+
+    def is_handled_type(self, content_type: bytes | None) -> bool:
+        if not content_type:
+            return False
+        content_type = content_type.lower()
+        if any(_type in content_type for _type in self.excluded_types):
+            return False
+        return any(_type in content_type for _type in self.handled_types)
+
+    def should_handle(self, response: Response) -> bool:
+        """
+        Returns True if the response can be compressed, depending on the client
+        preferences.
+        """
+        content = response.content
+
+        if content is None or response.status == 206:
+            return False
+
+        if response.has_header(b"content-encoding"):
+            return False
+
+        if not self.is_handled_type(content.type):
+            return False
+
+        if isinstance(content, StreamedContent) or content.body is None:
+            return True
+
+        return len(content.body) > self.min_size
+
+    def _get_compressed_stream(
+        self, content: Content, encoder: ContentEncoder
+    ) -> StreamedContent:
+        flush = b"event-stream" in (content.type or b"")
+
+        async def compressed_stream():
+            compressor = encoder.get_compressor()
+
+            async for chunk in content.get_parts():  # type: ignore
+                if not chunk:
+                    continue
+                data = compressor.compress(chunk)
+                if flush:
+                    data += compressor.flush()
+                if data:
+                    yield data
+
+            yield compressor.finish()
+
+        return StreamedContent(content.type, compressed_stream)
+
+    async def __call__(
+        self, request: Request, handler: Callable[[Request], Awaitable[Response]]
+    ) -> Response | None:
+        response = ensure_response(await handler(request))
+
+        if response is None or not self.should_handle(response):
+            return response
+
+        _vary_accept_encoding(response)
+
+        encoder = self.get_encoder(request.get_first_header(b"accept-encoding"))
+
+        if encoder is None:
+            return response
+
+        content = response.content
+        assert content is not None
+
+        if isinstance(content, StreamedContent) or content.body is None:
+            response.with_content(self._get_compressed_stream(content, encoder))
+        else:
+            loop = asyncio.get_running_loop()
+            compressed_body = await loop.run_in_executor(
+                self._executor, encoder.compress, content.body
+            )
+            response.with_content(Content(content.type, compressed_body))
+
+        # the length of the original content is not valid anymore
+        response.remove_header(b"content-length")
+        response.add_header(b"content-encoding", encoder.name)
+        _weaken_etag(response)
+        return response
+
+
+def use_compression(
+    app: Application,
+    handler: CompressionMiddleware | None = None,
+) -> CompressionMiddleware:
+    """
+    Configures the application to compress responses using the best content coding
+    supported by each client, among br, zstd, gzip and deflate.
+    """
+    if handler is None:
+        handler = CompressionMiddleware()
+
+    app.middlewares.append(handler)  # type: ignore
+
+    return handler
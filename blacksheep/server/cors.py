@@ -1,16 +1,36 @@
 import re
-from functools import lru_cache
 from typing import Any, Awaitable, Callable, FrozenSet, Iterable
 
 from blacksheep.baseapp import BaseApplication
 from blacksheep.messages import Request, Response
 from blacksheep.server.routing import Route, Router
 from blacksheep.server.websocket import WebSocket
+from blacksheep.utils.lru import LRUCache
 
 from .responses import not_found, ok, status_code
 
 
+def _get_encoded_value_for_set(items: FrozenSet[str]) -> bytes:
+    if not items:
+        return b""
+    return ", ".join(items).encode()
+
+
+def _get_encoded_value_for_max_age(max_age: int) -> bytes:
+    return str(max_age).encode()
+
+
+def _encode_set(items: FrozenSet[str]) -> FrozenSet[bytes]:
+    return frozenset(item.encode() for item in items)
+
+
 class CORSPolicy:
+    """
+    Describes a set of CORS rules. The values of the response headers described by
+    the policy are encoded once, when the policy is configured, rather than for each
+    web request.
+    """
+
     def __init__(
         self,
         *,
@@ -28,6 +48,12 @@ class CORSPolicy:
         self._allow_headers: FrozenSet[str]
         self._allow_origins: FrozenSet[str]
         self._expose_headers: FrozenSet[str]
+        self._encoded_max_age: bytes
+        self._encoded_allow_methods: bytes
+        self._encoded_expose_headers: bytes
+        self._allow_methods_bytes: FrozenSet[bytes]
+        self._allow_headers_bytes: FrozenSet[bytes]
+        self._allow_origins_bytes: FrozenSet[bytes]
         self.allow_methods = allow_methods or []
         self.allow_headers = allow_headers or []
         self.allow_origins = allow_origins or []
@@ -65,6 +91,8 @@ class CORSPolicy:
     @allow_methods.setter
     def allow_methods(self, value) -> None:
         self._allow_methods = self._normalize_set(value, str.upper)
+        self._allow_methods_bytes = _encode_set(self._allow_methods)
+        self._encoded_allow_methods = _get_encoded_value_for_set(self._allow_methods)
 
     @property
     def allow_headers(self) -> FrozenSet[str]:
@@ -73,6 +101,7 @@ class CORSPolicy:
     @allow_headers.setter
     def allow_headers(self, value) -> None:
         self._allow_headers = self._normalize_set(value, str.lower)
+        self._allow_headers_bytes = _encode_set(self._allow_headers)
 
     @property
     def allow_origins(self) -> FrozenSet[str]:
@@ -81,6 +110,7 @@ class CORSPolicy:
     @allow_origins.setter
     def allow_origins(self, value) -> None:
         self._allow_origins = self._normalize_set(value, str.lower)
+        self._allow_origins_bytes = _encode_set(self._allow_origins)
 
     @property
     def max_age(self) -> int:
@@ -92,6 +122,7 @@ class CORSPolicy:
         if int_value < 0:
             raise ValueError("max_age must be a positive number")
         self._max_age = int_value
+        self._encoded_max_age = _get_encoded_value_for_max_age(int_value)
 
     @property
     def expose_headers(self) -> FrozenSet[str]:
@@ -100,6 +131,7 @@ class CORSPolicy:
     @expose_headers.setter
     def expose_headers(self, value) -> None:
         self._expose_headers = self._normalize_set(value, str.lower)
+        self._encoded_expose_headers = _get_encoded_value_for_set(self._expose_headers)
 
     def allow_any_header(self) -> "CORSPolicy":
         self.allow_headers = frozenset("*")
@@ -135,11 +167,33 @@ class NotRequestHandlerError(CORSConfigurationError):
 
 
 class CORSStrategy:
-    def __init__(self, default_policy: CORSPolicy, router: Router) -> None:
+    """
+    Describes the CORS rules of an application, with a default policy and optional
+    policies bound to specific request handlers.
+
+    Responses to preflight requests are cached by origin, requested method, requested
+    headers and route, in a LRU cache having the given `preflight_cache_size`
+    (zero disables it). Policies must not be modified once the application started.
+    """
+
+    def __init__(
+        self,
+        default_policy: CORSPolicy,
+        router: Router,
+        *,
+        preflight_cache_size: int = 1000,
+    ) -> None:
         self.default_policy = default_policy
         self._router = router
         self._policies: dict[str, CORSPolicy] = {}
         self._policies_by_route: dict[Route, CORSPolicy] = {}
+        self._preflight_cache: LRUCache[
+            tuple[Route, bytes, bytes, bytes | None], list[tuple[bytes, bytes]]
+        ] = LRUCache(preflight_cache_size)
+
+    @property
+    def preflight_cache(self) -> LRUCache:
+        return self._preflight_cache
 
     @property
     def router(self) -> Router:
@@ -195,6 +249,8 @@ class CORSStrategy:
                     self._policies_by_route[route] = policy_object
                     is_match = True
 
+            self._preflight_cache.clear()
+
             if not is_match:
                 raise NotRequestHandlerError()
 
@@ -227,18 +283,6 @@ def _get_invalid_header_response(header_name: str) -> Response:
     )
 
 
-@lru_cache(maxsize=100)
-def _get_encoded_value_for_set(items: FrozenSet[str]) -> bytes:
-    if not items:
-        return b""
-    return ", ".join(items).encode()
-
-
-@lru_cache(maxsize=20)
-def _get_encoded_value_for_max_age(max_age: int) -> bytes:
-    return str(max_age).encode()
-
-
 def _set_cors_origin(response: Response, origin_response: bytes):
     """
     Sets a Access-Control-Allow-Origin to the given value, and a `Vary: Origin` header
@@ -250,10 +294,66 @@ def _set_cors_origin(response: Response, origin_response: bytes):
         response.add_header(b"Vary", b"Origin")
 
 
+_PREFLIGHT_HEADERS = (
+    b"Access-Control-Allow-Origin",
+    b"Vary",
+    b"Access-Control-Allow-Methods",
+    b"Access-Control-Allow-Headers",
+    b"Access-Control-Allow-Credentials",
+    b"Access-Control-Max-Age",
+)
+
+
+def _get_preflight_headers(response: Response) -> list[tuple[bytes, bytes]]:
+    return [
+        (name, value)
+        for name in _PREFLIGHT_HEADERS
+        for value in response.get_headers(name)
+    ]
+
+
+def _handle_preflight_request(
+    policy: CORSPolicy,
+    origin: bytes,
+    next_request_method: bytes,
+    next_request_headers: bytes | None,
+) -> Response:
+    if "*" not in policy.allow_origins and origin not in policy._allow_origins_bytes:
+        return _get_invalid_origin_response()
+
+    if (
+        "*" not in policy.allow_methods
+        and next_request_method not in policy._allow_methods_bytes
+    ):
+        return _get_invalid_method_response()
+
+    if next_request_headers and "*" not in policy.allow_headers:
+        for value in next_request_headers.split(b","):
+            header_name = value.strip()
+            if header_name.lower() not in policy._allow_headers_bytes:
+                return _get_invalid_header_response(header_name.decode())
+
+    response = ok()
+    # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Origin
+    _set_cors_origin(response, b"*" if "*" in policy.allow_origins else origin)
+    response.set_header(b"Access-Control-Allow-Methods", policy._encoded_allow_methods)
+
+    if next_request_headers:
+        response.set_header(b"Access-Control-Allow-Headers", next_request_headers)
+
+    if policy.allow_credentials:
+        response.set_header(b"Access-Control-Allow-Credentials", b"true")
+
+    response.set_header(b"Access-Control-Max-Age", policy._encoded_max_age)
+    return response
+
+
 def get_cors_middleware(
     app: BaseApplication,
     strategy: CORSStrategy,
 ) -> Callable[[Request, Callable[..., Any]], Awaitable[Response]]:
+    preflight_cache = strategy.preflight_cache
+
     async def cors_middleware(request: Request, handler):
         if isinstance(request, WebSocket):
             return await handler(request)
@@ -270,59 +370,43 @@ def get_cors_middleware(
         # instead of supporting only global CORS rules
         # this approach has the added value that destination routes are validated for
         # OPTIONS requests, instead of assuming a path is handled
+        # (routers cache their matches: the application reuses this lookup)
         route = strategy.router.get_matching_route(
-            next_request_method or request.method, request.url.path
+            next_request_method or request.method, request._path
         )
 
         if route is None:
             return not_found()
 
-        policy = strategy.get_policy_by_route_or_default(route)
-        allowed_methods = _get_encoded_value_for_set(policy.allow_methods)
-        expose_headers = _get_encoded_value_for_set(policy.expose_headers)
-        max_age = _get_encoded_value_for_max_age(policy.max_age)
-
-        if (
-            "*" not in policy.allow_origins
-            and origin.decode() not in policy.allow_origins
-        ):
-            return _get_invalid_origin_response()
-
-        # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Origin
-        origin_response = b"*" if "*" in policy.allow_origins else origin
-
         if next_request_method:
-            # This is a preflight request;
-            if (
-                "*" not in policy.allow_methods
-                and next_request_method.decode() not in policy.allow_methods
-            ):
-                return _get_invalid_method_response()
-
             next_request_headers = request.get_first_header(
                 b"Access-Control-Request-Headers"
             )
+            key = (route, origin, next_request_method, next_request_headers)
+            headers = preflight_cache.get(key)
 
-            if next_request_headers and "*" not in policy.allow_headers:
-                for value in next_request_headers.split(b","):
-                    str_value = value.strip().decode()
-                    if str_value.lower() not in policy.allow_headers:
-                        return _get_invalid_header_response(str_value)
+            if headers is not None:
+                return Response(200, headers.copy())
 
-            response = ok()
-            _set_cors_origin(response, origin_response)
-            response.set_header(b"Access-Control-Allow-Methods", allowed_methods)
+            policy = strategy.get_policy_by_route_or_default(route)
+            response = _handle_preflight_request(
+                policy, origin, next_request_method, next_request_headers
+            )
 
-            if next_request_headers:
-                response.set_header(
-                    b"Access-Control-Allow-Headers", next_request_headers
-                )
+            if response.status == 200:
+                preflight_cache.set(key, _get_preflight_headers(response))
+            return response
 
-            if policy.allow_credentials:
-                response.set_header(b"Access-Control-Allow-Credentials", b"true")
+        policy = strategy.get_policy_by_route_or_default(route)
 
-            response.set_header(b"Access-Control-Max-Age", max_age)
-            return response
+        if (
+            "*" not in policy.allow_origins
+            and origin not in policy._allow_origins_bytes
+        ):
+            return _get_invalid_origin_response()
+
+        # https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Access-Control-Allow-Origin
+        origin_response = b"*" if "*" in policy.allow_origins else origin
 
         # regular CORS request (non-preflight)
         if (
@@ -343,7 +427,9 @@ def get_cors_middleware(
             response = await app.handle_request_handler_exception(request, exc)
 
         _set_cors_origin(response, origin_response)
-        response.set_header(b"Access-Control-Expose-Headers", expose_headers)
+        response.set_header(
+            b"Access-Control-Expose-Headers", policy._encoded_expose_headers
+        )
         if policy.allow_credentials:
             response.set_header(b"Access-Control-Allow-Credentials", b"true")
 
@@ -228,7 +228,7 @@ class AntiForgeryHandler:
         this class also configures a matching cookie in the generated response, to send
         one of the two values that will be used to validate subsequent web requests.
         """
-        existing_cookie = request.cookies.get(self.cookie_name)
+        existing_cookie = request.get_cookie(self.cookie_name)
 
         if existing_cookie is not None and self.reuse_tokens_among_requests:
             # Do not generate new tokens for the same client. This is to support the
@@ -1,15 +1,26 @@
+import os
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import AsyncIterable, Callable, Set, TypedDict
 
-from blacksheep import Request, Response, StreamedContent
+from blacksheep import Content, FileContent, Request, Response, StreamedContent
 from blacksheep.common.files.asyncfs import FilesHandler
 from blacksheep.common.files.info import FileInfo
 from blacksheep.common.files.pathsutils import get_mime_type_from_name
 from blacksheep.exceptions import BadRequest, InvalidArgument, RangeNotSatisfiable
 from blacksheep.ranges import InvalidRangeValue, Range, RangePart
+from blacksheep.server.files.cache import CachedFile, HotFilesCache
 from blacksheep.server.headers.cache import CacheControlHeaderValue
+from blacksheep.server.headers.encoding import select_encoding
+
+# Extensions of the precompressed versions of static files, by content coding, in
+# order of preference: e.g. app.js.br, app.js.gz
+PRECOMPRESSED_EXTENSIONS: dict[bytes, str] = {
+    b"br": ".br",
+    b"zstd": ".zst",
+    b"gzip": ".gz",
+}
 
 
 class FilePathInfo(TypedDict):
@@ -35,7 +46,7 @@ class DefaultFileOptions:
             self.on_response(request, response)
 
 
-def _get_content_range_value(part: RangePart, file_size: int) -> bytes:
+def _get_range_part_bounds(part: RangePart, file_size: int) -> tuple[int, int]:
     start = part.start
     end = part.end
 
@@ -46,6 +57,11 @@ def _get_content_range_value(part: RangePart, file_size: int) -> bytes:
     if part.end is None:
         end = file_size - 1
 
+    return start, end
+
+
+def _get_content_range_value(part: RangePart, file_size: int) -> bytes:
+    start, end = _get_range_part_bounds(part, file_size)
     return b"bytes " + f"{start}-{end}/{file_size}".encode()
 
 
@@ -137,6 +153,71 @@ def get_file_getter(
     return file_getter
 
 
+def get_hot_file_getter(
+    hot_files: HotFilesCache,
+    file_path: str,
+    info: FileInfo,
+    encoding: bytes | None = None,
+    sidecars: tuple[bytes, ...] = (),
+) -> Callable[[], AsyncIterable[bytes]]:
+    async def file_getter():
+        yield await hot_files.load(file_path, info, encoding, sidecars)
+        yield b""
+
+    return file_getter
+
+
+def get_precompressed_sidecars(resource_path: str) -> tuple[bytes, ...]:
+    """
+    Returns the content codings of the precompressed versions of the given file that
+    exist next to it, in order of preference. This function reads the file system,
+    hence request handlers call it in a thread pool.
+    """
+    return tuple(
+        encoding
+        for encoding, extension in PRECOMPRESSED_EXTENSIONS.items()
+        if os.path.isfile(resource_path + extension)
+    )
+
+
+def _get_precompressed_file_info(
+    file_path: str, info: FileInfo, encoding: bytes
+) -> FileInfo:
+    sidecar_info = FileInfo.from_path(file_path)
+    # the representation differs from the original file, and so must its ETag;
+    # the media type is the one of the original file
+    return FileInfo(
+        sidecar_info.size,
+        sidecar_info.etag + "-" + encoding.decode(),
+        info.mime,
+        sidecar_info.modified_time,
+    )
+
+
+def _get_file_headers(
+    info: FileInfo,
+    cache_time: int,
+    encoding: bytes | None = None,
+    vary: bool = False,
+) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (b"Last-Modified", info.modified_time.encode()),
+        (b"ETag", info.etag.encode()),
+        (b"Accept-Ranges", b"bytes"),
+    ]
+
+    if cache_time > 0:
+        headers.append((b"Cache-Control", b"max-age=" + str(cache_time).encode()))
+
+    if vary:
+        headers.append((b"Vary", b"Accept-Encoding"))
+
+    if encoding is not None:
+        headers.append((b"Content-Encoding", encoding))
+
+    return headers
+
+
 def _get_requested_range(request: Request) -> Range | None:
     # http://svn.tools.ietf.org/svn/wg/httpbis/specs/rfc7233.html#rfc.section.3.1
     # A server must ignore a Range header field received with a request method
@@ -217,13 +298,13 @@ def get_response_for_file(
     resource_path: str,
     cache_time: int,
     info: FileInfo | None = None,
+    *,
+    precompressed: bool = False,
+    hot_files: HotFilesCache | None = None,
 ) -> Response:
     if info is None:
         info = FileInfo.from_path(resource_path)
 
-    current_etag = info.etag.encode()
-    previous_etag = request.if_none_match
-
     # is the client requesting a Range of bytes?
     # NB: ignored if not GET or unit cannot be handled
     requested_range = _get_requested_range(request)
@@ -231,14 +312,27 @@ def get_response_for_file(
     if requested_range:
         _validate_range(requested_range, info.size)
 
-    headers = [
-        (b"Last-Modified", info.modified_time.encode()),
-        (b"ETag", current_etag),
-        (b"Accept-Ranges", b"bytes"),
-    ]
+    file_path = resource_path
+    encoding: bytes | None = None
+    sidecars: tuple[bytes, ...] = ()
 
-    if cache_time > 0:
-        headers.append((b"Cache-Control", b"max-age=" + str(cache_time).encode()))
+    if precompressed:
+        sidecars = get_precompressed_sidecars(resource_path)
+
+        # NB: Range requests are always served using the original file
+        if sidecars and not requested_range:
+            encoding = select_encoding(
+                request.get_first_header(b"accept-encoding"), sidecars
+            )
+
+        if encoding is not None:
+            file_path = resource_path + PRECOMPRESSED_EXTENSIONS[encoding]
+            info = _get_precompressed_file_info(file_path, info, encoding)
+
+    current_etag = info.etag.encode()
+    previous_etag = request.if_none_match
+
+    headers = _get_file_headers(info, cache_time, encoding, bool(sidecars))
 
     if previous_etag and current_etag == previous_etag and not requested_range:
         # handle HTTP 304 Not Modified (only for non-range requests)
@@ -264,34 +358,130 @@ def get_response_for_file(
         # NB: the method can only be GET for range requests, so it cannot
         # happen to have response 206 partial content with HEAD
         status = 206
-        boundary: bytes | None
 
         if requested_range.is_multipart:
             # NB: multipart byteranges return the mime inside the portions
             boundary = str(uuid.uuid4()).replace("-", "").encode()
-            file_type = mime
-            mime = b"multipart/byteranges; boundary=" + boundary
+            content = StreamedContent(
+                b"multipart/byteranges; boundary=" + boundary,
+                get_range_file_getter(
+                    files_handler,
+                    resource_path,
+                    info.size,
+                    requested_range,
+                    boundary=boundary,
+                    file_type=mime,
+                ),
+            )
         else:
-            boundary = file_type = None
             single_part = requested_range.parts[0]
+            start, end = _get_range_part_bounds(single_part, info.size)
             headers.append(
                 (b"Content-Range", _get_content_range_value(single_part, info.size))
             )
-
+            content = FileContent(
+                mime,
+                resource_path,
+                get_range_file_getter(
+                    files_handler, resource_path, info.size, requested_range
+                ),
+                min(end, info.size - 1) - start + 1,
+                start,
+            )
+    elif hot_files is not None and hot_files.can_cache(info.size):
         content = StreamedContent(
             mime,
-            get_range_file_getter(
-                files_handler,
-                resource_path,
-                info.size,
-                requested_range,
-                boundary=boundary,
-                file_type=file_type,
-            ),
+            get_hot_file_getter(hot_files, file_path, info, encoding, sidecars),
+            info.size,
         )
     else:
-        content = StreamedContent(
-            mime, get_file_getter(files_handler, resource_path, info.size), info.size
+        content = FileContent(
+            mime,
+            file_path,
+            get_file_getter(files_handler, file_path, info.size),
+            info.size,
         )
 
     return Response(status, headers, content)
+
+
+def get_response_for_cached_file(
+    request: Request,
+    item: CachedFile,
+    cache_time: int,
+) -> Response:
+    """
+    Returns a response for a file kept in memory by a HotFilesCache.
+    """
+    info = item.info
+    headers = _get_file_headers(info, cache_time, item.encoding, bool(item.sidecars))
+    previous_etag = request.if_none_match
+
+    if previous_etag and info.etag.encode() == previous_etag:
+        return Response(304, headers, None)
+
+    if request.method == "HEAD":
+        headers.append((b"Content-Type", info.mime.encode()))
+        headers.append((b"Content-Length", str(info.size).encode()))
+        return Response(200, headers, None)
+
+    return Response(200, headers, Content(info.mime.encode(), item.data))
+
+
+async def get_hot_file_response(
+    request: Request,
+    hot_files: HotFilesCache,
+    resource_path: str,
+    cache_time: int,
+    precompressed: bool = False,
+) -> Response | None:
+    """
+    Returns a response for the file at the given path if it is kept in memory by the
+    given cache, choosing its precompressed version if supported by the client.
+    Returns None if the file is not cached, or if the request must be handled reading
+    the file from disk, like for Range requests.
+    """
+    if request.get_first_header(b"range"):
+        return None
+
+    item = await hot_files.get(resource_path)
+
+    if item is not None and item.encoding is not None:
+        # NB: precompressed versions are only served in place of original files
+        return None
+
+    if precompressed:
+        # NB: clients supporting compression might never request the original
+        # file, which is then not cached: in that case, the precompressed
+        # versions of the file are known from the cached ones
+        sidecars = (
+            item.sidecars
+            if item is not None
+            else _get_cached_sidecars(hot_files, resource_path)
+        )
+        encoding = (
+            select_encoding(request.get_first_header(b"accept-encoding"), sidecars)
+            if sidecars
+            else None
+        )
+
+        if encoding is not None:
+            item = await hot_files.get(
+                resource_path + PRECOMPRESSED_EXTENSIONS[encoding]
+            )
+
+    if item is None:
+        return None
+
+    return get_response_for_cached_file(request, item, cache_time)
+
+
+def _get_cached_sidecars(
+    hot_files: HotFilesCache, resource_path: str
+) -> tuple[bytes, ...]:
+    for extension in PRECOMPRESSED_EXTENSIONS.values():
+        item = hot_files.peek(resource_path + extension)
+
+        if item is not None:
+            return item.sidecars
+    return ()
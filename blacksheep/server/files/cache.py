@@ -0,0 +1,188 @@
+"""
+This module provides an in-memory cache of small files, used to serve frequently
+requested static files without reading them from disk for every request.
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+from blacksheep.common.files.info import FileInfo
+from blacksheep.utils.aio import get_running_loop
+
+
+class CachedFile:
+    """
+    Describes a file kept in memory by a `HotFilesCache`.
+    """
+
+    __slots__ = ("data", "info", "encoding", "sidecars", "mtime", "checked_at")
+
+    def __init__(
+        self,
+        data: bytes,
+        info: FileInfo,
+        mtime: float,
+        encoding: bytes | None = None,
+        sidecars: tuple[bytes, ...] = (),
+    ) -> None:
+        self.data = data
+        self.info = info
+        self.mtime = mtime
+        self.encoding = encoding
+        self.sidecars = sidecars
+        self.checked_at = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"<CachedFile {self.info!r} encoding={self.encoding!r}>"
+
+
+def _read_file(file_path: str) -> tuple[bytes, os.stat_result]:
+    with open(file_path, "rb") as file:
+        stat = os.fstat(file.fileno())
+        return file.read(), stat
+
+
+def _stat_file(file_path: str) -> os.stat_result | None:
+    try:
+        return os.stat(file_path)
+    except OSError:
+        return None
+
+
+class HotFilesCache:
+    """
+    A size-bounded cache of small files, which keeps in memory the bytes and the
+    metadata of the most recently used files. Cached files are served without disk
+    I/O; their modification time is verified, in a thread pool, at most once every
+    `check_interval` seconds.
+
+    Parameters
+    ----------
+    max_size: int
+        The maximum number of bytes kept in memory, by default 32 MiB.
+    max_file_size: int
+        The maximum size of the files that can be cached, by default 256 KiB.
+    check_interval: float
+        The number of seconds after which a cached file is revalidated, comparing its
+        modification time and its size with the ones on disk.
+    """
+
+    __slots__ = ("_items", "_size", "max_size", "max_file_size", "check_interval")
+
+    def __init__(
+        self,
+        max_size: int = 32 * 1024 * 1024,
+        max_file_size: int = 256 * 1024,
+        check_interval: float = 2.0,
+    ) -> None:
+        if max_size < 0 or max_file_size < 0:
+            raise ValueError("The cache sizes must be greater than or equal to zero")
+        if check_interval < 0:
+            raise ValueError("check_interval must be greater than or equal to zero")
+        self._items: OrderedDict[str, CachedFile] = OrderedDict()
+        self._size = 0
+        self.max_size = max_size
+        self.max_file_size = max_file_size
+        self.check_interval = check_interval
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bytes kept in memory."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._items
+
+    def can_cache(self, file_size: int) -> bool:
+        return file_size <= self.max_file_size and file_size <= self.max_size
+
+    def peek(self, file_path: str) -> CachedFile | None:
+        """
+        Returns the cached file for the given path, if it is cached, without
+        verifying it and without updating its position in the cache.
+        """
+        return self._items.get(file_path)
+
+    async def get(self, file_path: str) -> CachedFile | None:
+        """
+        Returns the cached file for the given path, if it is cached and it did not
+        change on disk since it was cached, otherwise None.
+        """
+        item = self._items.get(file_path)
+
+        if item is None:
+            return None
+
+        self._items.move_to_end(file_path)
+        now = time.monotonic()
+
+        if now - item.checked_at < self.check_interval:
+            return item
+
+        stat = await get_running_loop().run_in_executor(None, _stat_file, file_path)
+
+        if self._items.get(file_path) is not item:
+            # the item was replaced or removed while the file was checked
+            return self._items.get(file_path)
+
+        if (
+            stat is None
+            or stat.st_mtime != item.mtime
+            or stat.st_size != len(item.data)
+        ):
+            self.pop(file_path)
+            return None
+
+        item.checked_at = now
+        return item
+
+    async def load(
+        self,
+        file_path: str,
+        info: FileInfo,
+        encoding: bytes | None = None,
+        sidecars: tuple[bytes, ...] = (),
+    ) -> bytes:
+        """
+        Reads the file at the given path in a thread pool and stores it in the cache,
+        returning its bytes. The file is not cached if its size does not match the
+        given file information, which happens if it is modified while it is read.
+        """
+        data, stat = await get_running_loop().run_in_executor(
+            None, _read_file, file_path
+        )
+
+        if stat.st_size == len(data) == info.size:
+            self.set(
+                file_path, CachedFile(data, info, stat.st_mtime, encoding, sidecars)
+            )
+        return data
+
+    def set(self, file_path: str, item: CachedFile) -> None:
+        size = len(item.data)
+
+        if not self.can_cache(size):
+            return
+
+        self.pop(file_path)
+
+        while self._items and self._size + size > self.max_size:
+            _, evicted = self._items.popitem(last=False)
+            self._size -= len(evicted.data)
+
+        self._items[file_path] = item
+        self._size += size
+
+    def pop(self, file_path: str) -> CachedFile | None:
+        item = self._items.pop(file_path, None)
+        if item is not None:
+            self._size -= len(item.data)
+        return item
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._size = 0
@@ -6,6 +6,7 @@ from urllib.parse import unquote
 
 from blacksheep import HTMLContent, Request, Response
 from blacksheep.common.files.asyncfs import FilesHandler
+from blacksheep.common.files.info import FileInfo, FileInfoCache
 from blacksheep.common.files.pathsutils import get_file_extension_from_name
 from blacksheep.exceptions import NotFound
 from blacksheep.server.authorization import allow_anonymous
@@ -13,12 +14,15 @@ from blacksheep.server.files import (
     DefaultFileOptions,
     FilePathInfo,
     get_default_extensions,
+    get_hot_file_response,
     get_response_for_file,
     validate_source_path,
 )
+from blacksheep.server.files.cache import HotFilesCache
 from blacksheep.server.resources import get_resource_file_content
 from blacksheep.server.routing import Route, Router
 from blacksheep.utils import join_fragments
+from blacksheep.utils.aio import get_running_loop
 
 
 def get_files_to_serve(
@@ -114,6 +118,9 @@ def get_response_for_resource_path(
     root_path: str,
     index_document: str | None,
     default_file_options: DefaultFileOptions | None = None,
+    precompressed: bool = False,
+    hot_files: HotFilesCache | None = None,
+    info: FileInfo | None = None,
 ) -> Response:
     resource_path = os.path.join(source_folder_name, tail)
 
@@ -125,10 +132,12 @@ def get_response_for_resource_path(
             # outside of the static folder!
             raise NotFound()
 
-    if not os.path.exists(resource_path) or os.path.islink(resource_path):
-        raise NotFound()
+    # NB: if the file information is known, the path refers to a regular file
+    if info is None:
+        if not os.path.exists(resource_path) or os.path.islink(resource_path):
+            raise NotFound()
 
-    if os.path.isdir(resource_path):
+    if info is None and os.path.isdir(resource_path):
         # Request for a path that matches a folder: e.g. /foo/
         if discovery:
             # Use scope["root_path"] as the base_path: it carries the full mount
@@ -159,6 +168,8 @@ def get_response_for_resource_path(
                     extensions,
                     root_path,
                     None,
+                    precompressed=precompressed,
+                    hot_files=hot_files,
                 )
 
                 if default_file_options:
@@ -172,7 +183,15 @@ def get_response_for_resource_path(
     if file_extension not in extensions:
         raise NotFound()
 
-    return get_response_for_file(files_handler, request, resource_path, cache_time)
+    return get_response_for_file(
+        files_handler,
+        request,
+        resource_path,
+        cache_time,
+        info,
+        precompressed=precompressed,
+        hot_files=hot_files,
+    )
 
 
 def get_files_route_handler(
@@ -185,14 +204,41 @@ def get_files_route_handler(
     index_document: str | None,
     fallback_document: str | None,
     default_file_options: DefaultFileOptions | None = None,
+    precompressed: bool = False,
+    hot_files: HotFilesCache | None = None,
+    file_info_cache: FileInfoCache | None = None,
 ) -> Callable[[Request], Awaitable[Response]]:
     files_list_html = get_resource_file_content("fileslist.html")
     source_folder_full_path = os.path.abspath(str(source_folder_name))
+    index_path = (
+        os.path.join(source_folder_name, index_document)
+        if index_document and not discovery
+        else None
+    )
 
-    async def static_files_handler(request: Request) -> Response:
-        assert request.route_values is not None, "Expects a route pattern with star *"
-        tail = unquote(request.route_values.get("tail", "")).lstrip("/")
+    async def get_cached_response(request: Request, tail: str) -> Response | None:
+        # NB: the cache only contains files that were already served, hence
+        # validated, so no other check is necessary here
+        assert hot_files is not None
+        response = await get_hot_file_response(
+            request,
+            hot_files,
+            os.path.join(source_folder_name, tail),
+            cache_time,
+            precompressed,
+        )
+
+        if response is None and not tail and index_path is not None:
+            response = await get_hot_file_response(
+                request, hot_files, index_path, cache_time, precompressed
+            )
+
+            if response is not None and default_file_options:
+                default_file_options.handle(request, response)
+
+        return response
 
+    def get_response(request: Request, tail: str, info: FileInfo | None) -> Response:
         try:
             return get_response_for_resource_path(
                 request,
@@ -207,6 +253,9 @@ def get_files_route_handler(
                 root_path,
                 index_document,
                 default_file_options=default_file_options,
+                precompressed=precompressed,
+                hot_files=hot_files,
+                info=info,
             )
         except NotFound:
             if fallback_document is None:
@@ -225,6 +274,8 @@ def get_files_route_handler(
                 root_path,
                 None,
                 default_file_options=default_file_options,
+                precompressed=precompressed,
+                hot_files=hot_files,
             )
 
             if default_file_options and index_document == fallback_document:
@@ -232,6 +283,32 @@ def get_files_route_handler(
 
             return response
 
+    async def static_files_handler(request: Request) -> Response:
+        assert request.route_values is not None, "Expects a route pattern with star *"
+        tail = unquote(request.route_values.get("tail", "")).lstrip("/")
+
+        if hot_files is not None:
+            response = await get_cached_response(request, tail)
+
+            if response is not None:
+                return response
+
+        info = None
+
+        if file_info_cache is not None and "../" not in tail:
+            info = await file_info_cache.get_file_info(
+                os.path.join(source_folder_name, tail)
+            )
+
+        if precompressed:
+            # NB: looking for the precompressed versions of files requires reading
+            # the file system, hence responses are prepared in a thread pool
+            return await get_running_loop().run_in_executor(
+                None, get_response, request, tail, info
+            )
+
+        return get_response(request, tail, info)
+
     return static_files_handler
 
 
@@ -258,6 +335,9 @@ def serve_files_dynamic(
     fallback_document: str | None,
     anonymous_access: bool = True,
     default_file_options: DefaultFileOptions | None = None,
+    precompressed: bool = False,
+    hot_files: HotFilesCache | None = None,
+    file_info_cache: FileInfoCache | None = None,
 ) -> None:
     """
     Configures a route to serve files dynamically, using the given files handler and
@@ -284,6 +364,9 @@ def serve_files_dynamic(
         index_document,
         fallback_document,
         default_file_options,
+        precompressed,
+        hot_files,
+        file_info_cache,
     )
 
     if anonymous_access:
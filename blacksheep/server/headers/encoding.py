@@ -0,0 +1,56 @@
+"""
+This module provides functions to handle the negotiation of content codings, using
+the Accept-Encoding request header.
+"""
+
+from typing import Iterable
+
+
+def parse_accept_encoding(value: bytes) -> dict[bytes, float]:
+    """
+    Parses the value of an Accept-Encoding header, returning the quality value of each
+    content coding, by lowercase name.
+    For example: b"gzip;q=0.8, br" -> {b"gzip": 0.8, b"br": 1.0}
+    """
+    result: dict[bytes, float] = {}
+    for item in value.split(b","):
+        name, _, params = item.partition(b";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(b";"):
+            key, _, param_value = param.partition(b"=")
+            if key.strip().lower() == b"q":
+                try:
+                    quality = float(param_value.strip())
+                except ValueError:
+                    quality = 0.0
+        result[name] = quality
+    return result
+
+
+def select_encoding(
+    accept_encoding: bytes | None, available: Iterable[bytes]
+) -> bytes | None:
+    """
+    Returns the content coding with the highest quality value in the given
+    Accept-Encoding header, among the available ones, or None if the client does not
+    accept any of them. The order of the available codings is the order of preference
+    for equal quality values.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = parse_accept_encoding(accept_encoding)
+    default_quality = accepted.get(b"*", 0.0)
+    selected: bytes | None = None
+    selected_quality = 0.0
+
+    for name in available:
+        quality = accepted.get(name, default_quality)
+        if quality > selected_quality:
+            selected = name
+            selected_quality = quality
+
+    return selected
@@ -0,0 +1,184 @@
+"""
+This module provides a middleware that applies ETag headers to responses and handles
+conditional GET requests, answering with 304 Not Modified when the representation
+known by the client is still valid.
+"""
+
+import zlib
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+from blacksheep import Request, Response
+from blacksheep.server.normalization import ensure_response
+
+# Response headers that must be sent in 304 responses, when present, see RFC 9110
+NOT_MODIFIED_HEADERS = (
+    b"cache-control",
+    b"content-location",
+    b"date",
+    b"etag",
+    b"expires",
+    b"last-modified",
+    b"vary",
+)
+
+
+def get_body_etag(body: bytes) -> str:
+    """
+    Returns an entity tag for the given body, computed with a fast non-cryptographic
+    checksum combined with the length of the body.
+    """
+    return f"{len(body):x}-{zlib.crc32(body):08x}"
+
+
+def weaken_etag(value: bytes) -> bytes:
+    """
+    Returns a weak entity tag from the given entity tag. This is used for content
+    encodings of a representation, which are not byte-for-byte identical to it.
+    """
+    if value.startswith(b"W/"):
+        return value
+    return b"W/" + value
+
+
+def _get_opaque_tag(value: bytes) -> bytes:
+    value = value.strip()
+    if value.startswith(b"W/"):
+        return value[2:]
+    return value
+
+
+def etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """
+    Returns a value indicating whether the given If-None-Match header value matches
+    the given entity tag, using the weak comparison required by RFC 9110.
+    """
+    if if_none_match.strip() == b"*":
+        return True
+
+    opaque_tag = _get_opaque_tag(etag)
+    return any(
+        _get_opaque_tag(value) == opaque_tag for value in if_none_match.split(b",")
+    )
+
+
+def is_not_modified(request: Request, response: Response) -> bool:
+    """
+    Returns a value indicating whether the representation known by the client that
+    sent the given request is still valid, according to the ETag and Last-Modified
+    headers of the given response.
+    """
+    if_none_match = request.if_none_match
+
+    if if_none_match is not None:
+        etag = response.get_first_header(b"etag")
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    # If-Modified-Since is ignored when If-None-Match is present
+    if_modified_since = request.get_first_header(b"if-modified-since")
+
+    if if_modified_since is None:
+        return False
+
+    last_modified = response.get_first_header(b"last-modified")
+
+    if last_modified is None:
+        return False
+
+    try:
+        return parsedate_to_datetime(last_modified.decode()) <= parsedate_to_datetime(
+            if_modified_since.decode()
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def get_not_modified_response(response: Response) -> Response:
+    """
+    Returns a 304 Not Modified response for the given response, keeping only the
+    headers that describe its representation.
+    """
+    return Response(
+        304,
+        [
+            (name, value)
+            for name in NOT_MODIFIED_HEADERS
+            for value in response.get_headers(name)
+        ],
+        None,
+    )
+
+
+class ETagMiddleware:
+    """
+    Applies ETag headers to successful responses to GET and HEAD requests, and
+    answers with 304 Not Modified to conditional requests whose If-None-Match or
+    If-Modified-Since headers match the response, without sending its body.
+
+    ETags are computed from the body of buffered responses not bigger than
+    `max_body_size`. Request handlers can provide their own validators setting
+    ETag or Last-Modified headers, which are used as they are, including for
+    streamed responses.
+
+    Parameters
+    ----------
+    max_body_size: int
+        The maximum size of the bodies for which ETags are computed, by default 1 MiB.
+    weak: bool
+        Whether computed ETags are weak validators, by default false.
+    etag_generator: Callable[[bytes], str] | None
+        An optional function that returns an entity tag for a body, without quotes.
+        By default, `get_body_etag`.
+    """
+
+    def __init__(
+        self,
+        max_body_size: int = 1024 * 1024,
+        weak: bool = False,
+        etag_generator: Callable[[bytes], str] | None = None,
+    ) -> None:
+        self.max_body_size = max_body_size
+        self.weak = weak
+        self.etag_generator = etag_generator or get_body_etag
+
+    def should_handle(self, request: Request, response: Response) -> bool:
+        """
+        Returns a value indicating whether conditional requests should be handled for
+        the given response object, that was created for the given request.
+        """
+        return request.method in {"GET", "HEAD"} and response.status == 200
+
+    def get_etag(self, response: Response) -> bytes | None:
+        """
+        Returns an ETag header value for the given response, if its body is buffered
+        and not bigger than the configured maximum size.
+        """
+        content = response.content
+
+        if content is None or content.body is None:
+            return None
+
+        if len(content.body) > self.max_body_size:
+            return None
+
+        value = f'"{self.etag_generator(content.body)}"'.encode()
+        return b"W/" + value if self.weak else value
+
+    async def __call__(
+        self, request: Request, handler: Callable[[Request], Awaitable[Response]]
+    ) -> Response | None:
+        response = ensure_response(await handler(request))
+
+        if response is None or not self.should_handle(request, response):
+            return response
+
+        if not response.has_header(b"etag"):
+            etag = self.get_etag(response)
+
+            if etag is not None:
+                response.add_header(b"etag", etag)
+
+        if is_not_modified(request, response):
+            return get_not_modified_response(response)
+
+        return response
@@ -0,0 +1,69 @@
+"""
+This module provides functions to limit the size of request bodies, for the whole
+application, for request handlers, and for body binders.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable
+
+from blacksheep.contents import ASGIContent
+from blacksheep.exceptions import PayloadTooLarge
+from blacksheep.messages import Request, Response
+
+
+def max_body_size(value: int | None) -> Callable[..., Any]:
+    """
+    Configures the maximum size of the body of requests handled by a decorated
+    request handler, in bytes, overriding the limit configured for the application.
+    Use None to remove the limit for the request handler.
+    """
+    if value is not None and value < 0:
+        raise ValueError("The maximum body size must be greater than or equal to 0.")
+
+    def decorator(f):
+        f.max_body_size = value
+        return f
+
+    return decorator
+
+
+def _get_content_length(request: Request) -> int | None:
+    value = request.get_first_header(b"content-length")
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def apply_body_size_limit(request: Request, max_size: int | None) -> None:
+    """
+    Applies the given size limit to the body of the given request. If the request
+    declares a longer Content-Length, PayloadTooLarge is raised immediately, without
+    receiving the body; otherwise the limit is enforced while the body is received.
+    """
+    if max_size is not None:
+        content_length = _get_content_length(request)
+        if content_length is not None and content_length > max_size:
+            raise PayloadTooLarge()
+
+    content = request.content
+    if isinstance(content, ASGIContent):
+        content.max_size = max_size
+
+
+def get_body_size_limit_handler(
+    handler: Callable[[Request], Awaitable[Response]], max_size: int | None
+) -> Callable[[Request], Awaitable[Response]]:
+    """
+    Returns a request handler that applies the given size limit to the body of
+    requests, before calling the given handler.
+    """
+
+    @wraps(handler)
+    async def body_size_limit_handler(request: Request) -> Response:
+        apply_body_size_limit(request, max_size)
+        return await handler(request)
+
+    return body_size_limit_handler
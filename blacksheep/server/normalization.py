@@ -25,6 +25,7 @@ from blacksheep.normalization import copy_special_attributes
 from blacksheep.server import responses
 from blacksheep.server.routing import Route
 from blacksheep.server.sse import ServerSentEvent, ServerSentEventsResponse
+from blacksheep.server.threadpool import SyncHandlersExecutor
 from blacksheep.server.websocket import WebSocket
 
 from .bindings import (
@@ -42,6 +43,7 @@ from .bindings import (
     empty,
     get_binder_by_type,
 )
+from .bindings.decoders import get_typed_json_decoder
 
 _next_handler_binder = object()
 
@@ -357,6 +359,15 @@ def _get_multi_body_union_args(annotation: Any) -> "list | None":
     return non_none
 
 
+def _configure_body_binder(binder: BodyBinder, annotation: Type[BoundValue]) -> None:
+    binder.max_body_size = annotation.max_body_size
+
+    if isinstance(binder, JSONBinder) and getattr(annotation, "typed_decoding", False):
+        # the decoder is compiled once for the request handler; if neither msgspec
+        # nor Pydantic support the expected type, the body is parsed and converted
+        binder.json_decoder = get_typed_json_decoder(binder.expected_type)
+
+
 def _build_multi_format_binder(
     args: list, name: str, required: bool
 ) -> MultiFormatBodyBinder:
@@ -365,7 +376,9 @@ def _build_multi_format_binder(
     for arg in args:
         binder_cls = get_binder_by_type(arg)
         expected_type = _get_bound_value_type(arg)
-        inner_binders.append(binder_cls(expected_type, name, False, required))
+        inner_binder = binder_cls(expected_type, name, False, required)
+        _configure_body_binder(inner_binder, arg)
+        inner_binders.append(inner_binder)
     return MultiFormatBodyBinder(
         inner_binders,
         inner_binders[0].expected_type,
@@ -450,6 +463,9 @@ def _get_parameter_binder(
         if isinstance(binder, ServiceBinder):
             binder.services = services
 
+        if isinstance(binder, BodyBinder):
+            _configure_body_binder(binder, annotation)
+
         return binder
 
     # 2. does route contain a parameter with matching name?
@@ -518,6 +534,52 @@ def _get_binders_for_function(
     return binders
 
 
+class BindingPlan:
+    """
+    Describes how the parameters of a request handler are read from requests,
+    compiled once when the request handler is normalized. Binders that can read values
+    synchronously, like route, query, header, cookie and service binders, are called
+    without creating coroutines; the others, like body binders, are awaited after them.
+    """
+
+    __slots__ = ("size", "sync_getters", "async_getters")
+
+    def __init__(self, binders: Sequence[Binder]) -> None:
+        self.size = len(binders)
+        self.sync_getters: list[tuple[int, Callable[[Request], Any]]] = []
+        self.async_getters: list[tuple[int, Callable[[Request], Awaitable[Any]]]] = []
+
+        for index, binder in enumerate(binders):
+            if binder.is_sync:
+                self.sync_getters.append((index, binder.get_parameter_sync))
+            else:
+                self.async_getters.append((index, binder.get_parameter))
+
+    @property
+    def is_sync(self) -> bool:
+        """Returns a value indicating whether all parameters are read synchronously."""
+        return not self.async_getters
+
+    def bind_sync(self, request: Request) -> list[Any]:
+        """
+        Returns the parameters for the given request, when all of them are read
+        synchronously.
+        """
+        return [getter(request) for _, getter in self.sync_getters]
+
+    async def bind(self, request: Request) -> list[Any]:
+        """Returns the parameters for the given request."""
+        values: list[Any] = [None] * self.size
+
+        for index, getter in self.sync_getters:
+            values[index] = getter(request)
+
+        for index, getter in self.async_getters:
+            values[index] = await getter(request)
+
+        return values
+
+
 def get_binders(route: Route, services: ContainerProtocol) -> list[Binder]:
     """
     Returns a list of binders to extract parameters
@@ -537,18 +599,19 @@ def get_binders_for_middleware(
 def _get_sync_wrapper_for_controller(
     binders: Sequence[Binder], method: Callable[..., Any]
 ) -> Callable[[Request], Awaitable[Response]]:
+    plan = BindingPlan(binders[1:])
+
     @wraps(method)
     async def handler(request):
-        values = []
         controller = await binders[0].get_value(request)
         await controller.on_request(request)
 
-        values.append(controller)
-
-        for binder in binders[1:]:
-            values.append(await binder.get_parameter(request))
+        if plan.is_sync:
+            values = plan.bind_sync(request)
+        else:
+            values = await plan.bind(request)
 
-        response = method(*values)
+        response = method(controller, *values)
         await controller.on_response(response)
         return response
 
@@ -558,18 +621,19 @@ def _get_sync_wrapper_for_controller(
 def _get_async_wrapper_for_controller(
     binders: Sequence[Binder], method: Callable[..., Any]
 ) -> Callable[[Request], Awaitable[Response]]:
+    plan = BindingPlan(binders[1:])
+
     @wraps(method)
     async def handler(request):
-        values = []
         controller = await binders[0].get_value(request)
         await controller.on_request(request)
 
-        values.append(controller)
-
-        for binder in binders[1:]:
-            values.append(await binder.get_parameter(request))
+        if plan.is_sync:
+            values = plan.bind_sync(request)
+        else:
+            values = await plan.bind(request)
 
-        response = await method(*values)
+        response = await method(controller, *values)
         await controller.on_response(response)
         return response
 
@@ -579,18 +643,19 @@ def _get_async_wrapper_for_controller(
 def _get_async_wrapper_for_controller_asyncgen(
     response_type, binders: Sequence[Binder], method: Callable[..., Any]
 ) -> Callable[[Request], Awaitable[Response]]:
+    plan = BindingPlan(binders[1:])
+
     @wraps(method)
     async def handler(request):
-        values = []
         controller = await binders[0].get_value(request)
         await controller.on_request(request)
 
-        values.append(controller)
-
-        for binder in binders[1:]:
-            values.append(await binder.get_parameter(request))
+        if plan.is_sync:
+            values = plan.bind_sync(request)
+        else:
+            values = await plan.bind(request)
 
-        response = response_type(partial(method, *values))
+        response = response_type(partial(method, controller, *values))
         await controller.on_response(response)
         return response
 
@@ -623,14 +688,43 @@ def get_sync_wrapper(
     if isinstance(binders[0], ControllerBinder):
         return _get_sync_wrapper_for_controller(binders, method)
 
+    plan = BindingPlan(binders)
+
+    if plan.is_sync:
+        bind_sync = plan.bind_sync
+
+        @wraps(method)
+        async def handler(request):
+            return method(*bind_sync(request))
+
+        return handler
+
+    bind = plan.bind
+
     @wraps(method)
     async def handler(request):
-        values = [await binder.get_parameter(request) for binder in binders]
-        return method(*values)
+        return method(*(await bind(request)))
 
     return handler
 
 
+def _get_thread_pool_wrapper(
+    method: Callable[..., Any], executor: SyncHandlersExecutor
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Returns an asynchronous function that calls the given synchronous request handler
+    in the given executor, so that it can be normalized like asynchronous request
+    handlers, binding input parameters in the event loop.
+    """
+    run = executor.run
+
+    @wraps(method)
+    async def thread_pool_handler(*args):
+        return await run(method, *args)
+
+    return thread_pool_handler
+
+
 def get_async_wrapper(
     services: ContainerProtocol,
     route: Route,
@@ -665,10 +759,22 @@ def get_async_wrapper(
     if isinstance(binders[0], ControllerBinder):
         return _get_async_wrapper_for_controller(binders, method)
 
+    plan = BindingPlan(binders)
+
+    if plan.is_sync:
+        bind_sync = plan.bind_sync
+
+        @wraps(method)
+        async def handler(request):
+            return await method(*bind_sync(request))
+
+        return handler
+
+    bind = plan.bind
+
     @wraps(method)
     async def handler(request):
-        values = [await binder.get_parameter(request) for binder in binders]
-        return await method(*values)
+        return await method(*(await bind(request)))
 
     return handler
 
@@ -714,9 +820,14 @@ def get_async_wrapper_for_asyncgen(
             response_type, binders, method
         )
 
+    plan = BindingPlan(binders)
+
     @wraps(method)
     async def handler(request):
-        values = [await binder.get_parameter(request) for binder in binders]
+        if plan.is_sync:
+            values = plan.bind_sync(request)
+        else:
+            values = await plan.bind(request)
         return response_type(partial(method, *values))
 
     return handler
@@ -761,7 +872,10 @@ def _is_wrapped_function(func):
 
 
 def normalize_handler(
-    route: Route, services: ContainerProtocol, http_method: str = ""
+    route: Route,
+    services: ContainerProtocol,
+    http_method: str = "",
+    executor: SyncHandlersExecutor | None = None,
 ) -> Callable[[Request], Awaitable[Response]]:
     """
     Root function used to normalize a request handler. The objective of this function is
@@ -772,6 +886,9 @@ def normalize_handler(
     avoids performance fees when handling requests). If a request handler
     instead has an arbitrary signature, it is wrapped inside a normal request handler
     (`async def handler(request) -> Response: ...`).
+
+    If an executor is specified, synchronous request handlers are called in its pool
+    of threads.
     """
     method = route.handler
 
@@ -806,6 +923,14 @@ def normalize_handler(
         normalized = get_async_wrapper_for_asyncgen(
             response_type, services, route, method, params, params_len
         )
+    elif executor is not None:
+        normalized = get_async_wrapper(
+            services,
+            route,
+            _get_thread_pool_wrapper(method, executor),
+            params,
+            params_len,
+        )
     else:
         normalized = get_sync_wrapper(services, route, method, params, params_len)
 
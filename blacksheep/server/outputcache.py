@@ -0,0 +1,414 @@
+"""
+This module provides a server-side output cache, which stores the responses of
+request handlers and serves them without executing handlers again, until they
+expire or they are evicted by tag.
+
+Unlike the Cache-Control features in `blacksheep.server.headers.cache`, which only
+instruct clients and proxies, the output cache stores responses in the server.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Sequence
+from urllib.parse import urlencode
+
+from blacksheep import Content, Request, Response
+from blacksheep.server.application import Application
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+
+
+class CachedResponse:
+    """
+    Describes a response stored in an output cache. It contains only simple types,
+    so that it can be serialized by stores that keep responses out of process.
+    """
+
+    __slots__ = ("status", "headers", "content_type", "body", "expires_at", "tags")
+
+    def __init__(
+        self,
+        status: int,
+        headers: list[tuple[bytes, bytes]],
+        content_type: bytes | None,
+        body: bytes | None,
+        expires_at: float,
+        tags: Sequence[str] = (),
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.content_type = content_type
+        self.body = body
+        self.expires_at = expires_at
+        self.tags = tuple(tags)
+
+    def __repr__(self) -> str:
+        return f"<CachedResponse {self.status} expires_at={self.expires_at}>"
+
+    def is_expired(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) >= self.expires_at
+
+    def to_response(self) -> Response:
+        """Returns a new response object from this cached response."""
+        content = (
+            Content(self.content_type, self.body)
+            if self.content_type is not None and self.body is not None
+            else None
+        )
+        return Response(self.status, list(self.headers), content)
+
+
+class OutputCacheStore(ABC):
+    """
+    Base class for output cache stores. Implement this class to store responses out
+    of process, for example in Redis, to share them among several processes.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> CachedResponse | None:
+        """
+        Returns the response stored with the given key, if any and not expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, item: CachedResponse, ttl: float) -> None:
+        """
+        Stores a response with the given key, for the given number of seconds.
+        """
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Removes the response stored with the given key, if any."""
+
+    @abstractmethod
+    async def evict_by_tag(self, tag: str) -> None:
+        """Removes all the responses stored with the given tag."""
+
+
+class InMemoryOutputCacheStore(OutputCacheStore):
+    """
+    Stores responses in memory, in a LRU cache that keeps at most `max_entries`
+    responses, discarding the least recently used responses when it is full.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be greater than or equal to zero")
+        self._items: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self.max_entries = max_entries
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._items
+
+    async def get(self, key: str) -> CachedResponse | None:
+        item = self._items.get(key)
+
+        if item is None:
+            return None
+
+        if item.is_expired():
+            self._pop(key)
+            return None
+
+        self._items.move_to_end(key)
+        return item
+
+    async def set(self, key: str, item: CachedResponse, ttl: float) -> None:
+        if self.max_entries == 0:
+            return
+
+        self._pop(key)
+
+        while len(self._items) >= self.max_entries:
+            self._pop(next(iter(self._items)))
+
+        self._items[key] = item
+        for tag in item.tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+    async def remove(self, key: str) -> None:
+        self._pop(key)
+
+    async def evict_by_tag(self, tag: str) -> None:
+        for key in self._tags.pop(tag, ()):
+            self._pop(key)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._tags.clear()
+
+    def _pop(self, key: str) -> None:
+        item = self._items.pop(key, None)
+
+        if item is None:
+            return
+
+        for tag in item.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class OutputCachePolicy:
+    """
+    Describes how the responses of request handlers are stored in an output cache.
+
+    Parameters
+    ----------
+    duration: float
+        The number of seconds for which responses are stored.
+    vary_by_query: Sequence[str] | None
+        The names of the query parameters used to build cache keys. By default, the
+        whole query string is used; pass an empty sequence to ignore it.
+    vary_by_headers: Sequence[str]
+        The names of the request headers used to build cache keys.
+    vary_by_user: bool
+        Whether responses are stored by user. By default, responses are not stored
+        for authenticated users; when this parameter is true, they are stored using
+        the `sub` claim of each user.
+    tags: Sequence[str]
+        Tags applied to stored responses, to evict them with
+        `OutputCacheStore.evict_by_tag`.
+    statuses: Iterable[int]
+        The status codes of the responses that can be stored, by default only 200.
+    """
+
+    def __init__(
+        self,
+        duration: float = 60,
+        *,
+        vary_by_query: Sequence[str] | None = None,
+        vary_by_headers: Sequence[str] = (),
+        vary_by_user: bool = False,
+        tags: Sequence[str] = (),
+        statuses: Iterable[int] = (200,),
+    ) -> None:
+        if duration <= 0:
+            raise ValueError("duration must be greater than zero")
+        self.duration = duration
+        self.vary_by_query = (
+            None if vary_by_query is None else tuple(sorted(vary_by_query))
+        )
+        self.vary_by_headers = tuple(
+            sorted(header.lower().encode() for header in vary_by_headers)
+        )
+        self.vary_by_user = vary_by_user
+        self.tags = tuple(tags)
+        self.statuses = frozenset(statuses)
+
+    def get_key(self, request: Request) -> str | None:
+        """
+        Returns the cache key for the given request, or None if the response for the
+        request must not be stored.
+        """
+        user = request.user
+
+        if self.vary_by_user:
+            if user.is_authenticated() and not user.sub:
+                return None
+            identity = user.sub or ""
+        elif user.is_authenticated():
+            return None
+        else:
+            identity = ""
+
+        url = request.url
+        path = url.path.decode("latin-1")
+
+        if self.vary_by_query is None:
+            query = url.query.decode("latin-1") if url.query else ""
+        elif self.vary_by_query:
+            parameters = request.query
+            query = urlencode(
+                [
+                    (name, value)
+                    for name in self.vary_by_query
+                    for value in parameters.get(name, ())
+                ]
+            )
+        else:
+            query = ""
+
+        parts = [request.method, path, query]
+
+        for header in self.vary_by_headers:
+            parts.append(
+                b",".join(request.get_headers(header)).decode("latin-1"),
+            )
+
+        parts.append(identity)
+        return "\n".join(parts)
+
+    def can_store(self, response: Response) -> bool:
+        """
+        Returns a value indicating whether the given response can be stored. Responses
+        that set cookies, that are streamed, or that forbid storing are not stored.
+        """
+        if response.status not in self.statuses:
+            return False
+
+        if response.has_header(b"set-cookie"):
+            return False
+
+        cache_control = response.get_first_header(b"cache-control")
+        if cache_control is not None and b"no-store" in cache_control.lower():
+            return False
+
+        content = response.content
+        return content is None or content.body is not None
+
+    def get_cached_response(self, response: Response) -> CachedResponse:
+        content = response.content
+        return CachedResponse(
+            response.status,
+            list(response.headers.items()),
+            content.type if content is not None else None,
+            bytes(content.body) if content is not None else None,
+            time.time() + self.duration,
+            self.tags,
+        )
+
+
+def output_cache(
+    duration: float = 60,
+    *,
+    vary_by_query: Sequence[str] | None = None,
+    vary_by_headers: Sequence[str] = (),
+    vary_by_user: bool = False,
+    tags: Sequence[str] = (),
+    statuses: Iterable[int] = (200,),
+) -> Callable[..., Any]:
+    """
+    Configures the output cache for a decorated request handler. This decorator
+    requires the `OutputCacheMiddleware`, see `use_output_cache`.
+
+    See `OutputCachePolicy` for the description of the parameters.
+    """
+    policy = OutputCachePolicy(
+        duration,
+        vary_by_query=vary_by_query,
+        vary_by_headers=vary_by_headers,
+        vary_by_user=vary_by_user,
+        tags=tags,
+        statuses=statuses,
+    )
+
+    def decorator(f):
+        f.output_cache = policy
+        return f
+
+    return decorator
+
+
+def no_output_cache() -> Callable[..., Any]:
+    """
+    Disables the output cache for a decorated request handler, when the output cache
+    is configured globally.
+    """
+
+    def decorator(f):
+        f.output_cache = None
+        return f
+
+    return decorator
+
+
+class OutputCacheMiddleware:
+    """
+    Serves the responses stored in an output cache for GET and HEAD requests. Request
+    handlers decorated with `output_cache` use their own policy, the others use the
+    default policy, if any. Concurrent requests with the same cache key are coalesced:
+    only one of them executes the request handler, and the others wait for its
+    response.
+
+    Parameters
+    ----------
+    store: OutputCacheStore | None
+        The store of cached responses, by default an `InMemoryOutputCacheStore`.
+    policy: OutputCachePolicy | None
+        The default policy, used for all request handlers not decorated with
+        `output_cache`. If not specified, only decorated request handlers are cached.
+    """
+
+    def __init__(
+        self,
+        store: OutputCacheStore | None = None,
+        policy: OutputCachePolicy | None = None,
+    ) -> None:
+        self.store = store if store is not None else InMemoryOutputCacheStore()
+        self.policy = policy
+        self._pending: dict[str, asyncio.Future] = {}
+
+    def get_policy(self, request: Request, handler) -> OutputCachePolicy | None:
+        if request.method not in CACHEABLE_METHODS:
+            return None
+        return getattr(handler, "output_cache", self.policy)
+
+    async def __call__(self, request: Request, handler):
+        policy = self.get_policy(request, handler)
+
+        if policy is None:
+            return await handler(request)
+
+        key = policy.get_key(request)
+
+        if key is None:
+            return await handler(request)
+
+        item = await self.store.get(key)
+
+        if item is not None and not item.is_expired():
+            return item.to_response()
+
+        pending = self._pending.get(key)
+
+        if pending is not None:
+            # another request is executing the request handler for the same key
+            item = await asyncio.shield(pending)
+            if item is not None:
+                return item.to_response()
+            return await handler(request)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        item = None
+
+        try:
+            response = await handler(request)
+
+            if policy.can_store(response):
+                item = policy.get_cached_response(response)
+                await self.store.set(key, item, policy.duration)
+        finally:
+            del self._pending[key]
+            future.set_result(item)
+
+        return response
+
+
+def use_output_cache(
+    app: Application,
+    handler: OutputCacheMiddleware | None = None,
+) -> OutputCacheMiddleware:
+    """
+    Configures the application to store the responses of request handlers in an
+    output cache. The store of the output cache is registered in the application
+    services, so that request handlers can evict responses by tag.
+    """
+    if handler is None:
+        handler = OutputCacheMiddleware()
+
+    app.middlewares.append(handler)  # type: ignore
+
+    if OutputCacheStore not in app.services:
+        app.services.register(OutputCacheStore, instance=handler.store)
+
+    return handler
@@ -4,7 +4,14 @@ from functools import lru_cache
 from io import BytesIO
 from typing import Any, AnyStr, AsyncIterable, Callable
 
-from blacksheep import Content, JSONContent, Response, StreamedContent, TextContent
+from blacksheep import (
+    Content,
+    FileContent,
+    JSONContent,
+    Response,
+    StreamedContent,
+    TextContent,
+)
 from blacksheep.common.files.asyncfs import FilesHandler
 from blacksheep.settings.html import html_settings
 from blacksheep.settings.json import json_settings
@@ -32,12 +39,8 @@ def _ensure_bytes(value: AnyStr) -> bytes:
     raise ValueError("Input value must be bytes or str")
 
 
-def _json_serialize(obj) -> str:
-    return json_settings.dumps(obj)
-
-
 def _json_content(obj) -> JSONContent:
-    return JSONContent(obj, _json_serialize)
+    return JSONContent(obj)
 
 
 def _optional_content(message: Any = None) -> Content:
@@ -196,7 +199,7 @@ def json(data: Any, status: int = 200) -> Response:
         None,
         Content(
             b"application/json",
-            json_settings.dumps(data).encode("utf8"),
+            json_settings.dumps_bytes(data),
         ),
     )
 
@@ -257,7 +260,7 @@ def _file(
 
     if isinstance(value, str):
         # value is treated as a path
-        content = StreamedContent(content_type_value, _get_file_provider(value))
+        content = FileContent(content_type_value, value, _get_file_provider(value))
     elif isinstance(value, BytesIO):
 
         async def data_provider():
@@ -1,9 +1,9 @@
 import inspect
 import logging
 import re
+import sys
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from functools import lru_cache
+from collections import OrderedDict, defaultdict
 from typing import (
     Any,
     AnyStr,
@@ -177,7 +177,7 @@ class ParamsFilter(RouteFilter):
 
     def handle(self, request: Request) -> bool:
         for key, value in self.required_params:
-            query = request.query.get(key)
+            query = request.get_query_values(key)
             if query is not None and len(query) == 1 and query[0] == value:
                 continue
             if query != value:
@@ -705,6 +705,378 @@ class RouterFiltersMixin:
         return RouteMatch(self._fallback, None)
 
 
+_MISSING = object()
+
+
+class RouteMatchCache:
+    """
+    Caches the results of route lookups of a Router, by HTTP method and request path.
+
+    Requests for static routes that use the exact pattern of the route are stored in
+    a dictionary, which is bounded by the number of static routes. All other results
+    are stored in a LRU cache of limited size, so that paths with a high cardinality,
+    like `/orders/{id}`, cannot evict the results for hot static routes.
+    """
+
+    __slots__ = ("_static", "_dynamic", "_maxsize", "hits", "misses")
+
+    def __init__(self, maxsize: int = 1200) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater than or equal to zero")
+        self._static: dict[tuple[bytes, bytes], Any] = {}
+        self._dynamic: OrderedDict[tuple[bytes, bytes], Any] = OrderedDict()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._static) + len(self._dynamic)
+
+    def get(self, method: bytes, path: bytes) -> Any:
+        """
+        Returns the cached value for the given method and path, or `_MISSING` if no
+        value is cached for them.
+        """
+        key = (method, path)
+        try:
+            value = self._static[key]
+        except KeyError:
+            try:
+                value = self._dynamic[key]
+            except KeyError:
+                self.misses += 1
+                return _MISSING
+            self._dynamic.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        method: bytes,
+        path: bytes,
+        value: tuple[Route, RouteMatch] | None,
+    ) -> None:
+        key = (method, path)
+        if value is not None and value[0].pattern == path and not value[0].has_params:
+            self._static[key] = value
+            return
+
+        if self._maxsize == 0:
+            return
+
+        self._dynamic[key] = value
+        if len(self._dynamic) > self._maxsize:
+            self._dynamic.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached values. Hits and misses counters are kept."""
+        self._static.clear()
+        self._dynamic.clear()
+
+
+class RoutesMatcher(ABC):
+    """
+    Base class for objects that find the first route matching a request path, among
+    the routes configured for an HTTP method. Implementations must preserve the
+    precedence given by the order of the routes (see `Router.sort_routes`).
+    """
+
+    def __init__(self, routes: list[Route]) -> None:
+        self.routes = routes
+
+    @abstractmethod
+    def lookup(self, path: bytes) -> tuple[Route, dict[str, bytes] | None] | None:
+        """
+        Returns the first route matching the given path, with the raw values of its
+        route parameters, or None if no route matches the path.
+        """
+
+
+_trie_param_rx = re.compile(
+    rb"^(?:\{(?:(\w+):)?(\w+)\}|<(?:(\w+):)?(\w+)>|:(\w+))$", re.IGNORECASE
+)
+_trie_static_unsafe_chars = frozenset(b"^$*+?{}\\|<>:")
+
+# value patterns that never match a "/", and can therefore be matched one segment
+# at a time; other value patterns (e.g. "path") are matched using the route regex
+_trie_segment_value_patterns = {"string", "str", "int", "float", "uuid"}
+
+
+class _TrieNode:
+    __slots__ = ("static", "params", "compiled_params", "routes", "tails", "min_index")
+
+    def __init__(self) -> None:
+        self.static: dict[bytes, "_TrieNode"] = {}
+        self.params: dict[bytes | None, "_TrieNode"] = {}
+        self.compiled_params: list[tuple[re.Pattern | None, "_TrieNode"]] = []
+        self.routes: list[tuple[int, Route, list[str]]] = []
+        self.tails: list[tuple[int, Route]] = []
+        self.min_index = sys.maxsize
+
+    def finalize(self) -> int:
+        """
+        Sorts the routes of this node, compiles the patterns of its route parameters,
+        and computes the lowest index of the routes reachable from this node, which is
+        used to skip branches that cannot produce a better match.
+        """
+        self.routes.sort(key=lambda item: item[0])
+        self.tails.sort(key=lambda item: item[0])
+
+        indexes = [item[0] for item in self.routes]
+        indexes.extend(item[0] for item in self.tails)
+        indexes.extend(child.finalize() for child in self.static.values())
+        indexes.extend(child.finalize() for child in self.params.values())
+
+        self.min_index = min(indexes, default=sys.maxsize)
+        self.compiled_params = [
+            (re.compile(key, re.IGNORECASE) if key is not None else None, child)
+            for key, child in self.params.items()
+        ]
+        return self.min_index
+
+
+class TrieRoutesMatcher(RoutesMatcher):
+    """
+    Matches routes using a tree of path segments, so that the cost of a lookup
+    depends on the number of segments in the request path rather than on the number
+    of routes. Static segments are looked up in dictionaries, route parameters are
+    matched one segment at a time, and the routes that cannot be decomposed in
+    segments (e.g. routes using the catch-all `*` or the `path` value pattern) are
+    matched using their regular expression, at the deepest node they share with
+    other routes. The first route in the given order wins, like with a linear scan.
+    """
+
+    def __init__(self, routes: list[Route]) -> None:
+        super().__init__(routes)
+        self._root = _TrieNode()
+
+        for index, route in enumerate(routes):
+            self._add_route(index, route)
+
+        self._root.finalize()
+
+    def _get_param(self, segment: bytes) -> tuple[bytes | None, str] | None:
+        """
+        Returns the value pattern and the name of a route parameter, if the given
+        pattern segment consists of a single route parameter that can be matched
+        within a single path segment.
+        """
+        match = _trie_param_rx.match(segment)
+        if match is None:
+            return None
+
+        value_pattern_name = match.group(1) or match.group(3)
+        name = (match.group(2) or match.group(4) or match.group(5)).decode("utf8")
+
+        if value_pattern_name is None:
+            return None, name
+
+        value_pattern_name = value_pattern_name.decode("utf8")
+        if value_pattern_name not in _trie_segment_value_patterns:
+            return None
+        value_pattern = Route.value_patterns[value_pattern_name]
+        if value_pattern == Route.value_patterns["string"]:
+            return None, name
+        return f"(?:{value_pattern})".encode(), name
+
+    def _add_route(self, index: int, route: Route) -> None:
+        pattern = route.pattern
+        nodes = [self._root]
+        param_names: list[str] = []
+
+        if pattern == b"/":
+            self._root.routes.append((index, route, param_names))
+            return
+
+        if not pattern.startswith(b"/"):
+            self._root.tails.append((index, route))
+            return
+
+        for segment in pattern[1:].split(b"/"):
+            node = nodes[-1]
+
+            if not _trie_static_unsafe_chars.intersection(segment):
+                nodes.append(node.static.setdefault(segment.lower(), _TrieNode()))
+                continue
+
+            param = self._get_param(segment)
+            if param is not None:
+                key, name = param
+                param_names.append(name)
+                nodes.append(node.params.setdefault(key, _TrieNode()))
+                continue
+
+            if segment.startswith(b"*") and len(nodes) > 1:
+                # the slash before a star is optional: /a/* matches also /a and
+                # /abc, so the route must be attached to the parent node of "a"
+                node = nodes[-2]
+            node.tails.append((index, route))
+            return
+
+        nodes[-1].routes.append((index, route, param_names))
+
+    def lookup(self, path: bytes) -> tuple[Route, dict[str, bytes] | None] | None:
+        segments = path[1:].split(b"/") if path.startswith(b"/") else None
+        result = self._find(self._root, path, segments, 0, [], None)
+
+        if result is None:
+            return None
+
+        _, route, values = result
+        return route, values
+
+    def _find(
+        self,
+        node: _TrieNode,
+        path: bytes,
+        segments: list[bytes] | None,
+        position: int,
+        values: list[bytes],
+        best: tuple[int, Route, dict[str, bytes] | None] | None,
+    ) -> tuple[int, Route, dict[str, bytes] | None] | None:
+        if best is not None and node.min_index >= best[0]:
+            return best
+
+        if segments is not None and position < len(segments):
+            # a single trailing slash is ignored, like in route regular expressions
+            if node.routes and position == len(segments) - 1 and not segments[-1]:
+                index, route, names = node.routes[0]
+                if best is None or index < best[0]:
+                    best = (index, route, dict(zip(names, values)) or None)
+
+            segment = segments[position]
+            child = node.static.get(segment.lower())
+
+            if child is not None:
+                best = self._find(child, path, segments, position + 1, values, best)
+
+            for rx, child in node.compiled_params:
+                if best is not None and child.min_index >= best[0]:
+                    continue
+                if not segment or (rx is not None and not rx.fullmatch(segment)):
+                    continue
+                values.append(segment)
+                best = self._find(child, path, segments, position + 1, values, best)
+                values.pop()
+        elif segments is not None and node.routes:
+            index, route, names = node.routes[0]
+            if best is None or index < best[0]:
+                best = (index, route, dict(zip(names, values)) or None)
+
+        for index, route in node.tails:
+            if best is not None and index >= best[0]:
+                break
+            match = route.rx.match(path)
+            if match:
+                best = (index, route, match.groupdict() if route.has_params else None)
+                break
+
+        return best
+
+
+class RegexRoutesMatcher(RoutesMatcher):
+    """
+    Matches routes using a single regular expression, combining the regular
+    expressions of all routes in an alternation having a named group for each route.
+    A single call to `re.match` finds the first matching route in the given order and
+    extracts its parameters, instead of testing each route in a Python loop.
+    """
+
+    def __init__(self, routes: list[Route]) -> None:
+        super().__init__(routes)
+        self._rx: re.Pattern | None = None
+        self._routes_by_group: dict[int, tuple[Route, list[tuple[str, int]]]] = {}
+
+        if routes:
+            self._compile()
+
+    def _get_route_fragment(self, index: int, route: Route) -> bytes:
+        pattern = route.full_pattern
+        assert pattern.startswith(b"^") and pattern.endswith(b"$")
+
+        # route parameters are renamed to avoid conflicts between routes
+        fragment = _named_group_rx.sub(
+            lambda match: b"?P<_" + str(index).encode() + b"_" + match.group(1) + b">",
+            pattern[1:-1],
+        )
+        return b"(?P<_" + str(index).encode() + b">" + fragment + b")"
+
+    def _compile(self) -> None:
+        rx = re.compile(
+            b"^(?:"
+            + b"|".join(
+                self._get_route_fragment(index, route)
+                for index, route in enumerate(self.routes)
+            )
+            + b")$",
+            re.IGNORECASE,
+        )
+
+        for index, route in enumerate(self.routes):
+            self._routes_by_group[rx.groupindex[f"_{index}"]] = (
+                route,
+                [
+                    (name, rx.groupindex[f"_{index}_{name}"])
+                    for name in route.param_names
+                ],
+            )
+        self._rx = rx
+
+    def lookup(self, path: bytes) -> tuple[Route, dict[str, bytes] | None] | None:
+        if self._rx is None:
+            return None
+
+        match = self._rx.match(path)
+        if match is None:
+            return None
+
+        # the group of the route is the last one to be closed
+        route, groups = self._routes_by_group[match.lastindex]  # type: ignore
+        if not groups:
+            return route, None
+        return route, {name: match.group(group) for name, group in groups}
+
+
+class RoutesMatcherMixin:
+    """
+    This mixin is activated automatically when a Router is configured to use a
+    RoutesMatcher, replacing the linear scan of the routes with the lookups of the
+    matchers compiled for each HTTP method.
+    """
+
+    routes: dict[bytes, list[Route]]
+    _matcher_type: type[RoutesMatcher]
+    _matchers: dict[bytes, RoutesMatcher]
+
+    def _get_matcher(self, method: bytes) -> RoutesMatcher:
+        try:
+            return self._matchers[method]
+        except KeyError:
+            matcher = self._matcher_type(self.routes.get(method) or [])
+            self._matchers[method] = matcher
+            return matcher
+
+    def _find_route(
+        self, method: bytes, path: bytes
+    ) -> tuple[Route, RouteMatch] | None:
+        result = self._get_matcher(method).lookup(path)
+        if result is None:
+            return None
+        route, values = result
+        return route, RouteMatch(route, values)
+
+    def sort_routes(self):
+        super().sort_routes()  # type: ignore
+
+        # compile matchers when routes are sorted, at application start
+        for method in self.routes:
+            self._get_matcher(method)
+
+
 RouteConfig = Union[dict[str, Any], "Router"]
 
 
@@ -725,6 +1097,19 @@ def _combine_with_global_prefix(prefix: str) -> str:
 
 
 class Router(RouterBase):
+    """
+    Routes web requests to request handlers, by HTTP method and request path.
+
+    By default, the routes configured for an HTTP method are tested in order. The
+    optional `matcher` parameter specifies a type of RoutesMatcher to be used to find
+    routes instead, for example `TrieRoutesMatcher` for applications defining many
+    routes.
+
+    The results of route lookups are cached per router: `cache_size` controls the
+    maximum number of cached results for requests that do not target static routes
+    (zero disables it), and `match_cache` exposes hits and misses counters.
+    """
+
     __slots__ = (
         "routes",
         "controllers_routes",
@@ -735,6 +1120,9 @@ class Router(RouterBase):
         "_prefix",
         "_registered_routes",
         "_named_routes",
+        "_matcher_type",
+        "_matchers",
+        "_match_cache",
     )
 
     def __init__(
@@ -746,6 +1134,8 @@ class Router(RouterBase):
         filters: list[RouteFilter] | None = None,
         sub_routers: list["Router"] | None = None,
         prefix: str = "",
+        matcher: type[RoutesMatcher] | None = None,
+        cache_size: int = 1200,
     ):
         super().__init__(
             host=host,
@@ -764,10 +1154,16 @@ class Router(RouterBase):
         self._sub_routers = sub_routers
         self._registered_routes = []  # used during setup
         self._named_routes: dict[str, Route] = {}
+        self._matcher_type = matcher
+        self._matchers: dict[bytes, RoutesMatcher] = {}
+        self._match_cache = RouteMatchCache(cache_size)
 
         if self._filters:
             extend(self, RouterFiltersMixin)
 
+        if matcher is not None:
+            extend(self, RoutesMatcherMixin)
+
         if self._sub_routers:
             extend(self, MultiRouterMixin)
 
@@ -781,11 +1177,17 @@ class Router(RouterBase):
         self._fallback = None
         self.routes = defaultdict(list)
         self._named_routes = {}
+        self._matchers.clear()
+        self._match_cache.clear()
         self.controllers_routes.reset()
         if self._sub_routers:
             for sub_router in self._sub_routers:
                 sub_router.reset()
 
+    @property
+    def match_cache(self) -> RouteMatchCache:
+        return self._match_cache
+
     @property
     def prefix(self) -> str:
         return self._prefix.decode("utf8")
@@ -959,12 +1361,16 @@ class Router(RouterBase):
     def remove(self, method: AnyStr, route: Route):
         self.routes[ensure_bytes(method)].remove(route)
         del self._map[ensure_bytes(method)][route.full_pattern]
+        self._matchers.clear()
+        self._match_cache.clear()
 
     def add_route(self, method: AnyStr, route: Route):
         method_bytes = ensure_bytes(method)
         if not isinstance(route, FilterRoute):
             self._check_duplicate(method_bytes, route)
         self.routes[method_bytes].append(route)
+        self._matchers.clear()
+        self._match_cache.clear()
 
     def sort_routes(self):
         """
@@ -987,6 +1393,8 @@ class Router(RouterBase):
             )
 
         self.routes = current_routes
+        self._matchers.clear()
+        self._match_cache.clear()
 
         if self._sub_routers:
             for sub_router in self._sub_routers:
@@ -998,26 +1406,43 @@ class Router(RouterBase):
         """
         return self.get_match_by_method_and_path(request.method, request._path)
 
-    @lru_cache(maxsize=1200)
+    def _find_route(
+        self, method: bytes, path: bytes
+    ) -> tuple[Route, RouteMatch] | None:
+        for route in self.routes[method]:
+            match = route.match_by_path(path)
+            if match:
+                return route, match
+        return None
+
+    def _get_route_and_match(
+        self, method: AnyStr, path: AnyStr
+    ) -> tuple[Route, RouteMatch] | None:
+        method_bytes = ensure_bytes(method)
+        path_bytes = ensure_bytes(path)
+
+        result = self._match_cache.get(method_bytes, path_bytes)
+        if result is _MISSING:
+            result = self._find_route(method_bytes, path_bytes)
+            self._match_cache.set(method_bytes, path_bytes, result)
+        return result
+
     def get_match_by_method_and_path(
         self, method: AnyStr, path: AnyStr
     ) -> RouteMatch | None:
-        bytes_value = ensure_bytes(path)
-        for route in self.routes[ensure_bytes(method)]:
-            match = route.match_by_path(bytes_value)
-            if match:
-                return match
+        result = self._get_route_and_match(method, path)
+        if result is not None:
+            return result[1]
+
         if self._fallback is None:
             return None
 
         return RouteMatch(self._fallback, None)
 
-    @lru_cache(maxsize=1200)
     def get_matching_route(self, method: AnyStr, value: AnyStr) -> Route | None:
-        for route in self.routes[ensure_bytes(method)]:
-            match = route.match_by_path(ensure_bytes(value))
-            if match:
-                return route
+        result = self._get_route_and_match(method, value)
+        if result is not None:
+            return result[0]
         return None
 
     def url_for(self, name: str, **params: str) -> str:
@@ -2,10 +2,13 @@
 This module offer built-in functions for Server Sent Events.
 """
 
+import asyncio
+import time
+from collections import deque
 from typing import AsyncIterable, Callable
 
 from blacksheep.contents import ServerSentEvent, StreamedContent, TextServerSentEvent
-from blacksheep.messages import Response
+from blacksheep.messages import Request, Response
 from blacksheep.scribe import write_sse
 
 __all__ = [
@@ -14,6 +17,7 @@ __all__ = [
     "ServerSentEventsContent",
     "ServerSentEventsResponse",
     "EventsProvider",
+    "EventBroker",
 ]
 
 
@@ -54,3 +58,255 @@ class ServerSentEventsResponse(Response):
         if headers is None:
             headers = [(b"Cache-Control", b"no-cache"), (b"Connection", b"Keep-Alive")]
         super().__init__(status, headers, ServerSentEventsContent(events_provider))
+
+
+HEARTBEAT = b": heartbeat\n\n"
+
+
+class _Subscriber:
+    __slots__ = ("queue", "ready", "closed")
+
+    def __init__(self) -> None:
+        self.queue: deque[bytes] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+        self.ready.set()
+
+
+class _Channel:
+    __slots__ = ("buffer", "subscribers", "published_at")
+
+    def __init__(self, buffer_size: int) -> None:
+        self.buffer: deque[tuple[str | None, bytes]] = deque(maxlen=buffer_size)
+        self.subscribers: set[_Subscriber] = set()
+        self.published_at = time.monotonic()
+
+
+class EventBroker:
+    """
+    Publishes Server-Sent Events to all the clients subscribed to a channel. Each
+    event is serialized once, and its bytes are shared by all subscribers, which
+    receive them through bounded queues: a client that cannot keep up is
+    disconnected, and it resumes from the last event it received when it
+    reconnects.
+
+    The last events of each channel are kept in a ring buffer, so that clients
+    sending a `Last-Event-ID` header when reconnecting receive the events they
+    missed. Channels without subscribers are removed when their last event is older
+    than `buffer_ttl` seconds. Heartbeat comments are sent to idle clients on a
+    timer shared by all subscribers.
+
+    Parameters
+    ----------
+    buffer_size: int
+        The number of events kept for each channel, to replay them to clients that
+        reconnect.
+    max_queue_size: int
+        The maximum number of events queued for each client.
+    heartbeat_interval: float | None
+        The number of seconds between heartbeat comments, or None to disable them.
+    buffer_ttl: float
+        The number of seconds for which the events of channels without subscribers
+        are kept, to replay them to clients that reconnect.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 100,
+        max_queue_size: int = 256,
+        heartbeat_interval: float | None = 15.0,
+        buffer_ttl: float = 300.0,
+    ) -> None:
+        if buffer_size < 0:
+            raise ValueError("buffer_size must be greater than or equal to zero")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than zero")
+        if buffer_ttl < 0:
+            raise ValueError("buffer_ttl must be greater than or equal to zero")
+        self.buffer_size = buffer_size
+        self.max_queue_size = max_queue_size
+        self.heartbeat_interval = heartbeat_interval
+        self.buffer_ttl = buffer_ttl
+        self._channels: dict[str, _Channel] = {}
+        self._next_cleanup = time.monotonic() + buffer_ttl
+        self._heartbeat_task: asyncio.Task | None = None
+        self.dropped_subscribers = 0
+
+    def count(self, channel: str | None = None) -> int:
+        """Returns the number of subscribers, optionally of the given channel."""
+        if channel is not None:
+            item = self._channels.get(channel)
+            return len(item.subscribers) if item is not None else 0
+        return sum(len(item.subscribers) for item in self._channels.values())
+
+    def publish(self, event: ServerSentEvent, channel: str = "default") -> int:
+        """
+        Publishes an event to the subscribers of the given channel, returning the
+        number of subscribers it was queued for.
+        """
+        data = write_sse(event)
+        item = self._get_channel(channel)
+        item.buffer.append((event.id, data))
+        item.published_at = time.monotonic()
+
+        queued = 0
+        for subscriber in list(item.subscribers):
+            if len(subscriber.queue) >= self.max_queue_size:
+                # the client resumes from the last event it received, reconnecting
+                self.dropped_subscribers += 1
+                self._unsubscribe(channel, subscriber)
+                subscriber.close()
+                continue
+
+            subscriber.queue.append(data)
+            subscriber.ready.set()
+            queued += 1
+
+        self._remove_if_unused(channel, item)
+        return queued
+
+    def get_replay(
+        self, channel: str = "default", last_event_id: str | None = None
+    ) -> list[bytes]:
+        """
+        Returns the buffered events of a channel that follow the event with the given
+        id. If the event is not buffered anymore, all buffered events are returned.
+        """
+        item = self._channels.get(channel)
+
+        if item is None or last_event_id is None:
+            return []
+
+        events = list(item.buffer)
+        for index in range(len(events) - 1, -1, -1):
+            if events[index][0] == last_event_id:
+                return [data for _, data in events[index + 1 :]]
+        return [data for _, data in events]
+
+    def subscribe(
+        self, channel: str = "default", last_event_id: str | None = None
+    ) -> AsyncIterable[bytes]:
+        """
+        Returns an asynchronous iterable of the serialized events of a channel,
+        starting with the events that follow the one with the given id, if any.
+        """
+        return self._stream(channel, last_event_id)
+
+    def get_response(self, request: Request, channel: str = "default") -> Response:
+        """
+        Returns a response that streams the events of a channel to the client that
+        sent the given request, replaying the events that follow its
+        `Last-Event-ID`.
+        """
+        last_event_id = request.get_first_header(b"last-event-id")
+        stream = self._stream
+
+        async def write_events():
+            async for data in stream(
+                channel, last_event_id.decode() if last_event_id else None
+            ):
+                yield data
+
+        return Response(
+            200,
+            [(b"Cache-Control", b"no-cache"), (b"Connection", b"Keep-Alive")],
+            StreamedContent(b"text/event-stream", write_events),
+        )
+
+    def close(self) -> None:
+        """Closes all subscriptions and stops the heartbeat timer."""
+        for channel in list(self._channels):
+            item = self._channels[channel]
+            for subscriber in list(item.subscribers):
+                self._unsubscribe(channel, subscriber)
+                subscriber.close()
+
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def _stream(self, channel: str, last_event_id: str | None):
+        replay = self.get_replay(channel, last_event_id)
+        subscriber = _Subscriber()
+        self._get_channel(channel).subscribers.add(subscriber)
+        self._ensure_heartbeat()
+
+        try:
+            for data in replay:
+                yield data
+
+            queue = subscriber.queue
+            while True:
+                await subscriber.ready.wait()
+
+                while queue:
+                    yield queue.popleft()
+
+                if subscriber.closed:
+                    return
+                subscriber.ready.clear()
+        finally:
+            self._unsubscribe(channel, subscriber)
+
+    def _get_channel(self, channel: str) -> _Channel:
+        item = self._channels.get(channel)
+        if item is None:
+            self._remove_expired_channels()
+            item = self._channels[channel] = _Channel(self.buffer_size)
+        return item
+
+    def _is_unused(self, item: _Channel, now: float) -> bool:
+        return not item.subscribers and (
+            not item.buffer or now - item.published_at >= self.buffer_ttl
+        )
+
+    def _remove_if_unused(self, channel: str, item: _Channel) -> None:
+        if self._is_unused(item, time.monotonic()) and (
+            self._channels.get(channel) is item
+        ):
+            del self._channels[channel]
+
+    def _remove_expired_channels(self) -> None:
+        # NB: channels are scanned at most once every buffer_ttl seconds, when new
+        # channels are created, to remove the ones left without subscribers
+        now = time.monotonic()
+        if now < self._next_cleanup:
+            return
+
+        self._next_cleanup = now + self.buffer_ttl
+        for channel, item in list(self._channels.items()):
+            if self._is_unused(item, now):
+                del self._channels[channel]
+
+    def _unsubscribe(self, channel: str, subscriber: _Subscriber) -> None:
+        item = self._channels.get(channel)
+        if item is not None:
+            item.subscribers.discard(subscriber)
+            self._remove_if_unused(channel, item)
+
+    def _ensure_heartbeat(self) -> None:
+        if self.heartbeat_interval is not None and self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.get_running_loop().create_task(
+                self._send_heartbeats()
+            )
+
+    async def _send_heartbeats(self) -> None:
+        assert self.heartbeat_interval is not None
+        try:
+            while True:
+                await asyncio.sleep(self.heartbeat_interval)
+
+                if not self.count():
+                    break
+
+                for item in self._channels.values():
+                    for subscriber in item.subscribers:
+                        if not subscriber.queue:
+                            subscriber.queue.append(HEARTBEAT)
+                            subscriber.ready.set()
+        finally:
+            if self._heartbeat_task is asyncio.current_task():
+                self._heartbeat_task = None
@@ -0,0 +1,126 @@
+"""
+This module provides an executor that runs synchronous request handlers in a bounded
+pool of threads, so that handlers doing blocking I/O or CPU bound work do not block
+the event loop, and a decorator to configure this for single request handlers.
+"""
+
+import contextvars
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from blacksheep.exceptions import ServiceUnavailable
+from blacksheep.utils.aio import get_running_loop
+
+
+def run_in_thread_pool(value: bool = True) -> Callable[..., Any]:
+    """
+    If used without arguments, configures a decorated synchronous request handler to
+    run in the pool of threads of the application, even if the application does not
+    run all synchronous request handlers in it.
+
+    Otherwise, enables or disables running the request handler in the pool of threads
+    according to the given flag value, overriding the application setting.
+    """
+
+    def decorator(f):
+        f.run_in_thread_pool = value
+        return f
+
+    return decorator
+
+
+class SyncHandlersExecutor:
+    """
+    Runs synchronous request handlers in a pool of threads. Input parameters are
+    still bound in the event loop, then the request handler is called in a thread,
+    with a copy of the current context.
+
+    Parameters
+    ----------
+    max_workers: int | None
+        The maximum number of threads, by default min(32, CPU count + 4), like for
+        `concurrent.futures.ThreadPoolExecutor`.
+    max_queue_size: int | None
+        The maximum number of calls waiting for a thread. When it is reached, new
+        calls are rejected raising `ServiceUnavailable` (503). By default, calls are
+        not rejected.
+    thread_name_prefix: str
+        The prefix of the names of the threads.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue_size: int | None = None,
+        thread_name_prefix: str = "blacksheep",
+    ) -> None:
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than zero")
+        if max_queue_size is not None and max_queue_size < 0:
+            raise ValueError("max_queue_size must be greater than or equal to zero")
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._active = 0
+        self.rejected = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def max_queue_size(self) -> int | None:
+        return self._max_queue_size
+
+    @property
+    def active(self) -> int:
+        """Returns the number of calls running in threads."""
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Returns the number of calls waiting for a thread."""
+        return max(self._pending - self._active, 0)
+
+    @property
+    def saturation(self) -> float:
+        """
+        Returns the number of calls running or waiting for a thread, relative to the
+        number of threads: values greater than 1 mean that calls are waiting.
+        """
+        return self._pending / self._max_workers
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Calls the given function in a thread, returning its result."""
+        if (
+            self._max_queue_size is not None
+            and self._pending >= self._max_workers + self._max_queue_size
+        ):
+            self.rejected += 1
+            raise ServiceUnavailable()
+
+        self._pending += 1
+        try:
+            return await get_running_loop().run_in_executor(
+                self._executor, self._call, contextvars.copy_context(), func, args
+            )
+        finally:
+            self._pending -= 1
+
+    def _call(self, context: contextvars.Context, func, args) -> Any:
+        with self._lock:
+            self._active += 1
+        try:
+            return context.run(func, *args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
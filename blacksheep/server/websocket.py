@@ -1,6 +1,8 @@
+import asyncio
+from collections import deque
 from enum import Enum
 from functools import wraps
-from typing import Any, AnyStr, Callable, MutableMapping
+from typing import Any, AnyStr, Callable, Iterable, MutableMapping
 
 from blacksheep.messages import Request
 from blacksheep.server.asgi import get_full_path
@@ -140,7 +142,7 @@ class WebSocket(Request):
             return json_settings.loads(message["text"])
 
         if mode == MessageMode.BYTES:
-            return json_settings.loads(message["bytes"].decode())
+            return json_settings.loads_bytes(message["bytes"])
 
     async def _send_message(self, message: MutableMapping[str, AnyStr]) -> None:
         if self.client_state != WebSocketState.CONNECTED:
@@ -159,13 +161,11 @@ class WebSocket(Request):
     async def send_json(
         self, data: MutableMapping[Any, Any], mode: MessageMode = MessageMode.TEXT
     ):
-        text = json_settings.dumps(data)
-
         if mode == MessageMode.TEXT:
-            return await self.send_text(text)
+            return await self.send_text(json_settings.dumps(data))
 
         if mode == MessageMode.BYTES:
-            return await self.send_bytes(text.encode())
+            return await self.send_bytes(json_settings.dumps_bytes(data))
 
     def _wrap_receive(self, _receive: Callable):
         @wraps(_receive)
@@ -197,3 +197,286 @@ def format_reason(reason: str) -> str:
     ellipsis_ = b"..."
     truncated_reason = reason_bytes[: MAX_REASON_SIZE - len(ellipsis_)] + ellipsis_
     return truncated_reason.decode()
+
+
+class SlowConsumerPolicy(Enum):
+    """
+    Describes what a `WebSocketHub` does when the send queue of a connection is full.
+    """
+
+    DROP = "drop"
+    """The new message is dropped for the slow connection."""
+
+    DISCONNECT = "disconnect"
+    """The slow connection is closed."""
+
+    COALESCE = "coalesce"
+    """The queued messages are replaced by the new message, the latest state wins."""
+
+
+class _HubConnection:
+    __slots__ = ("websocket", "groups", "messages", "queued_bytes", "ready", "task")
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.groups: set[str] = set()
+        self.messages: deque[tuple[MutableMapping[str, Any], int]] = deque()
+        self.queued_bytes = 0
+        self.ready = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+
+class WebSocketHub:
+    """
+    Tracks connected WebSockets, optionally by group, and broadcasts messages to
+    them. Messages are serialized once for all connections, and sent concurrently by
+    a task for each connection, with a bounded send queue, so that slow clients do
+    not delay the others. When the queue of a connection is full, the configured
+    `SlowConsumerPolicy` is applied.
+
+    Parameters
+    ----------
+    max_queue_size: int
+        The maximum number of messages queued for each connection.
+    max_queue_bytes: int
+        The maximum number of bytes queued for each connection.
+    slow_consumer_policy: SlowConsumerPolicy
+        What to do when the queue of a connection is full, by default
+        `SlowConsumerPolicy.DROP`.
+    close_code: int
+        The close code used to disconnect slow connections, by default 1013
+        (Try Again Later).
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        max_queue_bytes: int = 4 * 1024 * 1024,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP,
+        close_code: int = 1013,
+    ) -> None:
+        if max_queue_size < 1 or max_queue_bytes < 1:
+            raise ValueError("The queue sizes must be greater than zero")
+        self.max_queue_size = max_queue_size
+        self.max_queue_bytes = max_queue_bytes
+        self.slow_consumer_policy = slow_consumer_policy
+        self.close_code = close_code
+        self._connections: dict[WebSocket, _HubConnection] = {}
+        self._groups: dict[str, set[_HubConnection]] = {}
+        self.queued_bytes = 0
+        self.dropped_messages = 0
+        self.disconnected_slow_consumers = 0
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def __contains__(self, websocket: WebSocket) -> bool:
+        return websocket in self._connections
+
+    @property
+    def groups(self) -> list[str]:
+        """Returns the names of the groups having connections."""
+        return list(self._groups)
+
+    def count(self, group: str | None = None) -> int:
+        """Returns the number of connections, optionally in the given group."""
+        if group is None:
+            return len(self._connections)
+        return len(self._groups.get(group, ()))
+
+    def get_queued_bytes(self, websocket: WebSocket) -> int:
+        """Returns the number of bytes queued for the given connection."""
+        connection = self._connections.get(websocket)
+        return connection.queued_bytes if connection is not None else 0
+
+    def add(self, websocket: WebSocket, *groups: str) -> None:
+        """
+        Adds an accepted WebSocket to this hub, optionally in the given groups.
+        """
+        connection = self._connections.get(websocket)
+
+        if connection is None:
+            connection = _HubConnection(websocket)
+            connection.task = asyncio.get_running_loop().create_task(
+                self._send_loop(connection)
+            )
+            self._connections[websocket] = connection
+
+        for group in groups:
+            connection.groups.add(group)
+            self._groups.setdefault(group, set()).add(connection)
+
+    def discard_from_group(self, websocket: WebSocket, group: str) -> None:
+        """Removes the given WebSocket from a group, keeping it in this hub."""
+        connection = self._connections.get(websocket)
+
+        if connection is not None:
+            connection.groups.discard(group)
+            self._discard_from_group(connection, group)
+
+    def remove(self, websocket: WebSocket) -> None:
+        """
+        Removes the given WebSocket from this hub, discarding the messages queued for
+        it. Call this method when a connection is closed.
+        """
+        connection = self._connections.pop(websocket, None)
+
+        if connection is None:
+            return
+
+        for group in connection.groups:
+            self._discard_from_group(connection, group)
+
+        self._clear_queue(connection)
+
+        if connection.task is not None and connection.task is not _current_task():
+            connection.task.cancel()
+
+    async def close(self) -> None:
+        """
+        Removes all connections from this hub, cancelling the tasks that send them
+        messages. The WebSockets are not closed.
+        """
+        tasks = [
+            connection.task
+            for connection in self._connections.values()
+            if connection.task is not None
+        ]
+
+        for websocket in list(self._connections):
+            self.remove(websocket)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def broadcast_text(self, data: str, group: str | None = None) -> int:
+        """
+        Queues a text message for all connections, or for the connections in the
+        given group. Returns the number of connections the message was queued for.
+        """
+        return self._broadcast(
+            {"type": "websocket.send", "text": data}, len(data.encode()), group
+        )
+
+    def broadcast_bytes(self, data: bytes, group: str | None = None) -> int:
+        """
+        Queues a binary message for all connections, or for the connections in the
+        given group. Returns the number of connections the message was queued for.
+        """
+        return self._broadcast(
+            {"type": "websocket.send", "bytes": data}, len(data), group
+        )
+
+    def broadcast_json(
+        self,
+        data: Any,
+        group: str | None = None,
+        mode: MessageMode = MessageMode.TEXT,
+    ) -> int:
+        """
+        Serializes the given data to JSON once, and queues it for all connections, or
+        for the connections in the given group. Returns the number of connections the
+        message was queued for.
+        """
+        if mode == MessageMode.BYTES:
+            return self.broadcast_bytes(json_settings.dumps_bytes(data), group)
+        return self.broadcast_text(json_settings.dumps(data), group)
+
+    def _broadcast(
+        self, message: MutableMapping[str, Any], size: int, group: str | None
+    ) -> int:
+        connections: Iterable[_HubConnection]
+
+        if group is None:
+            connections = self._connections.values()
+        else:
+            connections = self._groups.get(group, ())
+
+        queued = 0
+        for connection in list(connections):
+            if self._enqueue(connection, message, size):
+                queued += 1
+        return queued
+
+    def _enqueue(
+        self, connection: _HubConnection, message: MutableMapping[str, Any], size: int
+    ) -> bool:
+        if (
+            len(connection.messages) >= self.max_queue_size
+            or connection.queued_bytes + size > self.max_queue_bytes
+        ) and connection.messages:
+            policy = self.slow_consumer_policy
+
+            if policy == SlowConsumerPolicy.DROP:
+                self.dropped_messages += 1
+                return False
+
+            if policy == SlowConsumerPolicy.DISCONNECT:
+                self._disconnect_slow_consumer(connection)
+                return False
+
+            self.dropped_messages += len(connection.messages)
+            self._clear_queue(connection)
+
+        connection.messages.append((message, size))
+        connection.queued_bytes += size
+        self.queued_bytes += size
+        connection.ready.set()
+        return True
+
+    def _disconnect_slow_consumer(self, connection: _HubConnection) -> None:
+        self.disconnected_slow_consumers += 1
+        self.dropped_messages += len(connection.messages) + 1
+        websocket = connection.websocket
+        self.remove(websocket)
+        asyncio.get_running_loop().create_task(
+            _close_quietly(websocket, self.close_code)
+        )
+
+    def _clear_queue(self, connection: _HubConnection) -> None:
+        self.queued_bytes -= connection.queued_bytes
+        connection.queued_bytes = 0
+        connection.messages.clear()
+        connection.ready.clear()
+
+    def _discard_from_group(self, connection: _HubConnection, group: str) -> None:
+        connections = self._groups.get(group)
+
+        if connections is not None:
+            connections.discard(connection)
+            if not connections:
+                del self._groups[group]
+
+    async def _send_loop(self, connection: _HubConnection) -> None:
+        messages = connection.messages
+        websocket = connection.websocket
+
+        while True:
+            await connection.ready.wait()
+
+            while messages:
+                message, size = messages.popleft()
+                connection.queued_bytes -= size
+                self.queued_bytes -= size
+
+                try:
+                    await websocket._send_message(message)
+                except Exception:
+                    # the connection is closed or broken
+                    self.remove(websocket)
+                    return
+
+            connection.ready.clear()
+
+
+def _current_task() -> asyncio.Task | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(websocket: WebSocket, code: int) -> None:
+    try:
+        await websocket.close(code)
+    except Exception:
+        pass
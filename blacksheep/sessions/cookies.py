@@ -84,7 +84,7 @@ class CookieSessionStore(SessionStore):
         return Cookie(self._session_cookie, value, path="/", http_only=True)
 
     async def load(self, request: Request) -> Session:
-        current_session_value = request.cookies.get(self._session_cookie, None)
+        current_session_value = request.get_cookie(self._session_cookie)
         if current_session_value:
             return self._try_read_session(current_session_value)
         return Session()
@@ -32,7 +32,7 @@ class InMemorySessionStore(SessionStore):
         self._sessions: dict[str, Any] = {}
 
     async def load(self, request: Request) -> Session:
-        session_id = request.cookies.get(self._session_cookie_name)
+        session_id = request.get_cookie(self._session_cookie_name)
         if session_id and session_id in self._sessions:
             return Session(self._sessions[session_id])
         # Create a new session
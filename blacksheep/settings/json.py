@@ -1,7 +1,7 @@
 import json
 from typing import Any
 
-from essentials.json import dumps
+from essentials.json import FriendlyEncoder, dumps
 
 
 def default_json_dumps(obj):
@@ -12,21 +12,137 @@ def default_pretty_json_dumps(obj):
     return dumps(obj, indent=4)
 
 
+def default_json_dumps_bytes(obj):
+    return default_json_dumps(obj).encode("utf8")
+
+
+# handles the types that JSON libraries do not serialize natively, like Pydantic
+# models and bytes, the same way the default encoder does
+_friendly_default = FriendlyEncoder().default
+
+
+def _get_dumps_bytes(dumps):
+    if dumps is default_json_dumps:
+        return default_json_dumps_bytes
+
+    def dumps_bytes(obj):
+        return dumps(obj).encode("utf8")
+
+    return dumps_bytes
+
+
+def _get_loads_bytes(loads):
+    if loads is json.loads:
+        # json.loads parses bytes directly, detecting their encoding
+        return json.loads
+
+    def loads_bytes(data):
+        return loads(data.decode("utf8"))
+
+    return loads_bytes
+
+
 class JSONSettings:
+    """
+    Configures the functions used to serialize and deserialize JSON. Besides the
+    functions working with str, the settings expose functions working with bytes,
+    used to write and read the bodies of requests, responses and WebSocket
+    messages without encoding and decoding text.
+    """
+
     def __init__(self):
-        self._loads = json.loads
-        self._dumps = default_json_dumps
-        self._pretty_dumps = default_pretty_json_dumps
+        self.use()
 
     def use(
         self,
         loads=json.loads,
         dumps=default_json_dumps,
         pretty_dumps=default_pretty_json_dumps,
+        loads_bytes=None,
+        dumps_bytes=None,
     ):
+        """
+        Configures the functions used to handle JSON. When `loads_bytes` and
+        `dumps_bytes` are not specified, they are obtained from `loads` and `dumps`,
+        decoding and encoding text using UTF-8.
+        """
         self._loads = loads
         self._dumps = dumps
         self._pretty_dumps = pretty_dumps
+        self._loads_bytes = loads_bytes or _get_loads_bytes(loads)
+        self._dumps_bytes = dumps_bytes or _get_dumps_bytes(dumps)
+
+    def use_orjson(self):
+        """
+        Configures orjson to handle JSON. Keys of dictionaries that are not str
+        are supported, and types not supported natively by orjson are handled like
+        the default encoder does.
+        """
+        try:
+            import orjson
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "orjson is required to use it to handle JSON. "
+                "Install it with: pip install orjson"
+            ) from exc
+
+        option = orjson.OPT_NON_STR_KEYS
+
+        def orjson_dumps_bytes(obj):
+            return orjson.dumps(obj, default=_friendly_default, option=option)
+
+        def orjson_dumps(obj):
+            return orjson_dumps_bytes(obj).decode("utf8")
+
+        def orjson_pretty_dumps(obj):
+            return orjson.dumps(
+                obj, default=_friendly_default, option=option | orjson.OPT_INDENT_2
+            ).decode("utf8")
+
+        self.use(
+            loads=orjson.loads,
+            dumps=orjson_dumps,
+            pretty_dumps=orjson_pretty_dumps,
+            loads_bytes=orjson.loads,
+            dumps_bytes=orjson_dumps_bytes,
+        )
+
+    def use_msgspec(self):
+        """
+        Configures msgspec to handle JSON. Types not supported natively by msgspec
+        are handled like the default encoder does, and errors caused by invalid JSON
+        are raised as `json.JSONDecodeError`, like the default decoder does.
+        """
+        try:
+            import msgspec
+        except ImportError as exc:  # pragma: no cover
+            raise ImportError(
+                "msgspec is required to use it to handle JSON. "
+                "Install it with: pip install msgspec"
+            ) from exc
+
+        encoder = msgspec.json.Encoder(enc_hook=_friendly_default)
+        decoder = msgspec.json.Decoder()
+
+        def msgspec_loads(data):
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as decode_error:
+                raise json.JSONDecodeError(str(decode_error), "", 0) from decode_error
+
+        def msgspec_dumps(obj):
+            return encoder.encode(obj).decode("utf8")
+
+        def msgspec_pretty_dumps(obj):
+            return msgspec.json.format(encoder.encode(obj), indent=4).decode("utf8")
+
+        self.use(
+            loads=msgspec_loads,
+            dumps=msgspec_dumps,
+            pretty_dumps=msgspec_pretty_dumps,
+            loads_bytes=msgspec_loads,
+            dumps_bytes=encoder.encode,
+        )
 
     def loads(self, text: str) -> Any:
         return self._loads(text)
@@ -37,5 +153,11 @@ class JSONSettings:
     def pretty_dumps(self, obj: Any) -> str:
         return self._pretty_dumps(obj)
 
+    def loads_bytes(self, data: bytes) -> Any:
+        return self._loads_bytes(data)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self._dumps_bytes(obj)
+
 
 json_settings = JSONSettings()
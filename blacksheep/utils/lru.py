@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A dictionary of limited size that discards the least recently used items when
+    it is full. Unlike `functools.lru_cache`, it can be owned by the objects that use
+    it, so that cached values do not outlive them.
+    """
+
+    __slots__ = ("_items", "_maxsize")
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        if maxsize < 0:
+            raise ValueError("maxsize must be greater than or equal to zero")
+        self._items: OrderedDict[K, V] = OrderedDict()
+        self._maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def __iter__(self):
+        yield from self._items
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        try:
+            value = self._items[key]
+        except KeyError:
+            return default
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        if self._maxsize == 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self._maxsize:
+            self._items.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        return self._items.pop(key, default)
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -43,6 +43,11 @@ if platform.python_implementation() == "CPython" and not skip_ext:
             ["blacksheep/contents.c"],
             extra_compile_args=COMPILE_ARGS,
         ),
+        Extension(
+            "blacksheep.multipartparser",
+            ["blacksheep/multipartparser.c"],
+            extra_compile_args=COMPILE_ARGS,
+        ),
         Extension(
             "blacksheep.messages",
             ["blacksheep/messages.c"],
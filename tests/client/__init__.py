@@ -28,8 +28,8 @@ class FakePool:
         self.connection = fake_connection
         self.sleep_for = delay
 
-    async def get_connection(self):
-        await asyncio.sleep(self.sleep_for)
+    async def get_connection(self, connection_timeout=None):
+        await asyncio.wait_for(asyncio.sleep(self.sleep_for), connection_timeout)
         return self.connection
 
 
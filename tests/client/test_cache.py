@@ -0,0 +1,373 @@
+import asyncio
+import os
+from email.utils import formatdate
+
+import pytest
+
+from blacksheep import Response, StreamedContent, TextContent
+from blacksheep.client import ClientSession
+from blacksheep.client.cache import (
+    FileHTTPCacheStore,
+    HTTPCache,
+    HTTPCacheEntry,
+    InMemoryHTTPCacheStore,
+    parse_cache_control,
+)
+
+from . import FakePools
+
+
+class FakeServer:
+    """
+    Client middleware that records the requests it receives and returns responses
+    created by a function, instead of sending requests.
+    """
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.requests = []
+
+    async def __call__(self, request, next_handler):
+        self.requests.append(
+            (request.method, request.url.value, list(request.headers.items()))
+        )
+        return self.responder(request)
+
+    def get_header(self, index, name):
+        for key, value in self.requests[index][2]:
+            if key.lower() == name:
+                return value
+        return None
+
+
+def get_client(server, cache=None):
+    return ClientSession(
+        base_url=b"http://localhost:8080",
+        pools=FakePools([]),
+        middlewares=[cache or HTTPCache(), server],
+    )
+
+
+def text_response(text, headers, status=200):
+    return Response(status, list(headers), TextContent(text))
+
+
+def expire(store: InMemoryHTTPCacheStore, seconds: float):
+    for entry in store._items.values():
+        entry.request_time -= seconds
+        entry.response_time -= seconds
+
+
+def test_parse_cache_control():
+    assert parse_cache_control(
+        [b'max-age=60, No-Cache, private="set-cookie"', b"stale-while-revalidate=5"]
+    ) == {
+        b"max-age": b"60",
+        b"no-cache": None,
+        b"private": b"set-cookie",
+        b"stale-while-revalidate": b"5",
+    }
+
+
+async def test_fresh_response_is_served_from_cache():
+    calls = 0
+
+    def responder(request):
+        nonlocal calls
+        calls += 1
+        return text_response(f"Hello {calls}", [(b"Cache-Control", b"max-age=60")])
+
+    server = FakeServer(responder)
+
+    async with get_client(server) as client:
+        for _ in range(3):
+            response = await client.get("/config")
+            assert response.status == 200
+            assert await response.text() == "Hello 1"
+
+    assert len(server.requests) == 1
+    assert response.get_first_header(b"age") == b"0"
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        [(b"Cache-Control", b"no-store, max-age=60")],
+        [(b"Cache-Control", b"max-age=60"), (b"Vary", b"*")],
+        [],
+    ],
+)
+async def test_responses_not_stored(headers):
+    server = FakeServer(lambda request: text_response("Hello", headers))
+
+    async with get_client(server) as client:
+        await client.get("/")
+        await client.get("/")
+
+    assert len(server.requests) == 2
+
+
+def streamed_response(chunks, produced, headers):
+    async def data_provider():
+        for chunk in chunks:
+            produced.append(chunk)
+            yield chunk
+
+    return Response(200, list(headers), StreamedContent(b"text/plain", data_provider))
+
+
+async def test_response_of_unknown_length_bigger_than_limit_is_not_buffered():
+    produced = []
+    chunks = [b"x" * 10 for _ in range(10)]
+    server = FakeServer(
+        lambda request: streamed_response(
+            chunks, produced, [(b"Cache-Control", b"max-age=60")]
+        )
+    )
+    cache = HTTPCache(max_body_size=25)
+
+    async with get_client(server, cache) as client:
+        response = await client.get("/")
+        assert len(produced) == 3
+
+        assert await response.read() == b"x" * 100
+        assert len(cache.store) == 0
+
+        await client.get("/")
+
+    assert len(server.requests) == 2
+
+
+async def test_response_of_unknown_length_within_limit_is_stored():
+    produced = []
+    server = FakeServer(
+        lambda request: streamed_response(
+            [b"Hello, ", b"World"], produced, [(b"Cache-Control", b"max-age=60")]
+        )
+    )
+
+    async with get_client(server, HTTPCache(max_body_size=12)) as client:
+        response = await client.get("/")
+        assert await response.text() == "Hello, World"
+
+        response = await client.get("/")
+        assert await response.text() == "Hello, World"
+
+    assert len(server.requests) == 1
+
+
+async def test_request_no_cache_bypasses_fresh_response():
+    server = FakeServer(
+        lambda request: text_response("Hello", [(b"Cache-Control", b"max-age=60")])
+    )
+
+    async with get_client(server) as client:
+        await client.get("/")
+        await client.get("/", headers={"Cache-Control": "no-cache"})
+
+    assert len(server.requests) == 2
+
+
+async def test_expires_header():
+    server = FakeServer(
+        lambda request: text_response(
+            "Hello",
+            [
+                (b"Date", formatdate(usegmt=True).encode()),
+                (b"Expires", formatdate(usegmt=True).encode()),
+            ],
+        )
+    )
+
+    async with get_client(server) as client:
+        await client.get("/")
+        await client.get("/")
+
+    # a response that expires immediately is not stored without validators
+    assert len(server.requests) == 2
+
+
+async def test_stale_response_is_revalidated_with_etag():
+    def responder(request):
+        if request.get_first_header(b"if-none-match") == b'"v1"':
+            return Response(304, [(b"Cache-Control", b"max-age=60")])
+        return text_response(
+            "Catalog", [(b"Cache-Control", b"max-age=1"), (b"ETag", b'"v1"')]
+        )
+
+    server = FakeServer(responder)
+    cache = HTTPCache()
+
+    async with get_client(server, cache) as client:
+        await client.get("/catalog")
+        expire(cache.store, 10)
+
+        response = await client.get("/catalog")
+        assert response.status == 200
+        assert await response.text() == "Catalog"
+        assert server.get_header(1, b"if-none-match") == b'"v1"'
+
+        # the 304 response updated the stored response, which is now fresh
+        response = await client.get("/catalog")
+        assert await response.text() == "Catalog"
+
+    assert len(server.requests) == 2
+
+
+async def test_revalidation_with_last_modified_replaced_by_new_response():
+    last_modified = formatdate(0, usegmt=True).encode()
+    calls = 0
+
+    def responder(request):
+        nonlocal calls
+        calls += 1
+        return text_response(
+            f"Hello {calls}",
+            [(b"Cache-Control", b"no-cache"), (b"Last-Modified", last_modified)],
+        )
+
+    server = FakeServer(responder)
+
+    async with get_client(server) as client:
+        response = await client.get("/")
+        assert await response.text() == "Hello 1"
+
+        response = await client.get("/")
+        assert await response.text() == "Hello 2"
+        assert server.get_header(1, b"if-modified-since") == last_modified
+
+    assert len(server.requests) == 2
+
+
+async def test_vary():
+    def responder(request):
+        language = request.get_first_header(b"accept-language") or b"en"
+        return text_response(
+            language.decode(),
+            [(b"Cache-Control", b"max-age=60"), (b"Vary", b"Accept-Language")],
+        )
+
+    server = FakeServer(responder)
+
+    async with get_client(server) as client:
+        response = await client.get("/", headers={"Accept-Language": "it"})
+        assert await response.text() == "it"
+
+        response = await client.get("/", headers={"Accept-Language": "it"})
+        assert await response.text() == "it"
+        assert len(server.requests) == 1
+
+        response = await client.get("/", headers={"Accept-Language": "sv"})
+        assert await response.text() == "sv"
+        assert len(server.requests) == 2
+
+
+async def test_stale_while_revalidate():
+    calls = 0
+
+    def responder(request):
+        nonlocal calls
+        calls += 1
+        return text_response(
+            f"Hello {calls}",
+            [(b"Cache-Control", b"max-age=1, stale-while-revalidate=60")],
+        )
+
+    server = FakeServer(responder)
+    cache = HTTPCache()
+
+    async with get_client(server, cache) as client:
+        await client.get("/")
+        expire(cache.store, 10)
+
+        response = await client.get("/")
+        assert await response.text() == "Hello 1"
+        response = await client.get("/")
+        assert await response.text() == "Hello 1"
+
+        # a single revalidation runs in background
+        await asyncio.sleep(0.01)
+        assert len(server.requests) == 2
+
+        response = await client.get("/")
+        assert await response.text() == "Hello 2"
+
+
+async def test_unsafe_methods_invalidate_stored_responses():
+    server = FakeServer(
+        lambda request: text_response("Hello", [(b"Cache-Control", b"max-age=60")])
+    )
+    cache = HTTPCache()
+
+    async with get_client(server, cache) as client:
+        await client.get("/items")
+        assert len(cache.store) == 1
+
+        await client.post("/items", TextContent("Hello"))
+        assert len(cache.store) == 0
+
+
+async def test_in_memory_store_is_bounded_by_size():
+    store = InMemoryHTTPCacheStore(max_size=100)
+
+    def get_entry(size):
+        return HTTPCacheEntry(200, [], b"x" * size, 0, 0)
+
+    await store.set("a", get_entry(40))
+    await store.set("b", get_entry(40))
+    assert store.size == 80
+
+    await store.get("a")
+    await store.set("c", get_entry(40))
+
+    assert "a" in store
+    assert "b" not in store
+    assert store.size == 80
+
+    await store.set("d", get_entry(200))
+    assert "d" not in store
+
+
+async def test_file_store(tmp_path):
+    store = FileHTTPCacheStore(str(tmp_path))
+    entry = HTTPCacheEntry(
+        200,
+        [(b"Cache-Control", b"max-age=60")],
+        b"Hello",
+        1.0,
+        2.0,
+        [(b"accept-language", b"it"), (b"accept", None)],
+    )
+
+    await store.set("http://localhost/", entry)
+    stored = await store.get("http://localhost/")
+
+    assert stored is not None
+    assert stored.status == 200
+    assert stored.headers == entry.headers
+    assert stored.body == b"Hello"
+    assert stored.request_time == 1.0
+    assert stored.response_time == 2.0
+    assert stored.vary == entry.vary
+
+    await store.remove("http://localhost/")
+    assert await store.get("http://localhost/") is None
+
+
+async def test_file_store_concurrent_writes(tmp_path):
+    store = FileHTTPCacheStore(str(tmp_path))
+    key = "http://localhost/"
+
+    for _ in range(10):
+        entries = [
+            HTTPCacheEntry(200, [], str(index).encode() * 10000, 1.0, 2.0)
+            for index in range(8)
+        ]
+        await asyncio.gather(*[store.set(key, entry) for entry in entries])
+
+        stored = await store.get(key)
+        assert stored is not None
+        assert stored.body in {entry.body for entry in entries}
+
+    # temporary files are not left behind
+    assert os.listdir(tmp_path) == [os.path.basename(store.get_file_path(key))]
@@ -0,0 +1,163 @@
+import asyncio
+import socket
+
+import pytest
+
+from blacksheep.client import dns
+from blacksheep.client.dns import (
+    DNSCache,
+    connect_happy_eyeballs,
+    interleave_addresses,
+)
+
+V4_A = (socket.AF_INET, 6, ("10.0.0.1", 80))
+V4_B = (socket.AF_INET, 6, ("10.0.0.2", 80))
+V6_A = (socket.AF_INET6, 6, ("fd00::1", 80, 0, 0))
+V6_B = (socket.AF_INET6, 6, ("fd00::2", 80, 0, 0))
+
+
+class FakeDNSCache(DNSCache):
+    def __init__(self, addresses, **kwargs):
+        super().__init__(**kwargs)
+        self.addresses = addresses
+        self.lookups = 0
+
+    async def lookup(self, host, port):
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        return list(self.addresses)
+
+
+def test_interleave_addresses():
+    assert interleave_addresses([V6_A, V6_B, V4_A, V4_B]) == [V6_A, V4_A, V6_B, V4_B]
+    assert interleave_addresses([V4_A, V6_A, V6_B]) == [V4_A, V6_A, V6_B]
+    assert interleave_addresses([V4_A, V4_B]) == [V4_A, V4_B]
+
+
+async def test_dns_cache_reuses_and_rotates_addresses():
+    cache = FakeDNSCache([V4_A, V4_B])
+
+    assert await cache.resolve("example.com", 80) == [V4_A, V4_B]
+    assert await cache.resolve("example.com", 80) == [V4_B, V4_A]
+    assert await cache.resolve("example.com", 80) == [V4_A, V4_B]
+    assert cache.lookups == 1
+    assert len(cache) == 1
+
+    cache.invalidate("example.com", 80)
+    await cache.resolve("example.com", 80)
+    assert cache.lookups == 2
+
+
+async def test_dns_cache_coalesces_concurrent_lookups():
+    cache = FakeDNSCache([V4_A])
+
+    results = await asyncio.gather(
+        *[cache.resolve("example.com", 80) for _ in range(10)]
+    )
+
+    assert all(result == [V4_A] for result in results)
+    assert cache.lookups == 1
+
+
+async def test_dns_cache_lookup_survives_cancelled_caller():
+    cache = FakeDNSCache([V4_A])
+
+    first = asyncio.ensure_future(cache.resolve("example.com", 80))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(cache.resolve("example.com", 80))
+    await asyncio.sleep(0)
+
+    # the caller that started the lookup is cancelled while another one waits
+    first.cancel()
+
+    assert await second == [V4_A]
+    assert first.cancelled()
+    assert cache.lookups == 1
+    assert len(cache) == 1
+
+
+async def test_dns_cache_shares_lookup_errors():
+    class FailingDNSCache(DNSCache):
+        async def lookup(self, host, port):
+            await asyncio.sleep(0.01)
+            raise socket.gaierror("Name or service not known")
+
+    cache = FailingDNSCache()
+    results = await asyncio.gather(
+        *[cache.resolve("example.com", 80) for _ in range(3)], return_exceptions=True
+    )
+
+    assert all(isinstance(result, socket.gaierror) for result in results)
+    assert len(cache) == 0
+
+
+async def test_dns_cache_ttl():
+    cache = FakeDNSCache([V4_A], ttl=0.01)
+
+    await cache.resolve("example.com", 80)
+    await asyncio.sleep(0.02)
+    await cache.resolve("example.com", 80)
+
+    assert cache.lookups == 2
+
+
+def test_dns_cache_validation():
+    with pytest.raises(ValueError):
+        DNSCache(ttl=-1)
+
+
+async def test_dns_cache_lookup_localhost():
+    cache = DNSCache(family=socket.AF_INET)
+    addresses = await cache.resolve("localhost", 44777)
+
+    assert addresses
+    assert all(address[2][1] == 44777 for address in addresses)
+
+
+async def test_connect_happy_eyeballs_races_slow_addresses(monkeypatch):
+    attempts = []
+
+    async def fake_connect_socket(address):
+        attempts.append(address)
+        if address is V6_A:
+            await asyncio.sleep(10)
+        if address is V6_B:
+            raise ConnectionRefusedError()
+        return address
+
+    monkeypatch.setattr(dns, "_connect_socket", fake_connect_socket)
+
+    result = await asyncio.wait_for(
+        connect_happy_eyeballs([V6_A, V6_B, V4_A], delay=0.01), 1
+    )
+
+    assert result is V4_A
+    assert attempts == [V6_A, V6_B, V4_A]
+
+
+async def test_connect_happy_eyeballs_to_local_server():
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    # a port without listeners, which refuses connections
+    closed = socket.socket()
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+
+    sock = await connect_happy_eyeballs(
+        [
+            (socket.AF_INET, socket.IPPROTO_TCP, ("127.0.0.1", closed_port)),
+            (socket.AF_INET, socket.IPPROTO_TCP, ("127.0.0.1", port)),
+        ]
+    )
+    assert sock.getpeername() == ("127.0.0.1", port)
+    sock.close()
+
+    with pytest.raises(OSError):
+        await connect_happy_eyeballs(
+            [(socket.AF_INET, socket.IPPROTO_TCP, ("127.0.0.1", closed_port))]
+        )
+
+    server.close()
+    await server.wait_closed()
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from blacksheep import Request, StreamedContent
+from blacksheep.client import ClientSession
+from blacksheep.client.connection import (
+    DEFAULT_HTTP11_CONNECTION_TYPE,
+    HTTP11Connection,
+    HTTPToolsConnection,
+)
+from blacksheep.client.pool import ConnectionPools
+
+CONNECTION_TYPES = [HTTP11Connection, HTTPToolsConnection]
+
+
+class FakeServer:
+    """
+    Minimal HTTP/1.1 server returning predefined raw responses, in order, and
+    recording the raw requests it receives.
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.connections = 0
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *args):
+        self.server.close()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while self.responses:
+                head = await reader.readuntil(b"\r\n\r\n")
+                body = b""
+                if b"transfer-encoding: chunked" in head.lower():
+                    body = await reader.readuntil(b"0\r\n\r\n")
+                elif b"content-length" in head.lower():
+                    length = int(head.lower().split(b"content-length: ")[1].split()[0])
+                    body = await reader.readexactly(length)
+                self.requests.append(head + body)
+
+                response = self.responses.pop(0)
+                writer.write(response)
+                await writer.drain()
+
+                if b"connection: close" in response.lower():
+                    break
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+
+def get_client(connection_type):
+    return ClientSession(
+        pools=ConnectionPools(http11_connection_type=connection_type),
+        cookie_jar=False,
+    )
+
+
+def test_default_connection_type():
+    assert DEFAULT_HTTP11_CONNECTION_TYPE is HTTPToolsConnection
+
+
+@pytest.mark.parametrize("connection_type", CONNECTION_TYPES)
+async def test_content_length_and_chunked_responses(connection_type):
+    async with FakeServer(
+        [
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+            b"Content-Length: 5\r\n\r\nHello",
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+            b"6\r\nHello,\r\n7\r\n World!\r\n0\r\n\r\n",
+        ]
+    ) as server:
+        async with get_client(connection_type) as client:
+            response = await client.get(server.url + "/a")
+            assert response.status == 200
+            assert await response.text() == "Hello"
+
+            response = await client.get(server.url + "/b")
+            assert response.get_first_header(b"transfer-encoding") == b"chunked"
+            assert await response.text() == "Hello, World!"
+
+    # the connection is reused
+    assert server.connections == 1
+    assert server.requests[0].startswith(b"GET /a HTTP/1.1\r\n")
+
+
+@pytest.mark.parametrize("connection_type", CONNECTION_TYPES)
+async def test_response_read_until_eof(connection_type):
+    async with FakeServer(
+        [b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\nConnection: close\r\n\r\nBye"]
+    ) as server:
+        async with get_client(connection_type) as client:
+            response = await client.get(server.url)
+            assert await response.text() == "Bye"
+
+
+@pytest.mark.parametrize("connection_type", CONNECTION_TYPES)
+async def test_head_and_no_content_responses(connection_type):
+    async with FakeServer(
+        [
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/plain\r\n"
+            b"Content-Length: 5\r\n\r\n",
+            b"HTTP/1.1 204 No Content\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nOK",
+        ]
+    ) as server:
+        async with get_client(connection_type) as client:
+            response = await client.head(server.url)
+            assert response.status == 200
+            assert await response.read() == b""
+
+            response = await client.delete(server.url)
+            assert response.status == 204
+
+            response = await client.get(server.url)
+            assert await response.read() == b"OK"
+
+
+@pytest.mark.parametrize("connection_type", CONNECTION_TYPES)
+async def test_streamed_request_body(connection_type):
+    async def data():
+        yield b"Hello, "
+        yield b"World!"
+
+    async with FakeServer([b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"]) as server:
+        async with get_client(connection_type) as client:
+            response = await client.post(
+                server.url, StreamedContent(b"text/plain", data)
+            )
+            assert response.status == 200
+
+    assert server.requests[0].endswith(
+        b"\r\n\r\n7\r\nHello, \r\n6\r\nWorld!\r\n0\r\n\r\n"
+    )
+
+
+async def test_httptools_connection_rejects_invalid_header_values():
+    async with FakeServer([]) as server:
+        async with get_client(HTTPToolsConnection) as client:
+            with pytest.raises(ValueError):
+                await client.send(
+                    Request(
+                        "GET",
+                        (server.url + "/").encode(),
+                        [(b"X-Foo", b"a\r\nX-Injected: 1")],
+                    )
+                )
@@ -1,12 +1,18 @@
+import asyncio
 import ssl
+import time
 
 import pytest
 
+from blacksheep.client import ClientSession
+from blacksheep.client import pool as pool_module
 from blacksheep.client.connection import (
     INSECURE_SSLCONTEXT,
     SECURE_SSLCONTEXT,
+    HTTP11Connection,
 )
-from blacksheep.client.pool import ConnectionPool, get_ssl_context
+from blacksheep.client.exceptions import ConnectionPoolTimeout
+from blacksheep.client.pool import ConnectionPool, ConnectionsLimit, get_ssl_context
 from blacksheep.exceptions import InvalidArgument
 from blacksheep.utils.aio import get_running_loop
 
@@ -38,3 +44,204 @@ def test_get_ssl_context_raises_for_invalid_argument():
 
     with pytest.raises(InvalidArgument):
         get_ssl_context(b"https", {})  # type: ignore
+
+
+class FakeHTTPConnection:
+    def __init__(self):
+        self.is_open = True
+        self.last_used = time.time()
+
+    async def close(self):
+        self.is_open = False
+
+
+class FakeConnectionPool(ConnectionPool):
+    async def create_connection(self):
+        connection = FakeHTTPConnection()
+        self._created += 1
+        self._creations.append(time.monotonic())
+        return connection
+
+
+def get_pool(**kwargs) -> FakeConnectionPool:
+    return FakeConnectionPool(b"http", b"localhost", 80, http2=False, **kwargs)
+
+
+async def test_connection_pool_reuses_idle_connections():
+    pool = get_pool()
+
+    connection = await pool.get_connection()
+    assert pool.metrics.in_use == 1
+
+    pool.try_return_connection(connection)
+    assert pool.metrics.in_use == 0
+    assert pool.metrics.idle == 1
+
+    assert await pool.get_connection() is connection
+    assert pool.metrics.created == 1
+    await pool.dispose()
+
+
+async def test_connection_pool_max_connections_wait_queue():
+    pool = get_pool(max_connections=2)
+
+    first = await pool.get_connection()
+    second = await pool.get_connection()
+
+    waiter = asyncio.ensure_future(pool.get_connection())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    assert pool.metrics.waiters == 1
+
+    pool.try_return_connection(first)
+    assert await waiter is first
+    assert pool.metrics.in_use == 2
+    assert pool.metrics.waiters == 0
+
+    # closed connections release their slots
+    waiter = asyncio.ensure_future(pool.get_connection())
+    await asyncio.sleep(0)
+    await second.close()
+    pool.release_connection(second)
+    third = await waiter
+    assert third is not second
+    assert pool.metrics.created == 3
+    await pool.dispose()
+
+
+async def test_connection_pool_acquire_timeout():
+    pool = get_pool(max_connections=1, acquire_timeout=0.01)
+    connection = await pool.get_connection()
+
+    with pytest.raises(ConnectionPoolTimeout):
+        await pool.get_connection()
+
+    assert pool.metrics.waiters == 0
+    pool.try_return_connection(connection)
+    assert await pool.get_connection() is connection
+    await pool.dispose()
+
+
+async def test_connection_pool_connection_timeout_excludes_waiting():
+    pool = get_pool(max_connections=1)
+    connection = await pool.get_connection(0.01)
+
+    waiter = asyncio.ensure_future(pool.get_connection(0.01))
+    await asyncio.sleep(0.03)
+    assert not waiter.done()
+
+    pool.try_return_connection(connection)
+    assert await waiter is connection
+    await pool.dispose()
+
+
+async def test_connection_pool_connection_timeout():
+    class SlowConnectionPool(FakeConnectionPool):
+        async def create_connection(self):
+            await asyncio.sleep(1)
+
+    pool = SlowConnectionPool(b"http", b"localhost", 80, http2=False, max_connections=1)
+
+    with pytest.raises(TimeoutError):
+        await pool.get_connection(0.01)
+
+    assert pool.metrics.in_use == 0
+    assert pool._limit.in_use == 0
+    await pool.dispose()
+
+
+async def test_client_session_connection_limits():
+    async with ClientSession(
+        max_connections=10, max_connections_per_host=2, acquire_timeout=0.5
+    ) as session:
+        pool = session.pools.get_pool(b"http", b"localhost", 80, None)
+        assert session.pools.limit.max_connections == 10
+        assert pool.max_connections == 2
+        assert pool.acquire_timeout == 0.5
+
+    async with ClientSession() as session:
+        pool = session.pools.get_pool(b"http", b"localhost", 80, None)
+        assert session.pools.limit.max_connections == 0
+        assert pool.max_connections == 0
+        assert pool.acquire_timeout is None
+
+
+async def test_connection_pools_global_limit():
+    limit = ConnectionsLimit(1)
+    first_pool = FakeConnectionPool(b"http", b"a", 80, http2=False, limit=limit)
+    second_pool = FakeConnectionPool(b"http", b"b", 80, http2=False, limit=limit)
+
+    connection = await first_pool.get_connection()
+    waiter = asyncio.ensure_future(second_pool.get_connection())
+    await asyncio.sleep(0)
+    assert second_pool.metrics.waiters == 1
+
+    first_pool.try_return_connection(connection)
+    await waiter
+    assert limit.in_use == 1
+    await first_pool.dispose()
+    await second_pool.dispose()
+
+
+async def test_connection_pool_closes_idle_connections():
+    pool = get_pool(idle_timeout=0.02)
+    connection = await pool.get_connection()
+    pool.try_return_connection(connection)
+    assert pool.metrics.idle == 1
+
+    await asyncio.sleep(0.05)
+
+    assert connection.is_open is False
+    assert pool.metrics.idle == 0
+    await pool.dispose()
+
+
+def test_connections_limit_validation():
+    with pytest.raises(ValueError):
+        ConnectionsLimit(-1)
+
+
+class FakeSSLObject:
+    def __init__(self, protocol):
+        self.protocol = protocol
+
+    def selected_alpn_protocol(self):
+        return self.protocol
+
+
+class FakeWriter:
+    def __init__(self, protocol):
+        self.ssl_object = FakeSSLObject(protocol)
+        self.closed = False
+
+    def get_extra_info(self, name):
+        return self.ssl_object if name == "ssl_object" else None
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+async def test_connection_pool_reuses_protocol_detection_connection(monkeypatch):
+    opened = []
+
+    async def fake_open_connection(host, port, ssl_context, resolver):
+        writer = FakeWriter("http/1.1")
+        opened.append(writer)
+        return asyncio.StreamReader(), writer
+
+    monkeypatch.setattr(pool_module, "open_connection", fake_open_connection)
+
+    pool = ConnectionPool(b"https", b"example.com", 443)
+    connection = await pool.get_connection()
+
+    assert isinstance(connection, HTTP11Connection)
+    assert connection.writer is opened[0]
+    assert len(opened) == 1
+    assert pool.metrics.created == 1
+    assert pool.metrics.in_use == 1
+
+    pool.release_connection(connection)
+    await pool.dispose()
@@ -1491,3 +1491,168 @@ def test_xml_binder_content_type():
 
 
 # endregion
+
+
+def test_class_converter_reuses_conversion_plans():
+    from blacksheep.server.bindings.converters import ClassConverter
+
+    converter = ClassConverter()
+    data = {
+        "name": "Charlie",
+        "email": "charlie@example.com",
+        "age": 30,
+        "addresses": [
+            {"street": "Main St", "city": "Rome", "zip_code": "00100", "extra": 1},
+            {"street": "Side St", "city": "Oslo", "zip_code": "0150"},
+        ],
+    }
+
+    first = converter.convert(data, UserDc2)
+    assert UserDc2 in converter._plans
+    plan = converter._plans[UserDc2]
+
+    second = converter.convert(data, UserDc2)
+    assert converter._plans[UserDc2] is plan
+    assert first == second
+    assert second.addresses == [
+        AddressDc("Main St", "Rome", "00100"),
+        AddressDc("Side St", "Oslo", "0150"),
+    ]
+
+
+def test_class_converter_plans_handle_missing_and_none_values():
+    from blacksheep.server.bindings.converters import ClassConverter
+
+    @dataclass
+    class Node:
+        value: int
+        parent: AddressDc | None = None
+
+    converter = ClassConverter()
+
+    assert converter.convert({"value": "1"}, Node) == Node(1)
+    assert converter.convert({"value": "2", "parent": None}, Node) == Node(2)
+    assert converter.convert([{"value": "3"}, {"value": "4"}], list[Node]) == [
+        Node(3),
+        Node(4),
+    ]
+
+
+# region typed JSON decoding
+
+from typing import TypeVar  # noqa: E402
+
+from blacksheep.exceptions import BadRequestFormat  # noqa: E402
+from blacksheep.server.bindings import FromJSON  # noqa: E402
+from blacksheep.server.bindings.decoders import get_typed_json_decoder  # noqa: E402
+from blacksheep.server.normalization import get_binders  # noqa: E402
+from blacksheep.server.routing import Route  # noqa: E402
+from blacksheep.testing.helpers import get_example_scope  # noqa: E402
+from blacksheep.testing.messages import MockReceive, MockSend  # noqa: E402
+
+TypedT = TypeVar("TypedT")
+
+
+class TypedJSON(FromJSON[TypedT]):
+    typed_decoding = True
+
+
+def get_typed_json_binder(expected_type) -> JSONBinder:
+    binder = JSONBinder(expected_type, "body", False, True)
+    binder.json_decoder = get_typed_json_decoder(expected_type)
+    assert binder.json_decoder is not None
+    return binder
+
+
+def get_json_body_request(body: bytes) -> Request:
+    return Request("POST", b"/", [JSONContentType]).with_content(
+        Content(b"application/json", body)
+    )
+
+
+@pytest.mark.parametrize(
+    "expected_type,body,expected_value",
+    [
+        (
+            UserDc,
+            b'{"name": "Charlie", "email": "c@example.com", "age": 30, '
+            b'"address": {"street": "Main St", "city": "Rome", "zip_code": "00100"}}',
+            UserDc(
+                "Charlie", "c@example.com", 30, AddressDc("Main St", "Rome", "00100")
+            ),
+        ),
+        (
+            list[AddressDc],
+            b'[{"street": "Main St", "city": "Rome", "zip_code": "00100", "x": 1}]',
+            [AddressDc("Main St", "Rome", "00100")],
+        ),
+        (
+            AddressModel,
+            b'{"street": "Main St", "city": "Rome", "zip_code": "00100"}',
+            AddressModel(street="Main St", city="Rome", zip_code="00100"),
+        ),
+    ],
+)
+async def test_json_binder_typed_decoding(expected_type, body, expected_value):
+    binder = get_typed_json_binder(expected_type)
+
+    value = await binder.get_value(get_json_body_request(body))
+
+    assert value == expected_value
+
+
+async def test_json_binder_typed_decoding_invalid_json():
+    binder = get_typed_json_binder(AddressDc)
+
+    with raises(BadRequestFormat):
+        await binder.get_value(get_json_body_request(b'{"street": '))
+
+
+async def test_json_binder_typed_decoding_invalid_value():
+    binder = get_typed_json_binder(AddressDc)
+
+    with raises(InvalidRequestBody):
+        await binder.get_value(get_json_body_request(b'{"street": "Main St"}'))
+
+
+async def test_json_binder_typed_decoding_missing_body():
+    binder = get_typed_json_binder(AddressDc)
+
+    with raises(MissingBodyError):
+        await binder.get_value(get_json_body_request(b""))
+
+
+def test_get_typed_json_decoder_unsupported_type():
+    assert get_typed_json_decoder(ExampleOne) is None
+
+
+def test_typed_json_binder_decoder_is_compiled_for_request_handler():
+    async def typed(data: TypedJSON[AddressDc]): ...
+
+    async def untyped(data: FromJSON[AddressDc]): ...
+
+    typed_binder = get_binders(Route(b"/", typed), Container())[0]
+    untyped_binder = get_binders(Route(b"/", untyped), Container())[0]
+
+    assert isinstance(typed_binder, JSONBinder)
+    assert typed_binder.json_decoder is not None
+    assert untyped_binder.json_decoder is None
+
+
+async def test_typed_json_request_handler(app):
+    @app.router.post("/")
+    async def home(data: TypedJSON[AddressDc]):
+        assert isinstance(data.value, AddressDc)
+        return data.value.city
+
+    await app(
+        get_example_scope("POST", "/", [(b"content-type", b"application/json")]),
+        MockReceive([b'{"street": "Main St", "city": "Rome", "zip_code": "00100"}']),
+        MockSend(),
+    )
+
+    assert app.response.status == 200
+    assert await app.response.text() == "Rome"
+
+
+# endregion
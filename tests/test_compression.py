@@ -0,0 +1,278 @@
+import gzip
+import zlib
+
+import brotli
+import pytest
+import zstandard
+
+from blacksheep import Content, Response, StreamedContent
+from blacksheep.server.compression import (
+    BrotliEncoder,
+    CompressionMiddleware,
+    DeflateEncoder,
+    GzipEncoder,
+    ZstdEncoder,
+    use_compression,
+)
+from blacksheep.server.headers.encoding import parse_accept_encoding
+from blacksheep.server.responses import json
+from blacksheep.testing.helpers import get_example_scope
+from blacksheep.testing.messages import MockReceive, MockSend
+
+LOREM_IPSUM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+    "eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim "
+    "veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo "
+    "consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum "
+    "dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, "
+    "sunt in culpa qui officia deserunt mollit anim id est laborum."
+)
+
+
+DECOMPRESS = {
+    b"br": brotli.decompress,
+    b"zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+    b"gzip": gzip.decompress,
+    b"deflate": zlib.decompress,
+}
+
+
+def get_body(mock_send: MockSend) -> bytes:
+    return b"".join(
+        message.get("body", b"")
+        for message in mock_send.messages
+        if message["type"] == "http.response.body"
+    )
+
+
+async def call_app(app, accept_encoding: bytes) -> MockSend:
+    mock_send = MockSend()
+    await app(
+        get_example_scope("GET", "/", accept_encoding=accept_encoding),
+        MockReceive([]),
+        mock_send,
+    )
+    return mock_send
+
+
+@pytest.mark.parametrize(
+    "value,expected_result",
+    [
+        (b"gzip", {b"gzip": 1.0}),
+        (b"gzip, deflate, br", {b"gzip": 1.0, b"deflate": 1.0, b"br": 1.0}),
+        (b"GZIP;q=0.5, br;q=1.0", {b"gzip": 0.5, b"br": 1.0}),
+        (b"br;q=0, *;q=0.1", {b"br": 0.0, b"*": 0.1}),
+        (b"gzip;q=nope, ,", {b"gzip": 0.0}),
+        (b"", {}),
+    ],
+)
+def test_parse_accept_encoding(value, expected_result):
+    assert parse_accept_encoding(value) == expected_result
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected_encoding",
+    [
+        (b"gzip, deflate", b"gzip"),
+        (b"deflate", b"deflate"),
+        (b"gzip, deflate, br, zstd", b"br"),
+        (b"gzip, zstd", b"zstd"),
+        (b"br;q=0.5, gzip", b"gzip"),
+        (b"*", b"br"),
+        (b"br;q=0, *;q=0.5", b"zstd"),
+        (b"identity", None),
+        (b"gzip;q=0", None),
+        (b"", None),
+        (None, None),
+    ],
+)
+def test_compression_middleware_get_encoder(accept_encoding, expected_encoding):
+    middleware = CompressionMiddleware()
+    encoder = middleware.get_encoder(accept_encoding)
+
+    if expected_encoding is None:
+        assert encoder is None
+    else:
+        assert encoder is not None
+        assert encoder.name == expected_encoding
+        # the selection is cached by header value
+        assert middleware.get_encoder(accept_encoding) is encoder
+
+
+@pytest.mark.parametrize("accept_encoding", [b"br", b"zstd", b"gzip", b"deflate"])
+async def test_compression_middleware_buffered_response(app, accept_encoding):
+    @app.router.get("/")
+    async def home():
+        return LOREM_IPSUM
+
+    use_compression(app, CompressionMiddleware(min_size=0))
+
+    await app.start()
+    mock_send = await call_app(app, accept_encoding)
+
+    response = app.response
+    assert response.status == 200
+    assert response.headers.get_single(b"content-encoding") == accept_encoding
+    assert response.headers.get_single(b"vary") == b"Accept-Encoding"
+    body = get_body(mock_send)
+    assert len(body) < len(LOREM_IPSUM)
+    assert DECOMPRESS[accept_encoding](body) == LOREM_IPSUM.encode()
+
+
+@pytest.mark.parametrize("accept_encoding", [b"br", b"zstd", b"gzip", b"deflate"])
+async def test_compression_middleware_streamed_response(app, accept_encoding):
+    chunks = [b"[", *([b'{"id": 1, "name": "Lorem ipsum"},'] * 500), b"{}]"]
+
+    @app.router.get("/")
+    async def home():
+        async def data_provider():
+            for chunk in chunks:
+                yield chunk
+
+        return Response(
+            200, content=StreamedContent(b"application/json", data_provider)
+        )
+
+    use_compression(app)
+
+    await app.start()
+    mock_send = await call_app(app, accept_encoding)
+
+    response = app.response
+    assert response.status == 200
+    assert response.headers.get_single(b"content-encoding") == accept_encoding
+    assert response.headers.get_single(b"vary") == b"Accept-Encoding"
+    body = get_body(mock_send)
+    assert len(body) < len(b"".join(chunks))
+    assert DECOMPRESS[accept_encoding](body) == b"".join(chunks)
+
+
+@pytest.mark.parametrize(
+    "encoder", [BrotliEncoder(), ZstdEncoder(), GzipEncoder(), DeflateEncoder()]
+)
+def test_stream_compressor_flush_makes_data_available(encoder):
+    compressor = encoder.get_compressor()
+    decompressor = {
+        b"br": brotli.Decompressor(),
+        b"zstd": zstandard.ZstdDecompressor().decompressobj(),
+        b"gzip": zlib.decompressobj(16 + zlib.MAX_WBITS),
+        b"deflate": zlib.decompressobj(),
+    }[encoder.name]
+    decompress = getattr(decompressor, "process", None) or decompressor.decompress
+
+    for event in (b"data: hello\n\n", b"data: world\n\n"):
+        data = compressor.compress(event) + compressor.flush()
+        assert decompress(data) == event
+
+
+async def test_compression_middleware_skips_small_responses(app):
+    @app.router.get("/")
+    async def home():
+        return "Hello, World"
+
+    use_compression(app)
+
+    await app.start()
+    mock_send = await call_app(app, b"gzip")
+
+    response = app.response
+    assert response.get_first_header(b"content-encoding") is None
+    # the response is never compressed, it does not vary by Accept-Encoding
+    assert response.get_first_header(b"vary") is None
+    assert get_body(mock_send) == b"Hello, World"
+
+
+async def test_compression_middleware_without_accept_encoding(app):
+    @app.router.get("/")
+    async def home():
+        return json([{"id": index} for index in range(200)])
+
+    use_compression(app)
+
+    await app.start()
+    await call_app(app, b"")
+
+    response = app.response
+    assert response.get_first_header(b"content-encoding") is None
+    assert response.headers.get_single(b"vary") == b"Accept-Encoding"
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [b"image/png", b"image/jpeg", b"application/zip", b"application/octet-stream"],
+)
+async def test_compression_middleware_skips_compressed_types(app, content_type):
+    @app.router.get("/")
+    async def home():
+        async def data_provider():
+            yield b"x" * 1000
+
+        return Response(200, content=StreamedContent(content_type, data_provider))
+
+    use_compression(app)
+
+    await app.start()
+    await call_app(app, b"gzip")
+
+    response = app.response
+    assert response.get_first_header(b"content-encoding") is None
+    assert response.get_first_header(b"vary") is None
+
+
+async def test_compression_middleware_skips_encoded_responses(app):
+    @app.router.get("/")
+    async def home():
+        response = json([{"id": index} for index in range(200)])
+        response.add_header(b"content-encoding", b"identity")
+        return response
+
+    use_compression(app)
+
+    await app.start()
+    await call_app(app, b"gzip")
+
+    response = app.response
+    assert response.headers.get_single(b"content-encoding") == b"identity"
+
+
+async def test_compression_middleware_compresses_svg(app):
+    @app.router.get("/")
+    async def home():
+        return Response(
+            200,
+            content=Content(
+                b"image/svg+xml", ("<svg>" + LOREM_IPSUM * 2 + "</svg>").encode()
+            ),
+        )
+
+    use_compression(app)
+
+    await app.start()
+    await call_app(app, b"gzip")
+
+    assert app.response.get_first_header(b"content-encoding") == b"gzip"
+
+
+@pytest.mark.parametrize(
+    "vary,expected_vary",
+    [
+        ([b"Origin"], b"Origin, Accept-Encoding"),
+        ([b"Origin", b"Cookie"], b"Origin, Cookie, Accept-Encoding"),
+        ([b"accept-encoding"], b"accept-encoding"),
+        ([b"*"], b"*"),
+    ],
+)
+async def test_compression_middleware_merges_vary_header(app, vary, expected_vary):
+    @app.router.get("/")
+    async def home():
+        response = json([{"id": index} for index in range(200)])
+        for value in vary:
+            response.add_header(b"vary", value)
+        return response
+
+    use_compression(app)
+
+    await app.start()
+    await call_app(app, b"gzip")
+
+    assert app.response.headers.get_single(b"vary") == expected_vary
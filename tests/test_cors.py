@@ -801,3 +801,81 @@ async def test_response_to_cors_request_contains_single_allow_origin(app):
         == b"https://www.neoteroi.xyz"
     )
     assert response.headers.get_single(b"Access-Control-Expose-Headers") is not None
+
+
+async def test_cors_preflight_responses_are_cached(app):
+    app.use_cors(
+        allow_methods="GET POST",
+        allow_headers="X-Foo",
+        allow_origins="https://www.neoteroi.dev",
+        allow_credentials=True,
+    )
+
+    @app.router.post("/")
+    async def home():
+        return text("Hello, World")
+
+    await app.start()
+
+    scope_headers = [
+        (b"Origin", b"https://www.neoteroi.dev"),
+        (b"Access-Control-Request-Method", b"POST"),
+        (b"Access-Control-Request-Headers", b"X-Foo"),
+    ]
+    responses = []
+
+    for _ in range(2):
+        await app(
+            get_example_scope("OPTIONS", "/", scope_headers),
+            MockReceive(),
+            MockSend(),
+        )
+        responses.append(app.response)
+
+    assert len(app.cors.preflight_cache) == 1
+
+    first_response, second_response = responses
+    assert first_response is not second_response
+    assert second_response.status == 200
+
+    for name in (
+        b"Access-Control-Allow-Origin",
+        b"Access-Control-Allow-Methods",
+        b"Access-Control-Allow-Headers",
+        b"Access-Control-Allow-Credentials",
+        b"Access-Control-Max-Age",
+        b"Vary",
+    ):
+        assert first_response.headers.get(name) == second_response.headers.get(name)
+
+    # invalid preflight requests are not cached
+    await app(
+        get_example_scope(
+            "OPTIONS",
+            "/",
+            [
+                (b"Origin", b"https://www.neoteroi.dev"),
+                (b"Access-Control-Request-Method", b"POST"),
+                (b"Access-Control-Request-Headers", b"X-Ufo"),
+            ],
+        ),
+        MockReceive(),
+        MockSend(),
+    )
+
+    assert app.response.status == 400
+    assert len(app.cors.preflight_cache) == 1
+
+
+def test_cors_policy_encodes_header_values():
+    policy = CORSPolicy(allow_methods="GET", max_age=60, expose_headers="X-Foo")
+
+    assert policy._encoded_allow_methods == b"GET"
+    assert policy._encoded_max_age == b"60"
+    assert policy._encoded_expose_headers == b"x-foo"
+
+    policy.allow_any_method()
+    policy.max_age = 10
+
+    assert policy._encoded_allow_methods == b"*"
+    assert policy._encoded_max_age == b"10"
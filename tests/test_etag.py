@@ -0,0 +1,188 @@
+import pytest
+
+from blacksheep import Response, StreamedContent
+from blacksheep.server.compression import CompressionMiddleware, use_compression
+from blacksheep.server.headers.etag import (
+    ETagMiddleware,
+    etag_matches,
+    get_body_etag,
+    weaken_etag,
+)
+from blacksheep.server.responses import json, text
+from blacksheep.testing.helpers import get_example_scope
+from blacksheep.testing.messages import MockReceive, MockSend
+
+LAST_MODIFIED = b"Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+async def call_app(
+    app, method="GET", extra_headers=None, accept_encoding=b"identity"
+) -> bytes:
+    mock_send = MockSend()
+    await app(
+        get_example_scope(method, "/", extra_headers, accept_encoding=accept_encoding),
+        MockReceive([]),
+        mock_send,
+    )
+    return b"".join(
+        message.get("body", b"")
+        for message in mock_send.messages
+        if message["type"] == "http.response.body"
+    )
+
+
+@pytest.mark.parametrize(
+    "if_none_match,etag,expected_result",
+    [
+        (b'"a"', b'"a"', True),
+        (b'"a"', b'W/"a"', True),
+        (b'W/"a"', b'"a"', True),
+        (b'"b", "a"', b'"a"', True),
+        (b"*", b'"a"', True),
+        (b'"b"', b'"a"', False),
+        (b'"ab"', b'"a"', False),
+    ],
+)
+def test_etag_matches(if_none_match, etag, expected_result):
+    assert etag_matches(if_none_match, etag) is expected_result
+
+
+def test_weaken_etag():
+    assert weaken_etag(b'"a"') == b'W/"a"'
+    assert weaken_etag(b'W/"a"') == b'W/"a"'
+
+
+async def test_etag_middleware(app):
+    @app.router.get("/")
+    async def home():
+        return json({"id": 1, "name": "Lorem ipsum"})
+
+    app.middlewares.append(ETagMiddleware())
+    await app.start()
+
+    body = await call_app(app)
+    etag = app.response.get_first_header(b"etag")
+    assert etag == f'"{get_body_etag(body)}"'.encode()
+
+    body = await call_app(app, extra_headers=[(b"If-None-Match", etag)])
+    assert app.response.status == 304
+    assert app.response.get_first_header(b"etag") == etag
+    assert body == b""
+
+    await call_app(app, extra_headers=[(b"If-None-Match", b'"nope"')])
+    assert app.response.status == 200
+
+
+async def test_etag_middleware_weak(app):
+    @app.router.get("/")
+    async def home():
+        return text("Hello, World")
+
+    app.middlewares.append(ETagMiddleware(weak=True))
+    await app.start()
+
+    await call_app(app)
+    etag = app.response.get_first_header(b"etag")
+    assert etag is not None and etag.startswith(b'W/"')
+
+    await call_app(app, extra_headers=[(b"If-None-Match", etag)])
+    assert app.response.status == 304
+
+
+async def test_etag_middleware_max_body_size(app):
+    @app.router.get("/")
+    async def home():
+        return text("Hello, World")
+
+    app.middlewares.append(ETagMiddleware(max_body_size=5))
+    await app.start()
+
+    await call_app(app, extra_headers=[(b"If-None-Match", b"*")])
+    assert app.response.status == 200
+    assert app.response.get_first_header(b"etag") is None
+
+
+async def test_etag_middleware_uses_handler_validators(app):
+    @app.router.get("/")
+    async def home():
+        async def data_provider():
+            yield b"Hello, World"
+
+        return Response(
+            200,
+            [(b"ETag", b'"v1"'), (b"Last-Modified", LAST_MODIFIED)],
+            StreamedContent(b"text/plain", data_provider),
+        )
+
+    app.middlewares.append(ETagMiddleware())
+    await app.start()
+
+    await call_app(app, extra_headers=[(b"If-None-Match", b'"v1"')])
+    assert app.response.status == 304
+    assert app.response.get_first_header(b"last-modified") == LAST_MODIFIED
+
+    # If-Modified-Since is ignored when If-None-Match is present
+    await call_app(
+        app,
+        extra_headers=[
+            (b"If-None-Match", b'"v0"'),
+            (b"If-Modified-Since", LAST_MODIFIED),
+        ],
+    )
+    assert app.response.status == 200
+
+    await call_app(app, extra_headers=[(b"If-Modified-Since", LAST_MODIFIED)])
+    assert app.response.status == 304
+
+    await call_app(
+        app, extra_headers=[(b"If-Modified-Since", b"Tue, 20 Oct 2015 07:28:00 GMT")]
+    )
+    assert app.response.status == 200
+
+    await call_app(app, extra_headers=[(b"If-Modified-Since", b"invalid")])
+    assert app.response.status == 200
+
+
+async def test_etag_middleware_ignores_unsafe_methods_and_errors(app):
+    @app.router.post("/")
+    async def create():
+        return text("Hello, World")
+
+    @app.router.get("/")
+    async def home():
+        return text("Not found", 404)
+
+    app.middlewares.append(ETagMiddleware())
+    await app.start()
+
+    await call_app(app, "POST", [(b"If-None-Match", b"*")])
+    assert app.response.status == 200
+    assert app.response.get_first_header(b"etag") is None
+
+    await call_app(app, extra_headers=[(b"If-None-Match", b"*")])
+    assert app.response.status == 404
+
+
+async def test_compression_weakens_etags(app):
+    @app.router.get("/")
+    async def home():
+        return json([{"id": index} for index in range(200)])
+
+    use_compression(app, CompressionMiddleware(min_size=0))
+    app.middlewares.append(ETagMiddleware())
+    await app.start()
+
+    await call_app(app)
+    etag = app.response.get_first_header(b"etag")
+    assert etag is not None and etag.startswith(b'"')
+
+    await call_app(app, accept_encoding=b"gzip")
+    assert app.response.get_first_header(b"content-encoding") == b"gzip"
+    assert app.response.get_first_header(b"etag") == weaken_etag(etag)
+
+    await call_app(
+        app,
+        extra_headers=[(b"If-None-Match", etag)],
+        accept_encoding=b"gzip",
+    )
+    assert app.response.status == 304
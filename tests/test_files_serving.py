@@ -1,3 +1,6 @@
+import hashlib
+import os
+import threading
 from asyncio import AbstractEventLoop
 from datetime import datetime
 from pathlib import Path
@@ -6,8 +9,10 @@ from unittest.mock import create_autospec
 import pytest
 from essentials.folders import get_file_extension
 
+import blacksheep.server.files as files_module
 from blacksheep import Application, Request
 from blacksheep.common.files.asyncfs import FileContext, FilesHandler
+from blacksheep.common.files.info import FileInfoCache
 from blacksheep.exceptions import BadRequest, InvalidArgument
 from blacksheep.ranges import Range, RangePart
 from blacksheep.server.files import (
@@ -19,6 +24,7 @@ from blacksheep.server.files import (
     get_range_file_getter,
     validate_source_path,
 )
+from blacksheep.server.files.cache import HotFilesCache
 from blacksheep.server.files.dynamic import get_response_for_file
 from blacksheep.server.files.static import get_response_for_static_content
 from blacksheep.server.headers.cache import CacheControlHeaderValue
@@ -1193,3 +1199,444 @@ async def test_mounted_app_without_child_prefix_returns_404_for_unknown_file():
     await parent_app(scope, MockReceive(), send)
 
     assert send.messages[0]["status"] == 404
+
+
+# -- Precompressed files and hot files cache --------------------------------
+
+
+@pytest.fixture
+def precompressed_folder(tmp_path):
+    import gzip
+
+    import brotli
+
+    source = b"console.log('Hello, World');\n" * 100
+    (tmp_path / "app.js").write_bytes(source)
+    (tmp_path / "app.js.br").write_bytes(brotli.compress(source))
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(source))
+    (tmp_path / "lorem.txt").write_bytes(b"Lorem ipsum dolor sit amet")
+    return tmp_path
+
+
+async def _get_file(app, path: str, accept_encoding: bytes, extra_headers=None):
+    send = MockSend()
+    await app(
+        get_example_scope("GET", path, extra_headers, accept_encoding=accept_encoding),
+        MockReceive(),
+        send,
+    )
+    return app.response, _collect_send_body(send)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected_encoding,expected_file",
+    [
+        (b"gzip, deflate, br", b"br", "app.js.br"),
+        (b"gzip;q=1.0, br;q=0.5", b"gzip", "app.js.gz"),
+        (b"gzip", b"gzip", "app.js.gz"),
+        (b"zstd", None, "app.js"),
+        (b"", None, "app.js"),
+    ],
+)
+async def test_serve_files_precompressed(
+    app, precompressed_folder, accept_encoding, expected_encoding, expected_file
+):
+    app.serve_files(precompressed_folder, precompressed=True)
+    await app.start()
+
+    response, body = await _get_file(app, "/app.js", accept_encoding)
+
+    assert response.status == 200
+    assert response.get_first_header(b"content-encoding") == expected_encoding
+    assert response.get_first_header(b"vary") == b"Accept-Encoding"
+    assert response.content.type == b"application/javascript"
+    assert body == (precompressed_folder / expected_file).read_bytes()
+
+
+async def test_serve_files_precompressed_etags_differ(app, precompressed_folder):
+    app.serve_files(precompressed_folder, precompressed=True)
+    await app.start()
+
+    response, _ = await _get_file(app, "/app.js", b"br")
+    br_etag = response.get_first_header(b"etag")
+    response, _ = await _get_file(app, "/app.js", b"")
+    etag = response.get_first_header(b"etag")
+    assert br_etag != etag
+
+    response, _ = await _get_file(app, "/app.js", b"br", [(b"if-none-match", br_etag)])
+    assert response.status == 304
+    assert response.get_first_header(b"content-encoding") == b"br"
+
+
+async def test_serve_files_precompressed_range_uses_original(app, precompressed_folder):
+    app.serve_files(precompressed_folder, precompressed=True)
+    await app.start()
+
+    response, body = await _get_file(app, "/app.js", b"br", [(b"range", b"bytes=0-9")])
+
+    assert response.status == 206
+    assert response.get_first_header(b"content-encoding") is None
+    assert body == (precompressed_folder / "app.js").read_bytes()[:10]
+
+
+async def test_serve_files_without_precompressed(app, precompressed_folder):
+    app.serve_files(precompressed_folder)
+    await app.start()
+
+    response, body = await _get_file(app, "/app.js", b"br, gzip")
+
+    assert response.get_first_header(b"content-encoding") is None
+    assert response.get_first_header(b"vary") is None
+    assert body == (precompressed_folder / "app.js").read_bytes()
+
+
+async def test_serve_files_hot_files_cache(app, precompressed_folder):
+    hot_files = HotFilesCache(check_interval=60)
+    app.serve_files(precompressed_folder, precompressed=True, hot_files=hot_files)
+    await app.start()
+
+    file_path = str(precompressed_folder / "lorem.txt")
+    response, body = await _get_file(app, "/lorem.txt", b"")
+    assert body == b"Lorem ipsum dolor sit amet"
+    assert file_path in hot_files
+
+    etag = response.get_first_header(b"etag")
+
+    # cached files are served from memory until they are revalidated
+    (precompressed_folder / "lorem.txt").write_bytes(b"Changed")
+    response, body = await _get_file(app, "/lorem.txt", b"")
+    assert body == b"Lorem ipsum dolor sit amet"
+    assert response.get_first_header(b"etag") == etag
+
+    response, _ = await _get_file(app, "/lorem.txt", b"", [(b"if-none-match", etag)])
+    assert response.status == 304
+
+    hot_files.check_interval = 0
+    response, body = await _get_file(app, "/lorem.txt", b"")
+    assert body == b"Changed"
+
+
+async def test_serve_files_hot_files_cache_precompressed(app, precompressed_folder):
+    hot_files = HotFilesCache(check_interval=60)
+    app.serve_files(precompressed_folder, precompressed=True, hot_files=hot_files)
+    await app.start()
+
+    for accept_encoding, expected_file in [
+        (b"br", "app.js.br"),
+        (b"gzip", "app.js.gz"),
+        (b"", "app.js"),
+    ]:
+        for _ in range(2):
+            response, body = await _get_file(app, "/app.js", accept_encoding)
+            assert body == (precompressed_folder / expected_file).read_bytes()
+            assert response.get_first_header(b"vary") == b"Accept-Encoding"
+
+    assert len(hot_files) == 3
+
+    # precompressed files are not served directly, even if cached
+    response, _ = await _get_file(app, "/app.js.br", b"br")
+    assert response.status == 404
+
+
+async def test_serve_files_hot_files_cache_precompressed_only(
+    app, precompressed_folder, monkeypatch
+):
+    hot_files = HotFilesCache(check_interval=60)
+    app.serve_files(precompressed_folder, precompressed=True, hot_files=hot_files)
+    await app.start()
+
+    reads = []
+    load = HotFilesCache.load
+
+    async def counting_load(self, file_path, *args):
+        reads.append(file_path)
+        return await load(self, file_path, *args)
+
+    monkeypatch.setattr(HotFilesCache, "load", counting_load)
+
+    # clients supporting compression are served from memory, even if the original
+    # file was never requested
+    for _ in range(3):
+        response, body = await _get_file(app, "/app.js", b"gzip")
+        assert body == (precompressed_folder / "app.js.gz").read_bytes()
+        assert response.get_first_header(b"content-encoding") == b"gzip"
+
+    assert reads == [str(precompressed_folder / "app.js.gz")]
+
+    for _ in range(2):
+        response, body = await _get_file(app, "/app.js", b"br")
+        assert body == (precompressed_folder / "app.js.br").read_bytes()
+
+    assert reads[1:] == [str(precompressed_folder / "app.js.br")]
+    assert str(precompressed_folder / "app.js") not in hot_files
+
+
+async def test_serve_files_precompressed_reads_files_in_thread_pool(
+    app, precompressed_folder, monkeypatch
+):
+    app.serve_files(precompressed_folder, precompressed=True)
+    await app.start()
+
+    threads = []
+    get_sidecars = files_module.get_precompressed_sidecars
+
+    def get_precompressed_sidecars(resource_path):
+        threads.append(threading.current_thread())
+        return get_sidecars(resource_path)
+
+    monkeypatch.setattr(
+        files_module, "get_precompressed_sidecars", get_precompressed_sidecars
+    )
+
+    response, body = await _get_file(app, "/app.js", b"gzip")
+
+    assert response.get_first_header(b"content-encoding") == b"gzip"
+    assert body == (precompressed_folder / "app.js.gz").read_bytes()
+    assert threads and threads[0] is not threading.main_thread()
+
+
+async def test_serve_files_hot_files_cache_index(app, files2_index_contents: bytes):
+    hot_files = HotFilesCache()
+    app.serve_files(
+        get_folder_path("files2"),
+        hot_files=hot_files,
+        default_file_options=DefaultFileOptions(
+            cache_control=CacheControlHeaderValue(no_cache=True)
+        ),
+    )
+    await app.start()
+
+    for _ in range(2):
+        response, body = await _get_file(app, "/", b"")
+        assert response.status == 200
+        assert body == files2_index_contents
+        assert response.get_first_header(b"cache-control") == b"no-cache"
+
+    assert len(hot_files) == 1
+
+
+async def test_hot_files_cache_size_limits(tmp_path):
+    hot_files = HotFilesCache(max_size=100, max_file_size=60)
+
+    for name, size in [("a", 40), ("b", 40), ("c", 40), ("d", 70)]:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        info = FileInfo.from_path(str(path))
+        assert await hot_files.load(str(path), info) == b"x" * size
+
+    # "a" was evicted to respect max_size, "d" is larger than max_file_size
+    assert str(tmp_path / "a") not in hot_files
+    assert str(tmp_path / "d") not in hot_files
+    assert len(hot_files) == 2
+    assert hot_files.size == 80
+
+    hot_files.clear()
+    assert hot_files.size == 0
+
+    with pytest.raises(ValueError):
+        HotFilesCache(max_size=-1)
+
+
+# -- ASGI pathsend and zerocopysend extensions ------------------------------
+
+
+async def _get_file_with_extensions(app, path: str, extensions, extra_headers=None):
+    scope = get_example_scope("GET", path, extra_headers)
+    scope["extensions"] = extensions
+    send = MockSend()
+    await app(scope, MockReceive(), send)
+    return app.response, send.messages
+
+
+async def test_serve_files_uses_asgi_pathsend(app):
+    app.serve_files(get_folder_path("files3"))
+    await app.start()
+
+    file_path = get_file_path("lorem-ipsum.txt", "files3")
+    response, messages = await _get_file_with_extensions(
+        app, "/lorem-ipsum.txt", {"http.response.pathsend": {}}
+    )
+
+    assert response.status == 200
+    assert messages[0]["type"] == "http.response.start"
+    assert (b"content-length", str(os.path.getsize(file_path)).encode()) in messages[0][
+        "headers"
+    ]
+    assert messages[1:] == [
+        {"type": "http.response.pathsend", "path": os.path.abspath(file_path)}
+    ]
+
+
+@pytest.mark.parametrize(
+    "range_value,expected_offset,expected_count",
+    [(b"bytes=0-", 0, None), (b"bytes=10-19", 10, 10), (b"bytes=-5", None, 5)],
+)
+async def test_serve_files_uses_asgi_zerocopysend(
+    app, range_value, expected_offset, expected_count
+):
+    app.serve_files(get_folder_path("files3"))
+    await app.start()
+
+    file_path = get_file_path("lorem-ipsum.txt", "files3")
+    file_size = os.path.getsize(file_path)
+    sent_files = []
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message["file"].seek(message["offset"])
+            sent_files.append(message["file"].read(message["count"]))
+        messages.append(message)
+
+    messages = []
+    scope = get_example_scope("GET", "/lorem-ipsum.txt", [(b"range", range_value)])
+    scope["extensions"] = {
+        "http.response.pathsend": {},
+        "http.response.zerocopysend": {},
+    }
+    await app(scope, MockReceive(), send)
+
+    if expected_offset is None:
+        expected_offset = file_size - expected_count
+    if expected_count is None:
+        expected_count = file_size - expected_offset
+
+    assert app.response.status == 206
+    assert messages[1]["type"] == "http.response.zerocopysend"
+    assert messages[1]["offset"] == expected_offset
+    assert messages[1]["count"] == expected_count
+    assert messages[1]["more_body"] is False
+    assert messages[1]["file"].closed
+
+    with open(file_path, "rb") as file:
+        file.seek(expected_offset)
+        assert sent_files == [file.read(expected_count)]
+
+
+async def test_serve_files_without_sendfile_extensions_streams_file(app):
+    app.serve_files(get_folder_path("files3"))
+    await app.start()
+
+    file_path = get_file_path("lorem-ipsum.txt", "files3")
+    response, messages = await _get_file_with_extensions(
+        app, "/lorem-ipsum.txt", {"http.response.trailers": {}}
+    )
+
+    assert all(message["type"] != "http.response.pathsend" for message in messages)
+    with open(file_path, "rb") as file:
+        assert b"".join(message.get("body", b"") for message in messages) == file.read()
+
+
+async def test_serve_files_multipart_ranges_are_streamed(app):
+    app.serve_files(get_folder_path("files3"))
+    await app.start()
+
+    response, messages = await _get_file_with_extensions(
+        app,
+        "/lorem-ipsum.txt",
+        {"http.response.zerocopysend": {}},
+        [(b"range", b"bytes=0-4, 10-14")],
+    )
+
+    assert response.status == 206
+    assert all(
+        message["type"] in {"http.response.start", "http.response.body"}
+        for message in messages
+    )
+
+
+# -- Files information cache ------------------------------------------------
+
+
+async def test_file_info_cache(tmp_path):
+    file_path = tmp_path / "example.txt"
+    file_path.write_bytes(b"Hello, World")
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "link.txt").symlink_to(file_path)
+
+    cache = FileInfoCache(ttl=60)
+    info = await cache.get_file_info(str(file_path))
+
+    assert info is not None
+    assert info.size == 12
+    assert info.mime == "text/plain"
+    assert info.etag == FileInfo.from_path(str(file_path)).etag
+    assert cache.get(str(file_path)) is info
+    assert await cache.get_file_info(str(file_path)) is info
+
+    for path in ("folder", "link.txt", "missing.txt"):
+        assert await cache.get_file_info(str(tmp_path / path)) is None
+    assert len(cache) == 1
+
+    # expired information is read again; it is kept if the file did not change
+    cache.ttl = 0
+    assert cache.get(str(file_path)) is None
+    assert await cache.get_file_info(str(file_path)) is info
+
+    file_path.write_bytes(b"Hello, World!")
+    os.utime(file_path, (1, 1))
+    changed_info = await cache.get_file_info(str(file_path))
+    assert changed_info is not None
+    assert changed_info.size == 13
+    assert changed_info.etag != info.etag
+
+    file_path.unlink()
+    assert await cache.get_file_info(str(file_path)) is None
+    assert len(cache) == 0
+
+
+async def test_file_info_cache_load_folder(tmp_path):
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "scripts" / "app.js").write_bytes(b"console.log('Hello');")
+    (tmp_path / "app.css").write_bytes(b"body { color: red; }")
+    (tmp_path / "notes.md").write_bytes(b"# Notes")
+
+    cache = FileInfoCache(ttl=0)
+    await cache.load_folder(str(tmp_path), {".js", ".css"})
+
+    assert len(cache) == 2
+    info = cache.get(os.path.join(str(tmp_path), "scripts", "app.js"))
+    assert info is not None
+    assert info.mime == "application/javascript"
+    assert (
+        info.etag
+        == hashlib.blake2b(b"console.log('Hello');", digest_size=16).hexdigest()
+    )
+
+    # immutable files are never verified again
+    (tmp_path / "app.css").unlink()
+    assert await cache.get_file_info(os.path.join(str(tmp_path), "app.css"))
+
+
+async def test_serve_files_with_file_info_cache(app):
+    cache = FileInfoCache()
+    app.serve_files(get_folder_path("files2"), file_info_cache=cache)
+    await app.start()
+
+    file_path = get_file_path("scripts/main.js", "files2")
+    response, body = await _get_file(app, "/scripts/main.js", b"")
+    assert response.status == 200
+    with open(file_path, "rb") as file:
+        assert body == file.read()
+    assert os.path.join(get_folder_path("files2"), "scripts/main.js") in cache
+
+    # folders are still handled reading the file system
+    response, _ = await _get_file(app, "/", b"")
+    assert response.status == 200
+
+    response, _ = await _get_file(app, "/not-existing.xml", b"")
+    assert response.status == 404
+
+
+async def test_serve_files_immutable(app, files2_index_contents: bytes):
+    app.serve_files(get_folder_path("files2"), immutable=True)
+    await app.start()
+
+    expected_etag = hashlib.blake2b(files2_index_contents, digest_size=16).hexdigest()
+    response, body = await _get_file(app, "/index.html", b"")
+    assert body == files2_index_contents
+    assert response.get_first_header(b"etag") == expected_etag.encode()
+
+    response, _ = await _get_file(
+        app, "/index.html", b"", [(b"if-none-match", expected_etag.encode())]
+    )
+    assert response.status == 304
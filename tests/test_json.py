@@ -0,0 +1,145 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from blacksheep import Content, JSONContent, Request
+from blacksheep.exceptions import BadRequestFormat
+from blacksheep.server.responses import json as json_response
+from blacksheep.settings.json import json_settings
+
+
+@dataclass
+class Cat:
+    id: UUID
+    name: str
+    born_at: datetime
+
+
+CAT = Cat(UUID("8a1b4d11-63d6-4b4c-8c3e-6b5e4e1c8f43"), "Celine", datetime(2020, 1, 1))
+
+
+@pytest.fixture(autouse=True)
+def default_json_settings():
+    yield
+    json_settings.use()
+
+
+def get_json_request(body: bytes, content_type=b"application/json") -> Request:
+    return Request("POST", b"/", []).with_content(Content(content_type, body))
+
+
+def test_default_dumps_bytes():
+    assert json_settings.dumps_bytes({"name": "Café"}) == '{"name":"Café"}'.encode()
+    assert json.loads(json_settings.dumps_bytes(CAT)) == {
+        "id": "8a1b4d11-63d6-4b4c-8c3e-6b5e4e1c8f43",
+        "name": "Celine",
+        "born_at": "2020-01-01T00:00:00",
+    }
+
+
+def test_default_loads_bytes():
+    assert json_settings.loads_bytes('{"name":"Café"}'.encode()) == {"name": "Café"}
+
+
+def test_bytes_functions_are_obtained_from_custom_str_functions():
+    calls = []
+
+    def custom_loads(value):
+        calls.append(value)
+        return json.loads(value)
+
+    def custom_dumps(value):
+        calls.append(value)
+        return json.dumps(value)
+
+    json_settings.use(loads=custom_loads, dumps=custom_dumps)
+
+    assert json_settings.loads_bytes(b'{"a": 1}') == {"a": 1}
+    assert json_settings.dumps_bytes({"a": 1}) == b'{"a": 1}'
+    assert calls == ['{"a": 1}', {"a": 1}]
+
+
+def test_custom_bytes_functions():
+    json_settings.use(loads_bytes=lambda data: "loaded", dumps_bytes=lambda obj: b"1")
+
+    assert json_settings.loads_bytes(b"{}") == "loaded"
+    assert JSONContent({}).body == b"1"
+    assert json_response({}).content.body == b"1"
+
+
+def test_json_content_with_dumps():
+    content = JSONContent({"a": 1}, dumps=lambda obj: "custom")
+
+    assert content.body == b"custom"
+
+
+async def test_request_json_parses_bytes():
+    received = []
+
+    def loads_bytes(data):
+        received.append(data)
+        return json.loads(data)
+
+    json_settings.use(loads_bytes=loads_bytes)
+
+    request = get_json_request('{"name": "Café"}'.encode())
+
+    assert await request.json() == {"name": "Café"}
+    assert received == ['{"name": "Café"}'.encode()]
+
+
+async def test_request_json_decodes_declared_charset():
+    received = []
+
+    def loads_bytes(data):
+        received.append(data)
+        return json.loads(data)
+
+    json_settings.use(loads_bytes=loads_bytes)
+
+    request = get_json_request(
+        '{"name": "Café"}'.encode("ISO-8859-1"),
+        b"application/json; charset=ISO-8859-1",
+    )
+
+    assert await request.json() == {"name": "Café"}
+    assert received == []
+
+
+async def test_request_json_with_loads():
+    request = get_json_request(b'{"name": "Celine"}')
+
+    assert await request.json(loads=lambda text: text) == '{"name": "Celine"}'
+
+
+async def test_request_json_invalid():
+    request = get_json_request(b'{"name": ')
+
+    with pytest.raises(BadRequestFormat):
+        await request.json()
+
+
+@pytest.mark.parametrize("engine", ["orjson", "msgspec"])
+async def test_json_engines(engine):
+    pytest.importorskip(engine)
+    getattr(json_settings, f"use_{engine}")()
+
+    data = json.loads(json_settings.dumps_bytes(CAT))
+    assert data == {
+        "id": "8a1b4d11-63d6-4b4c-8c3e-6b5e4e1c8f43",
+        "name": "Celine",
+        "born_at": "2020-01-01T00:00:00",
+    }
+    assert json.loads(json_settings.dumps(CAT)) == data
+    assert json.loads(json_settings.pretty_dumps(CAT)) == data
+    assert json.loads(json_settings.dumps_bytes({1: b"Hello"})) == {"1": "SGVsbG8="}
+    assert json_settings.loads_bytes('{"name": "Café"}'.encode()) == {"name": "Café"}
+    assert json_settings.loads('{"name": "Café"}') == {"name": "Café"}
+
+    assert await get_json_request(b'{"a": [1, 2]}').json() == {"a": [1, 2]}
+
+    with pytest.raises(BadRequestFormat):
+        await get_json_request(b'{"name": ').json()
@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import TypeVar
+
+import pytest
+
+from blacksheep import Request
+from blacksheep.contents import ASGIContent
+from blacksheep.exceptions import PayloadTooLarge
+from blacksheep.server.bindings import FromJSON, FromText
+from blacksheep.server.limits import max_body_size
+from blacksheep.testing.helpers import get_example_scope
+from blacksheep.testing.messages import MockReceive, MockSend
+from tests.utils.application import FakeApplication
+
+T = TypeVar("T")
+
+
+@dataclass
+class Item:
+    name: str
+
+
+class SmallJSON(FromJSON[T]):
+    max_body_size = 20
+
+
+class SmallText(FromText):
+    max_body_size = 5
+
+
+async def call_app(app, chunks, content_length=None) -> int:
+    headers = [(b"content-type", b"application/json")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    await app(
+        get_example_scope("POST", "/", headers),
+        MockReceive(list(chunks)),
+        MockSend(),
+    )
+    assert app.response is not None
+    return app.response.status
+
+
+async def test_asgi_content_read_raises_when_exceeding_max_size():
+    content = ASGIContent(MockReceive([b"a" * 10, b"b" * 10, b"c" * 10]), 25)
+
+    with pytest.raises(PayloadTooLarge):
+        await content.read()
+
+
+async def test_asgi_content_stream_raises_when_exceeding_max_size():
+    content = ASGIContent(MockReceive([b"a" * 10, b"b" * 10, b"c" * 10]), 25)
+    chunks = []
+
+    with pytest.raises(PayloadTooLarge):
+        async for chunk in content.stream():
+            chunks.append(chunk)
+
+    assert chunks == [b"a" * 10, b"b" * 10]
+
+
+async def test_asgi_content_within_max_size():
+    content = ASGIContent(MockReceive([b"a" * 10, b"b" * 10]), 20)
+
+    assert await content.read() == b"a" * 10 + b"b" * 10
+
+
+async def test_application_max_body_size():
+    app = FakeApplication(max_body_size=10)
+
+    @app.router.post("/")
+    async def home(request: Request):
+        return await request.read()
+
+    assert await call_app(app, [b"0123456789"]) == 200
+    assert await call_app(app, [b"0123456789", b"0"]) == 413
+
+
+async def test_application_max_body_size_rejects_content_length_early():
+    app = FakeApplication(max_body_size=10)
+    receive = MockReceive([b"0123456789" * 10])
+    called = False
+
+    @app.router.post("/")
+    async def home(request: Request):
+        nonlocal called
+        called = True
+
+    await app(
+        get_example_scope("POST", "/", [(b"content-length", b"100")]),
+        receive,
+        MockSend(),
+    )
+
+    assert app.response.status == 413
+    assert called is False
+    assert receive.index == 0
+
+
+async def test_max_body_size_decorator_overrides_application_limit():
+    app = FakeApplication(max_body_size=10)
+
+    @app.router.post("/")
+    @max_body_size(100)
+    async def home(request: Request):
+        return await request.read()
+
+    assert await call_app(app, [b"0123456789"] * 5, 50) == 200
+    assert await call_app(app, [b"0123456789"] * 11) == 413
+    assert await call_app(app, [], 200) == 413
+
+
+async def test_max_body_size_decorator_removes_limit():
+    app = FakeApplication(max_body_size=10)
+
+    @app.router.post("/")
+    @max_body_size(None)
+    async def home(request: Request):
+        return await request.read()
+
+    assert await call_app(app, [b"0123456789"] * 5, 50) == 200
+
+
+async def test_max_body_size_decorator_without_application_limit(app):
+    @app.router.post("/")
+    @max_body_size(10)
+    async def home(request: Request):
+        return await request.read()
+
+    assert await call_app(app, [b"0123456789"] * 2) == 413
+
+
+def test_max_body_size_decorator_validates_value():
+    with pytest.raises(ValueError):
+        max_body_size(-1)
+
+
+async def test_body_binder_max_body_size(app):
+    @app.router.post("/")
+    async def home(item: SmallJSON[Item]):
+        return item.value.name
+
+    assert await call_app(app, [b'{"name": "Hello"}']) == 200
+    assert await call_app(app, [b'{"name": "Hello, World"}']) == 413
+    assert await call_app(app, [b'{"name": "Hello"}'], 1000) == 413
+
+
+async def test_text_binder_max_body_size(app):
+    @app.router.post("/")
+    async def home(text: SmallText):
+        return text.value
+
+    assert await call_app(app, [b"Hello"]) == 200
+    assert await call_app(app, [b"Hello", b"World"]) == 413
@@ -11,6 +11,12 @@ from blacksheep.multipart import (
     parse_multipart_async,
     parse_part,
 )
+from blacksheep.multipartparser import (
+    PART_BEGIN,
+    PART_DATA,
+    PART_END,
+    MultipartParser,
+)
 
 from .examples.multipart import (
     FIELDS_THREE_VALUES,
@@ -162,6 +168,94 @@ async def test_parse_multipart_async():
     assert parts[1] == ("b", b"9000")
 
 
+def _parse_in_chunks(value: bytes, boundary: bytes, chunk_size: int):
+    parser = MultipartParser(boundary)
+    events = []
+    for index in range(0, len(value), chunk_size):
+        events.extend(parser.feed(value[index : index + chunk_size]))
+    events.extend(parser.close())
+
+    parts = []
+    for event, event_value in events:
+        if event == PART_BEGIN:
+            parts.append([event_value, b""])
+        elif event == PART_DATA:
+            parts[-1][1] += event_value
+        else:
+            assert event == PART_END
+    return [tuple(part) for part in parts], parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 1000])
+def test_multipart_parser_chunks(chunk_size):
+    value = (
+        b"preamble\r\n--xyz\r\n"
+        b'Content-Disposition: form-data; name="a"\r\n\r\n'
+        b"Hello\r\n-- World --xy\r\n"
+        b"--xyz\r\n"
+        b'Content-Disposition: form-data; name="b"\r\n\r\n'
+        b"\r\n"
+        b"--xyz--\r\n"
+        b"epilogue"
+    )
+
+    parts, parser = _parse_in_chunks(value, b"xyz", chunk_size)
+
+    assert parts == [
+        (b'Content-Disposition: form-data; name="a"', b"Hello\r\n-- World --xy"),
+        (b'Content-Disposition: form-data; name="b"', b""),
+    ]
+    assert parser.complete is True
+
+
+def test_multipart_parser_missing_closing_boundary():
+    parts, parser = _parse_in_chunks(
+        b'--xyz\r\nContent-Disposition: form-data; name="a"\r\n\r\nHello\r\n',
+        b"xyz",
+        4,
+    )
+
+    assert parts == [(b'Content-Disposition: form-data; name="a"', b"Hello")]
+
+
+def test_multipart_parser_ignores_data_after_end():
+    parser = MultipartParser(b"xyz")
+
+    assert parser.feed(b"--xyz--\r\n") == []
+    assert parser.complete is True
+    assert parser.feed(b"--xyz\r\nA: b\r\n\r\nc") == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+async def test_parse_multipart_async_chunks(chunk_size):
+    picture = bytes(range(256)) * 100
+    data = MultiPartFormData(
+        [
+            FormPart(b"_charset_", b"iso-8859-1"),
+            FormPart(b"a", "Hünd".encode("iso-8859-1")),
+            FormPart(b"skipped", b"x" * 10000),
+            FormPart(b"picture", picture, b"image/png", b"example.png"),
+        ]
+    )
+    body = b""
+    async for chunk in data.stream():
+        body += chunk
+
+    async def stream():
+        for index in range(0, len(body), chunk_size):
+            yield body[index : index + chunk_size]
+
+    parts = {}
+    async for part in parse_multipart_async(stream(), data.boundary):
+        if part.name != "skipped":
+            parts[part.name] = (part.charset, part.file_name, await part.read())
+
+    assert parts == {
+        "a": ("iso-8859-1", None, "Hünd".encode("iso-8859-1")),
+        "picture": ("iso-8859-1", "example.png", picture),
+    }
+
+
 async def test_multipart_write_1():
     file = BytesIO()
     file.write(b"Hello, World!")
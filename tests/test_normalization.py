@@ -12,6 +12,7 @@ from blacksheep import Request
 from blacksheep.server.bindings import (
     Binder,
     BoundValue,
+    ControllerBinder,
     ExactBinder,
     FromHeader,
     FromJSON,
@@ -28,6 +29,7 @@ from blacksheep.server.bindings import (
 )
 from blacksheep.server.normalization import (
     AmbiguousMethodSignatureError,
+    BindingPlan,
     NormalizationError,
     RouteBinderMismatch,
     UnsupportedSignatureError,
@@ -254,6 +256,75 @@ def test_combination_of_sources():
     assert binders[4].parameter_name == "e"
 
 
+async def test_binding_plan_reads_sync_values_without_awaiting():
+    def handler(
+        a: FromQuery[list[str]],
+        b: FromServices[Dog],
+        c: FromJSON[Cat],
+        d: FromRoute[str],
+        e: FromHeader[str],
+    ): ...
+
+    container = Container()
+    container.register(Dog, instance=Dog("Snoopy"))
+    plan = BindingPlan(get_binders(Route(b"/:d", handler), container))
+
+    assert plan.is_sync is False
+    assert [index for index, _ in plan.sync_getters] == [0, 1, 3, 4]
+    assert [index for index, _ in plan.async_getters] == [2]
+
+    request = Request(
+        "POST",
+        b"/Hello?a=1&a=2",
+        [(b"e", b"World"), (b"content-type", b"application/json")],
+    ).with_content(JSONContent({"name": "Celine"}))
+    request.route_values = {"d": "Hello"}
+
+    a, b, c, d, e = await plan.bind(request)
+    assert a.value == ["1", "2"]
+    assert b.value.name == "Snoopy"
+    assert c.value.name == "Celine"
+    assert d.value == "Hello"
+    assert e.value == "World"
+
+
+def test_binding_plan_sync():
+    def handler(a: int, b: str = "default"): ...
+
+    plan = BindingPlan(get_binders(Route(b"/", handler), Container()))
+
+    assert plan.is_sync is True
+    assert plan.bind_sync(Request("GET", b"/?a=10", [])) == [10, "default"]
+
+
+class AsyncQueryValue(BoundValue[str]): ...
+
+
+class CustomQueryValue(BoundValue[str]): ...
+
+
+class AsyncQueryBinder(QueryBinder):
+    handle = AsyncQueryValue
+
+    async def get_value(self, request):
+        return "Hello"
+
+
+class CustomQueryBinder(QueryBinder):
+    handle = CustomQueryValue
+
+    def get_value_sync(self, request):
+        return "Hello"
+
+
+def test_binders_overriding_get_value_are_not_sync():
+    assert QueryBinder(str, "a").is_sync is True
+    assert AsyncQueryBinder(str, "a").is_sync is False
+    assert CustomQueryBinder(str, "a").is_sync is True
+    assert JSONBinder(Cat).is_sync is False
+    assert ControllerBinder(Dog).is_sync is False
+
+
 def test_implicit_from_services_only_when_annotation_is_none():
     def handler(dog): ...
 
@@ -0,0 +1,257 @@
+import asyncio
+
+import pytest
+from guardpost import Identity
+
+from blacksheep import Response
+from blacksheep.server.outputcache import (
+    CachedResponse,
+    InMemoryOutputCacheStore,
+    OutputCacheMiddleware,
+    OutputCachePolicy,
+    OutputCacheStore,
+    no_output_cache,
+    output_cache,
+    use_output_cache,
+)
+from blacksheep.server.responses import json
+from blacksheep.testing.helpers import get_example_scope
+from blacksheep.testing.messages import MockReceive, MockSend
+
+
+async def call_app(app, method: str, path: str, extra_headers=None) -> bytes:
+    mock_send = MockSend()
+    await app(
+        get_example_scope(method, path, extra_headers),
+        MockReceive([]),
+        mock_send,
+    )
+    return b"".join(
+        message.get("body", b"")
+        for message in mock_send.messages
+        if message["type"] == "http.response.body"
+    )
+
+
+async def test_output_cache_decorator(app):
+    calls = []
+
+    @app.router.get("/products")
+    @output_cache(60)
+    async def get_products():
+        calls.append(1)
+        response = json([{"id": len(calls)}])
+        response.add_header(b"x-foo", b"foo")
+        return response
+
+    use_output_cache(app)
+    await app.start()
+
+    for _ in range(3):
+        body = await call_app(app, "GET", "/products")
+        assert body == b'[{"id":1}]'
+        assert app.response.status == 200
+        assert app.response.content.type == b"application/json"
+        assert app.response.get_first_header(b"x-foo") == b"foo"
+
+    assert len(calls) == 1
+
+
+async def test_output_cache_is_not_used_for_handlers_not_decorated(app):
+    calls = []
+
+    @app.router.get("/")
+    async def home():
+        calls.append(1)
+        return f"Hello, {len(calls)}"
+
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "GET", "/") == b"Hello, 1"
+    assert await call_app(app, "GET", "/") == b"Hello, 2"
+
+
+async def test_output_cache_global_policy(app):
+    calls = []
+
+    @app.router.get("/")
+    async def home():
+        calls.append(1)
+        return f"Hello, {len(calls)}"
+
+    @app.router.get("/not-cached")
+    @no_output_cache()
+    async def not_cached():
+        calls.append(1)
+        return f"Hello, {len(calls)}"
+
+    use_output_cache(app, OutputCacheMiddleware(policy=OutputCachePolicy(60)))
+    await app.start()
+
+    assert await call_app(app, "GET", "/") == b"Hello, 1"
+    assert await call_app(app, "GET", "/") == b"Hello, 1"
+    assert await call_app(app, "GET", "/not-cached") == b"Hello, 2"
+    assert await call_app(app, "GET", "/not-cached") == b"Hello, 3"
+
+
+async def test_output_cache_vary_by_query(app):
+    @app.router.get("/")
+    @output_cache(60, vary_by_query=["page"])
+    async def home(request):
+        return request.url.value.decode()
+
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "GET", "/?page=1&foo=1") == b"/?page=1&foo=1"
+    assert await call_app(app, "GET", "/?foo=2&page=1") == b"/?page=1&foo=1"
+    assert await call_app(app, "GET", "/?page=2") == b"/?page=2"
+
+
+async def test_output_cache_vary_by_headers(app):
+    @app.router.get("/")
+    @output_cache(60, vary_by_headers=["X-Tenant"])
+    async def home(request):
+        return request.get_first_header(b"x-tenant").decode()
+
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "GET", "/", [(b"X-Tenant", b"it")]) == b"it"
+    assert await call_app(app, "GET", "/", [(b"X-Tenant", b"it")]) == b"it"
+    assert await call_app(app, "GET", "/", [(b"X-Tenant", b"en")]) == b"en"
+
+
+@pytest.mark.parametrize("vary_by_user", [False, True])
+async def test_output_cache_authenticated_users(app, vary_by_user):
+    calls = []
+
+    class MockAuthHandler:
+        async def authenticate(self, context):
+            name = context.get_first_header(b"x-user")
+            if name:
+                context.user = Identity({"sub": name.decode()}, "test")
+            return context.user
+
+    @app.router.get("/")
+    @output_cache(60, vary_by_user=vary_by_user)
+    async def home(request):
+        calls.append(1)
+        return f"{request.user.sub}, {len(calls)}"
+
+    app.use_authentication().add(MockAuthHandler())
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "GET", "/") == b"None, 1"
+    assert await call_app(app, "GET", "/") == b"None, 1"
+
+    bob = [(b"x-user", b"bob")]
+    alice = [(b"x-user", b"alice")]
+
+    if vary_by_user:
+        assert await call_app(app, "GET", "/", bob) == b"bob, 2"
+        assert await call_app(app, "GET", "/", bob) == b"bob, 2"
+        assert await call_app(app, "GET", "/", alice) == b"alice, 3"
+    else:
+        # responses for authenticated users are not stored by default
+        assert await call_app(app, "GET", "/", bob) == b"bob, 2"
+        assert await call_app(app, "GET", "/", bob) == b"bob, 3"
+
+
+async def test_output_cache_evict_by_tag(app):
+    calls = []
+
+    @app.router.get("/products")
+    @output_cache(60, tags=["products"])
+    async def get_products():
+        calls.append(1)
+        return f"Products {len(calls)}"
+
+    @app.router.post("/products")
+    async def create_product(store: OutputCacheStore):
+        await store.evict_by_tag("products")
+        return Response(201)
+
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "GET", "/products") == b"Products 1"
+    assert await call_app(app, "GET", "/products") == b"Products 1"
+    await call_app(app, "POST", "/products")
+    assert app.response.status == 201
+    assert await call_app(app, "GET", "/products") == b"Products 2"
+
+
+async def test_output_cache_coalesces_concurrent_requests(app):
+    calls = []
+
+    @app.router.get("/")
+    @output_cache(60)
+    async def home():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return f"Hello, {len(calls)}"
+
+    use_output_cache(app)
+    await app.start()
+
+    results = await asyncio.gather(*[call_app(app, "GET", "/") for _ in range(10)])
+
+    assert results == [b"Hello, 1"] * 10
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        Response(404),
+        Response(200, [(b"Set-Cookie", b"foo=foo")]),
+        Response(200, [(b"Cache-Control", b"no-store")]),
+    ],
+)
+def test_output_cache_policy_can_store(response):
+    assert OutputCachePolicy().can_store(response) is False
+
+
+async def test_output_cache_does_not_store_unsafe_methods(app):
+    calls = []
+
+    @app.router.post("/")
+    @output_cache(60)
+    async def home():
+        calls.append(1)
+        return f"Hello, {len(calls)}"
+
+    use_output_cache(app)
+    await app.start()
+
+    assert await call_app(app, "POST", "/") == b"Hello, 1"
+    assert await call_app(app, "POST", "/") == b"Hello, 2"
+
+
+async def test_in_memory_output_cache_store():
+    store = InMemoryOutputCacheStore(max_entries=2)
+
+    def item(expires_at=float("inf"), tags=()):
+        return CachedResponse(200, [], b"text/plain", b"Hello", expires_at, tags)
+
+    await store.set("a", item(tags=["x"]), 60)
+    await store.set("b", item(tags=["x", "y"]), 60)
+    assert await store.get("a") is not None
+
+    await store.set("c", item(tags=["y"]), 60)
+    assert len(store) == 2
+    assert "b" not in store
+
+    await store.evict_by_tag("y")
+    assert len(store) == 1
+    assert "a" in store
+
+    await store.set("d", item(expires_at=0), 60)
+    assert await store.get("d") is None
+    assert "d" not in store
+
+    await store.remove("a")
+    assert len(store) == 0
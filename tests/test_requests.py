@@ -1,5 +1,6 @@
 import pytest
 
+import blacksheep.messages as messages_module
 from blacksheep import Content, Request
 from blacksheep.contents import FormPart, MultiPartFormData
 from blacksheep.exceptions import BadRequestFormat
@@ -47,6 +48,43 @@ def test_parse_query(url, query, parsed_query):
     assert request.query == parsed_query
 
 
+def test_query_is_parsed_once(monkeypatch):
+    calls = []
+    parse_qs = messages_module.parse_qs
+
+    def counting_parse_qs(value):
+        calls.append(value)
+        return parse_qs(value)
+
+    monkeypatch.setattr(messages_module, "parse_qs", counting_parse_qs)
+    request = Request("GET", b"/?hello=world&foo=power", None)
+
+    query = request.query
+    assert query == {"hello": ["world"], "foo": ["power"]}
+    assert request.query == query
+    assert len(calls) == 1
+
+    # the parsed query is shared: callers receive a copy
+    query["hello"].append("other")
+    query["ufo"] = ["power"]
+    assert request.query == {"hello": ["world"], "foo": ["power"]}
+
+    # values can be read from the cache without copying the query
+    assert request.get_query_values("hello") == ["world"]
+    assert request.get_query_values("hello") is request.get_query_values("hello")
+    assert request.get_query_values("missing") is None
+    assert len(calls) == 1
+
+    request.query = {"ufo": ["power"]}
+    assert request.query == {"ufo": ["power"]}
+
+    request.url = b"/?a=1"
+    assert request.query == {"a": ["1"]}
+
+    request._raw_query = b"b=2"
+    assert request.query == {"b": ["2"]}
+
+
 async def test_can_read_json_data_even_without_content_type_header():
     request = Request("POST", b"/", None)
 
@@ -88,6 +126,32 @@ def test_cookie_parsing():
     }
 
 
+def test_cookies_are_parsed_once():
+    request = Request("GET", b"/", [])
+    request.set_cookie("foo", "Hello World")
+
+    cookies = request.cookies
+    assert cookies == {"foo": "Hello World"}
+
+    # the parsed cookies are shared: callers receive a copy
+    cookies["foo"] = "changed"
+    assert request.cookies == {"foo": "Hello World"}
+    assert request.get_cookie("foo") == "Hello World"
+
+    request.add_header(b"cookie", b"ai=something; hello=world")
+    assert request.cookies == {
+        "foo": "Hello World",
+        "ai": "something",
+        "hello": "world",
+    }
+
+    request.set_header(b"cookie", b"jib=jab")
+    assert request.cookies == {"jib": "jab"}
+
+    request.remove_header(b"cookie")
+    assert request.cookies == {}
+
+
 def test_cookie_parsing_multiple_cookie_headers():
     request = Request(
         "POST",
@@ -476,3 +540,48 @@ def test_scope_root_path():
 def test_request_charset(content_type_header, expected_charset):
     request = Request("POST", b"/", [(b"Content-Type", content_type_header.encode())])
     assert request.charset == expected_charset
+
+
+def _get_request_with_many_headers() -> Request:
+    headers = [
+        (f"X-Header-{index}".encode(), str(index).encode()) for index in range(10)
+    ]
+    return Request("GET", b"/", headers + [(b"Accept", b"text/html")])
+
+
+def test_headers_lookups_with_many_headers():
+    request = _get_request_with_many_headers()
+
+    assert request.get_first_header(b"accept") == b"text/html"
+    assert request.get_first_header(b"X-HEADER-3") == b"3"
+    assert request.get_first_header(b"x-missing") is None
+    assert request.has_header(b"x-header-9")
+    assert not request.has_header(b"x-missing")
+
+    request.add_header(b"Accept", b"application/json")
+    assert request.get_headers(b"accept") == [b"text/html", b"application/json"]
+
+    request.set_header(b"x-header-0", b"zero")
+    assert request.get_headers(b"x-header-0") == [b"zero"]
+    assert request.get_first_header(b"x-header-1") == b"1"
+
+    request.remove_header(b"accept")
+    assert request.get_headers(b"accept") == []
+    assert request.get_first_header(b"x-header-9") == b"9"
+
+    request.set_cookie("foo", "bar")
+    assert request.get_first_header(b"cookie") == b"foo=bar"
+    assert request.cookies == {"foo": "bar"}
+
+
+def test_headers_lookups_detect_changes_to_headers():
+    request = _get_request_with_many_headers()
+    assert request.get_first_header(b"x-header-5") == b"5"
+
+    request.headers.add(b"X-Foo", b"foo")
+    assert request.get_first_header(b"x-foo") == b"foo"
+
+    del request.headers[b"x-header-5"]
+    assert request.get_first_header(b"x-header-5") is None
+    assert request.get_first_header(b"x-header-6") == b"6"
+    assert request.get_first_header(b"accept") == b"text/html"
@@ -1,3 +1,4 @@
+import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime
@@ -542,6 +543,30 @@ async def test_file_response_from_fs(app):
         assert contents == text
 
 
+async def test_file_response_from_fs_uses_asgi_pathsend(app):
+    file_path = get_file_path("example.config", "files2")
+
+    @app.router.get("/")
+    async def home():
+        return file(file_path, "text/plain; charset=utf-8")
+
+    scope = get_example_scope("GET", "/", [])
+    scope["extensions"] = {"http.response.pathsend": {}}
+    mock_send = MockSend()
+    await app(scope, MockReceive(), mock_send)
+
+    start, pathsend = mock_send.messages
+    assert start["status"] == 200
+    # the length of the file is determined before sending the response
+    assert (b"content-length", str(os.path.getsize(file_path)).encode()) in start[
+        "headers"
+    ]
+    assert pathsend == {
+        "type": "http.response.pathsend",
+        "path": os.path.abspath(file_path),
+    }
+
+
 async def test_file_response_from_fs_with_filename(app):
     file_path = get_file_path("example.config", "files2")
 
@@ -1,3 +1,6 @@
+import gc
+import weakref
+
 import pytest
 
 from blacksheep.messages import Request
@@ -6,13 +9,16 @@ from blacksheep.server.routing import (
     HostFilter,
     InvalidValuePatternName,
     MountRegistry,
+    RegexRoutesMatcher,
     Route,
     RouteDuplicate,
     RouteException,
     RouteFilter,
+    RouteMatchCache,
     RouteMethod,
     RouteNotFound,
     Router,
+    TrieRoutesMatcher,
     normalize_filters,
 )
 from tests.utils import modified_env
@@ -1223,3 +1229,284 @@ def test_route_not_found_exception_has_name():
     exc = RouteNotFound("my_route")
     assert exc.name == "my_route"
     assert "my_route" in str(exc)
+
+
+MATCHERS_PATTERNS = [
+    "/",
+    "/about",
+    "/About/Team",
+    "/api/cats",
+    "/api/cats/:cat_id",
+    "/api/cats/{int:cat_id}/friends",
+    "/api/cats/{uuid:cat_id}/friends",
+    "/api/cats/<cat_id>/friends/<friend_id>",
+    "/api/cats/{cat_id}/photos/{float:ratio}",
+    "/api/dogs/{dog_id}",
+    "/api/{resource}/summary",
+    "/api/orders/{order_id}",
+    "/api/orders/pending",
+    "/api/files/{name}.json",
+    "/api/v1/*",
+    "/static/{path:file}",
+    "/a/*.js",
+    "/b/*",
+    "/{section}",
+    "/{section}/{page}",
+    "*",
+]
+
+MATCHERS_PATHS = [
+    b"",
+    b"/",
+    b"//",
+    b"/about",
+    b"/ABOUT/",
+    b"/about/team",
+    b"/about//",
+    b"/api/cats",
+    b"/api/cats/",
+    b"/api/cats/22",
+    b"/api/cats/22/friends",
+    b"/api/cats/52464abf-f583-4b32-80f8-704bcb9e36a2/friends",
+    b"/api/cats/kitty/friends",
+    b"/api/cats/kitty/friends/tom",
+    b"/api/cats/kitty/photos/1.5",
+    b"/api/cats/kitty/photos/1.5.5",
+    b"/api/dogs/fido",
+    b"/api/dogs/summary",
+    b"/api/orders/pending",
+    b"/api/orders/Pending/",
+    b"/api/orders/101",
+    b"/api/files/report.json",
+    b"/api/files/report.xml",
+    b"/api/v1",
+    b"/api/v1/",
+    b"/api/v1/cats/22",
+    b"/api/v1cats",
+    b"/static/",
+    b"/static/js/app.js",
+    b"/a/scripts/app.js",
+    b"/ab.js",
+    b"/b",
+    b"/bcd/e",
+    b"/docs/intro/more",
+    b"/docs/intro%20page",
+    b"/docs//",
+]
+
+
+def _get_router_with_routes(matcher=None) -> Router:
+    router = Router(matcher=matcher)
+
+    for pattern in MATCHERS_PATTERNS:
+        router.add_get(pattern, mock_handler)
+
+    router.apply_routes()
+    router.sort_routes()
+    return router
+
+
+@pytest.mark.parametrize("matcher", [TrieRoutesMatcher, RegexRoutesMatcher])
+@pytest.mark.parametrize("path", MATCHERS_PATHS)
+def test_routes_matcher_matches_like_linear_scan(matcher, path):
+    router = _get_router_with_routes()
+    trie_router = _get_router_with_routes(matcher)
+
+    expected = router.get_matching_route("GET", path)
+    route = trie_router.get_matching_route("GET", path)
+
+    assert (route.pattern if route else None) == (
+        expected.pattern if expected else None
+    )
+
+    expected_match = router.get_match_by_method_and_path("GET", path)
+    match = trie_router.get_match_by_method_and_path("GET", path)
+
+    assert (match is None) is (expected_match is None)
+    if match is not None:
+        assert match.pattern == expected_match.pattern
+        assert match.values == expected_match.values
+
+
+@pytest.mark.parametrize("matcher", [TrieRoutesMatcher, RegexRoutesMatcher])
+@pytest.mark.parametrize("method,pattern,url", MATCHING_ROUTES)
+def test_routes_matcher_matching_routes(matcher, method, pattern, url):
+    router = Router(matcher=matcher)
+    router.add(method, pattern, mock_handler)
+    router.apply_routes()
+
+    match = router.get_match_by_method_and_path(method, url)
+    assert match is not None
+    assert match.handler is mock_handler
+    assert router.get_matching_route(method, url) is not None
+    assert router.get_match_by_method_and_path(FAKE, url) is None
+
+
+@pytest.mark.parametrize("matcher", [TrieRoutesMatcher, RegexRoutesMatcher])
+@pytest.mark.parametrize("method,pattern,url", NON_MATCHING_ROUTE)
+def test_routes_matcher_not_matching_routes(matcher, method, pattern, url):
+    router = Router(matcher=matcher)
+    router.add(method, pattern, mock_handler)
+    router.apply_routes()
+
+    assert router.get_match_by_method_and_path(method, url) is None
+
+
+@pytest.mark.parametrize("matcher", [TrieRoutesMatcher, RegexRoutesMatcher])
+def test_routes_matcher_respects_routes_order(matcher):
+    router = Router(matcher=matcher)
+
+    def a(): ...
+
+    def b(): ...
+
+    router.add_get("/{section}/bar", a)
+    router.add_get("/foo/{page}", b)
+    router.apply_routes()
+    router.sort_routes()
+
+    match = router.get_match_by_method_and_path("GET", b"/foo/bar")
+    assert match is not None
+    assert match.handler is a
+    assert match.values == {"section": "foo"}
+
+
+@pytest.mark.parametrize("matcher", [TrieRoutesMatcher, RegexRoutesMatcher])
+def test_routes_matcher_is_updated_when_routes_change(matcher):
+    router = Router(matcher=matcher)
+
+    def a(): ...
+
+    route = Route("/cats/{int:cat_id}", a)
+    router.add_route("GET", route)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is not None
+
+    router.remove("GET", route)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is None
+
+    router.fallback = a
+    match = router.get_match_by_method_and_path("GET", b"/cats/1")
+    assert match is not None
+    assert match.pattern == b"*"
+
+
+def test_router_match_cache_hits_and_misses():
+    router = Router()
+
+    def a(): ...
+
+    def b(): ...
+
+    router.add_get("/about", a)
+    router.add_get("/orders/{int:order_id}", b)
+    router.apply_routes()
+
+    for _ in range(3):
+        match = router.get_match_by_method_and_path("GET", b"/about")
+        assert match is not None
+        assert match.handler is a
+
+    assert router.match_cache.misses == 1
+    assert router.match_cache.hits == 2
+
+    match = router.get_match_by_method_and_path("GET", b"/orders/10")
+    assert match is not None
+    assert match.values == {"order_id": "10"}
+    assert router.get_matching_route("GET", b"/orders/10") is not None
+    assert router.match_cache.misses == 2
+    assert router.match_cache.hits == 3
+
+
+def test_router_match_cache_does_not_evict_static_routes():
+    router = Router(cache_size=10)
+
+    def a(): ...
+
+    def b(): ...
+
+    router.add_get("/about", a)
+    router.add_get("/orders/{int:order_id}", b)
+    router.apply_routes()
+
+    router.get_match_by_method_and_path("GET", b"/about")
+
+    for i in range(100):
+        router.get_match_by_method_and_path("GET", f"/orders/{i}".encode())
+
+    assert len(router.match_cache) == 11
+
+    hits = router.match_cache.hits
+    match = router.get_match_by_method_and_path("GET", b"/about")
+    assert match is not None
+    assert match.handler is a
+    assert router.match_cache.hits == hits + 1
+
+
+@pytest.mark.parametrize("matcher", [None, TrieRoutesMatcher, RegexRoutesMatcher])
+def test_router_match_cache_is_invalidated_when_routes_change(matcher):
+    router = Router(matcher=matcher)
+
+    def a(): ...
+
+    route = Route("/cats/{int:cat_id}", a)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is None
+
+    router.add_route("GET", route)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is not None
+
+    router.remove("GET", route)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is None
+
+    router.add_route("GET", route)
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is not None
+
+    router.reset()
+    assert len(router.match_cache) == 0
+    assert router.get_match_by_method_and_path("GET", b"/cats/1") is None
+
+
+def test_router_match_cache_is_scoped_to_the_router():
+    def a(): ...
+
+    router = Router()
+    router.add_get("/", a)
+    router.apply_routes()
+    assert router.get_match_by_method_and_path("GET", b"/") is not None
+
+    other_router = Router()
+    assert other_router.get_match_by_method_and_path("GET", b"/") is None
+
+    ref = weakref.ref(router)
+    del router
+    gc.collect()
+    assert ref() is None
+
+
+def test_route_match_cache_size_zero_disables_the_lru_cache():
+    cache = RouteMatchCache(0)
+    route = Route("/cats/{int:cat_id}", mock_handler)
+    cache.set(b"GET", b"/cats/1", (route, route.match_by_path(b"/cats/1")))
+
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        RouteMatchCache(-1)
+
+
+def test_regex_matcher_is_compiled_when_routes_are_sorted():
+    router = Router(matcher=RegexRoutesMatcher)
+
+    def a(): ...
+
+    router.add_get("/cats/{int:cat_id}", a)
+    router.add_get("/dogs/{int:cat_id}", a)
+    router.apply_routes()
+    router.sort_routes()
+
+    matcher = router._matchers[b"GET"]
+    assert isinstance(matcher, RegexRoutesMatcher)
+
+    match = router.get_match_by_method_and_path("GET", b"/dogs/2/")
+    assert match is not None
+    assert match.pattern == b"/dogs/{int:cat_id}"
+    assert match.values == {"cat_id": "2"}
@@ -1,7 +1,10 @@
+import asyncio
+
 import pytest
 
-from blacksheep.contents import ServerSentEvent
-from blacksheep.server.sse import ServerSentEventsResponse
+from blacksheep import Request
+from blacksheep.contents import ServerSentEvent, TextServerSentEvent
+from blacksheep.server.sse import HEARTBEAT, EventBroker, ServerSentEventsResponse
 
 
 @pytest.mark.asyncio
@@ -71,3 +74,127 @@ async def test_server_sent_events_response_streams_events_3():
     assert b"id: 2\n" in result
     assert b'data: "world"\n' in result
     assert content.type == b"text/event-stream"
+
+
+async def _take(iterator, count: int) -> list[bytes]:
+    return [await iterator.__anext__() for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_event_broker_publishes_events_to_subscribers():
+    broker = EventBroker(heartbeat_interval=None)
+    first = broker.subscribe().__aiter__()
+    second = broker.subscribe().__aiter__()
+
+    # subscriptions start with the iteration
+    task = asyncio.gather(_take(first, 2), _take(second, 2))
+    await asyncio.sleep(0)
+    assert broker.count() == 2
+
+    assert broker.publish(ServerSentEvent({"id": 1}, id="1")) == 2
+    assert broker.publish(TextServerSentEvent("hello", id="2")) == 2
+    assert broker.publish(TextServerSentEvent("other"), channel="other") == 0
+
+    first_events, second_events = await task
+    assert first_events == [b'id: 1\ndata: {"id":1}\n\n', b"id: 2\ndata: hello\n\n"]
+    # events are serialized once and shared by all subscribers
+    assert first_events[0] is second_events[0]
+
+    await first.aclose()
+    await second.aclose()
+    assert broker.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_event_broker_replays_events_after_last_event_id():
+    broker = EventBroker(buffer_size=3, heartbeat_interval=None)
+
+    for index in range(5):
+        broker.publish(TextServerSentEvent(str(index), id=str(index)))
+
+    assert broker.get_replay("default", None) == []
+    assert broker.get_replay("default", "3") == [b"id: 4\ndata: 4\n\n"]
+    assert broker.get_replay("default", "4") == []
+    # the event is not buffered anymore: all buffered events are replayed
+    assert len(broker.get_replay("default", "0")) == 3
+
+    request = Request("GET", b"/events", [(b"Last-Event-ID", b"2")])
+    response = broker.get_response(request)
+    assert response.content.type == b"text/event-stream"
+
+    iterator = response.content.get_parts().__aiter__()
+    assert await _take(iterator, 2) == [
+        b"id: 3\ndata: 3\n\n",
+        b"id: 4\ndata: 4\n\n",
+    ]
+    broker.publish(TextServerSentEvent("5", id="5"))
+    assert await _take(iterator, 1) == [b"id: 5\ndata: 5\n\n"]
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_event_broker_disconnects_slow_subscribers():
+    broker = EventBroker(max_queue_size=2, heartbeat_interval=None)
+    iterator = broker.subscribe().__aiter__()
+    task = asyncio.ensure_future(_take(iterator, 1))
+    await asyncio.sleep(0)
+
+    for index in range(4):
+        broker.publish(TextServerSentEvent(str(index), id=str(index)))
+
+    assert broker.count() == 0
+    assert broker.dropped_subscribers == 1
+    assert await task == [b"id: 0\ndata: 0\n\n"]
+    # the queued events are sent, then the stream ends
+    assert [data async for data in iterator] == [b"id: 1\ndata: 1\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_event_broker_heartbeat():
+    broker = EventBroker(heartbeat_interval=0.01)
+    first = broker.subscribe().__aiter__()
+    second = broker.subscribe().__aiter__()
+
+    assert await asyncio.gather(_take(first, 1), _take(second, 1)) == [
+        [HEARTBEAT],
+        [HEARTBEAT],
+    ]
+
+    broker.close()
+    assert [data async for data in first] == []
+    assert broker.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_event_broker_removes_unused_channels():
+    broker = EventBroker(buffer_size=0, heartbeat_interval=None)
+
+    for index in range(100):
+        iterator = broker.subscribe(f"channel-{index}").__aiter__()
+        task = asyncio.ensure_future(_take(iterator, 1))
+        await asyncio.sleep(0)
+        broker.publish(TextServerSentEvent("hello"), f"channel-{index}")
+        await task
+        await iterator.aclose()
+
+    assert broker.publish(TextServerSentEvent("hello"), "nobody") == 0
+    assert broker._channels == {}
+
+
+@pytest.mark.asyncio
+async def test_event_broker_removes_expired_channels():
+    broker = EventBroker(heartbeat_interval=None, buffer_ttl=0.01)
+
+    broker.publish(TextServerSentEvent("0", id="0"), "first")
+    assert broker.get_replay("first", "-1") == [b"id: 0\ndata: 0\n\n"]
+
+    await asyncio.sleep(0.02)
+    broker.publish(TextServerSentEvent("1", id="1"), "second")
+
+    assert list(broker._channels) == ["second"]
+    assert broker.get_replay("first", "-1") == []
+
+
+def test_event_broker_validation():
+    with pytest.raises(ValueError):
+        EventBroker(buffer_ttl=-1)
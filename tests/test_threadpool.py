@@ -0,0 +1,190 @@
+import asyncio
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import pytest
+
+from blacksheep import Request
+from blacksheep.exceptions import ServiceUnavailable
+from blacksheep.server.bindings import FromQuery
+from blacksheep.server.controllers import Controller
+from blacksheep.server.routing import RoutesRegistry
+from blacksheep.server.threadpool import SyncHandlersExecutor, run_in_thread_pool
+from blacksheep.testing.helpers import get_example_scope
+from blacksheep.testing.messages import MockReceive, MockSend
+from tests.utils.application import FakeApplication
+
+request_id: ContextVar[str] = ContextVar("request_id", default="")
+
+
+@dataclass
+class Item:
+    name: str
+
+
+async def call_app(app, path="/", query=b"") -> str:
+    await app(get_example_scope("GET", path, query=query), MockReceive(), MockSend())
+    assert app.response is not None
+    assert app.response.status == 200
+    return await app.response.text()
+
+
+async def test_executor_runs_functions_in_threads():
+    executor = SyncHandlersExecutor(max_workers=2)
+    request_id.set("abc")
+
+    def work(value):
+        return value, threading.current_thread().name, request_id.get()
+
+    value, thread_name, context_value = await executor.run(work, 1)
+
+    assert value == 1
+    assert thread_name.startswith("blacksheep")
+    assert context_value == "abc"
+    executor.shutdown()
+
+
+async def test_executor_metrics_and_rejections():
+    executor = SyncHandlersExecutor(max_workers=1, max_queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def work():
+        started.set()
+        release.wait(5)
+        return True
+
+    first = asyncio.ensure_future(executor.run(work))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    second = asyncio.ensure_future(executor.run(work))
+    await asyncio.sleep(0)
+
+    assert executor.active == 1
+    assert executor.queue_depth == 1
+    assert executor.saturation == 2
+
+    with pytest.raises(ServiceUnavailable):
+        await executor.run(work)
+
+    assert executor.rejected == 1
+
+    release.set()
+    assert await first is True
+    assert await second is True
+    assert executor.active == 0
+    assert executor.queue_depth == 0
+    assert executor.saturation == 0
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("max_workers,max_queue_size", [(0, None), (-1, None), (1, -1)])
+def test_executor_validates_parameters(max_workers, max_queue_size):
+    with pytest.raises(ValueError):
+        SyncHandlersExecutor(max_workers, max_queue_size)
+
+
+async def test_application_sync_handlers_executor():
+    app = FakeApplication(sync_handlers_executor=SyncHandlersExecutor(max_workers=2))
+    main_thread = threading.current_thread().name
+
+    @app.router.get("/")
+    def home():
+        return threading.current_thread().name
+
+    @app.router.get("/request")
+    def with_request(request: Request):
+        return threading.current_thread().name
+
+    @app.router.get("/params")
+    def with_params(name: FromQuery[str]):
+        return f"{name.value} {threading.current_thread().name}"
+
+    @app.router.get("/excluded")
+    @run_in_thread_pool(False)
+    def excluded():
+        return threading.current_thread().name
+
+    for path in ("/", "/request"):
+        assert (await call_app(app, path)).startswith("blacksheep")
+
+    name, thread_name = (await call_app(app, "/params", b"name=Foo")).split(" ")
+    assert name == "Foo"
+    assert thread_name.startswith("blacksheep")
+
+    assert await call_app(app, "/excluded") == main_thread
+
+
+async def test_run_in_thread_pool_decorator(app):
+    main_thread = threading.current_thread().name
+
+    @app.router.get("/")
+    @run_in_thread_pool()
+    def home(name: FromQuery[str]):
+        return Item(name.value + " " + threading.current_thread().name)
+
+    @app.router.get("/other")
+    def other():
+        return threading.current_thread().name
+
+    await app(
+        get_example_scope("GET", "/", query=b"name=Foo"), MockReceive(), MockSend()
+    )
+    data = await app.response.json()
+    name, thread_name = data["name"].split(" ")
+    assert name == "Foo"
+    assert thread_name.startswith("blacksheep")
+
+    assert await call_app(app, "/other") == main_thread
+
+
+async def test_default_executor_is_shut_down_on_stop(app):
+    @app.router.get("/")
+    @run_in_thread_pool()
+    def home():
+        return threading.current_thread().name
+
+    await app.start()
+    executor = app._default_sync_handlers_executor
+    assert executor is not None
+    assert (await call_app(app, "/")).startswith("blacksheep")
+
+    await app.stop()
+
+    with pytest.raises(RuntimeError):
+        await executor.run(lambda: None)
+
+
+async def test_configured_executor_is_not_shut_down_on_stop():
+    executor = SyncHandlersExecutor(max_workers=1)
+    app = FakeApplication(sync_handlers_executor=executor)
+
+    @app.router.get("/")
+    def home():
+        return threading.current_thread().name
+
+    await app.start()
+    await app.stop()
+
+    assert await executor.run(lambda: 1) == 1
+    executor.shutdown()
+
+
+async def test_controller_sync_handlers_executor():
+    app = FakeApplication(sync_handlers_executor=SyncHandlersExecutor(max_workers=2))
+    app.controllers_router = RoutesRegistry()
+    get = app.controllers_router.get
+    events = []
+
+    class Home(Controller):
+        async def on_request(self, request: Request):
+            events.append(threading.current_thread().name)
+
+        @get("/")
+        def index(self, name: FromQuery[str]):
+            events.append(threading.current_thread().name)
+            return self.text(name.value)
+
+    assert await call_app(app, "/", b"name=Foo") == "Foo"
+    assert events[0] == threading.current_thread().name
+    assert events[1].startswith("blacksheep")
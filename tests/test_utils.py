@@ -3,6 +3,7 @@ from typing import AnyStr, Sequence
 import pytest
 
 from blacksheep.utils import ensure_bytes, ensure_str, join_fragments
+from blacksheep.utils.lru import LRUCache
 
 
 @pytest.mark.parametrize(
@@ -45,3 +46,33 @@ def test_ensure_bytes_throws_for_invalid_value():
 def test_ensure_str_throws_for_invalid_value():
     with pytest.raises(ValueError):
         ensure_str(True)  # type: ignore
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("b", 0) == 0
+
+    assert cache.pop("a") == 1
+    assert list(cache) == ["c"]
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_cache_size_zero():
+    cache = LRUCache(0)
+    cache.set("a", 1)
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError):
+        LRUCache(-1)
@@ -1,11 +1,15 @@
+import asyncio
+
 import pytest
 
 from blacksheep.server.bindings import FromHeader
 from blacksheep.server.websocket import (
     InvalidWebSocketStateError,
     MessageMode,
+    SlowConsumerPolicy,
     WebSocket,
     WebSocketDisconnectError,
+    WebSocketHub,
     WebSocketState,
     format_reason,
 )
@@ -500,3 +504,145 @@ TOO_LONG_REASON_TRUNC = TOO_LONG_REASON[:40] + "..."
 )
 def test_format_reason(inp, out):
     assert format_reason(inp) == out
+
+
+def _get_connected_websocket(example_scope, send) -> WebSocket:
+    ws = WebSocket(example_scope, MockReceive([]), send)
+    ws.client_state = WebSocketState.CONNECTED
+    ws.application_state = WebSocketState.CONNECTED
+    return ws
+
+
+class SlowSend:
+    def __init__(self):
+        self.messages = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, message):
+        await self.release.wait()
+        self.messages.append(message)
+
+
+async def test_websocket_hub_broadcast(example_scope):
+    hub = WebSocketHub()
+    sends = [MockSend() for _ in range(3)]
+    websockets = [_get_connected_websocket(example_scope, send) for send in sends]
+
+    hub.add(websockets[0], "a")
+    hub.add(websockets[1], "a", "b")
+    hub.add(websockets[2])
+
+    assert len(hub) == 3
+    assert hub.count("a") == 2
+    assert sorted(hub.groups) == ["a", "b"]
+
+    assert hub.broadcast_json({"id": 1}) == 3
+    assert hub.broadcast_text("Hello", "b") == 1
+    assert hub.broadcast_bytes(b"Hello", "c") == 0
+    assert hub.queued_bytes == 3 * len('{"id":1}') + 5
+
+    await asyncio.sleep(0)
+
+    assert hub.queued_bytes == 0
+    assert sends[0].messages == [{"type": "websocket.send", "text": '{"id":1}'}]
+    assert sends[1].messages == [
+        {"type": "websocket.send", "text": '{"id":1}'},
+        {"type": "websocket.send", "text": "Hello"},
+    ]
+    # the message is serialized once and shared by all connections
+    assert sends[0].messages[0] is sends[2].messages[0]
+
+    hub.discard_from_group(websockets[1], "b")
+    assert hub.groups == ["a"]
+
+    hub.remove(websockets[0])
+    assert websockets[0] not in hub
+    assert hub.count("a") == 1
+
+    await hub.close()
+    assert len(hub) == 0
+
+
+async def test_websocket_hub_slow_consumer_does_not_block_others(example_scope):
+    hub = WebSocketHub(max_queue_size=2)
+    slow_send = SlowSend()
+    fast_send = MockSend()
+    slow = _get_connected_websocket(example_scope, slow_send)
+    fast = _get_connected_websocket(example_scope, fast_send)
+    hub.add(slow)
+    hub.add(fast)
+
+    for index in range(4):
+        hub.broadcast_text(str(index))
+        await asyncio.sleep(0)
+
+    assert len(fast_send.messages) == 4
+    # one message is being sent, two are queued, one is dropped
+    assert hub.get_queued_bytes(slow) == 2
+    assert hub.dropped_messages == 1
+
+    slow_send.release.set()
+    await asyncio.sleep(0)
+    assert [message["text"] for message in slow_send.messages] == ["0", "1", "2"]
+    await hub.close()
+
+
+async def test_websocket_hub_coalesce_policy(example_scope):
+    hub = WebSocketHub(
+        max_queue_size=2, slow_consumer_policy=SlowConsumerPolicy.COALESCE
+    )
+    slow_send = SlowSend()
+    slow = _get_connected_websocket(example_scope, slow_send)
+    hub.add(slow)
+
+    for index in range(5):
+        hub.broadcast_text(str(index))
+        await asyncio.sleep(0)
+
+    slow_send.release.set()
+    await asyncio.sleep(0)
+    assert [message["text"] for message in slow_send.messages] == ["0", "3", "4"]
+    await hub.close()
+
+
+async def test_websocket_hub_disconnect_policy(example_scope):
+    hub = WebSocketHub(
+        max_queue_bytes=10, slow_consumer_policy=SlowConsumerPolicy.DISCONNECT
+    )
+    send = MockSend()
+    slow_send = SlowSend()
+    ws = _get_connected_websocket(example_scope, send)
+    slow = _get_connected_websocket(example_scope, slow_send)
+    hub.add(slow)
+    hub.add(ws)
+
+    for _ in range(3):
+        hub.broadcast_bytes(b"x" * 8)
+        await asyncio.sleep(0)
+
+    assert slow not in hub
+    assert ws in hub
+    assert hub.disconnected_slow_consumers == 1
+
+    slow_send.release.set()
+    await asyncio.sleep(0)
+    assert slow_send.messages[-1] == {
+        "type": "websocket.close",
+        "code": 1013,
+        "reason": None,
+    }
+    await hub.close()
+
+
+async def test_websocket_hub_removes_closed_connections(example_scope):
+    hub = WebSocketHub()
+    ws = _get_connected_websocket(example_scope, MockSend())
+    hub.add(ws, "a")
+    ws.client_state = WebSocketState.DISCONNECTED
+
+    hub.broadcast_text("Hello")
+    await asyncio.sleep(0)
+
+    assert len(hub) == 0
+    assert hub.groups == []
+    await hub.close()